@@ -3,23 +3,55 @@ Demo script for audio processing pipeline.
 Shows how to use TTSProcessor, AudioRemixer, and AudioManager.
 """
 
+import io
 import sys
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add app directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
-from audio_processor import TTSProcessor, AudioRemixer, AudioManager, Voice
 from data_models import AudioFile
 
+# Per-thread output buffers so demos running concurrently don't interleave
+_thread_output = threading.local()
+
+
+class _ThreadRoutedStdout:
+    """Stdout proxy that writes to the current thread's buffer when one is set."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+    
+    def write(self, text):
+        buffer = getattr(_thread_output, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _run_buffered(demo):
+    """Run a demo function and return everything it printed."""
+    _thread_output.buffer = io.StringIO()
+    try:
+        demo()
+        return _thread_output.buffer.getvalue()
+    finally:
+        _thread_output.buffer = None
+
 
 def demo_tts_processor():
     """Demonstrate TTSProcessor functionality."""
     print("=== TTS Processor Demo ===")
     
-    # Initialize TTS processor
-    tts = TTSProcessor()
+    from audio_processor import TTSProcessor
+    
+    # Reuse the process-wide TTS processor (warm engine and cache)
+    tts = TTSProcessor.instance()
     
     # Check availability
     availability = {
@@ -54,6 +86,8 @@ def demo_audio_remixer():
     """Demonstrate AudioRemixer functionality."""
     print("=== Audio Remixer Demo ===")
     
+    from audio_processor import AudioRemixer
+    
     remixer = AudioRemixer()
     
     # Create mock audio files for demonstration
@@ -105,6 +139,8 @@ def demo_audio_manager():
     """Demonstrate AudioManager functionality."""
     print("=== Audio Manager Demo ===")
     
+    from audio_processor import AudioManager
+    
     # Initialize with mock API key
     manager = AudioManager(elevenlabs_api_key="demo_key_123")
     
@@ -136,6 +172,18 @@ def demo_audio_manager():
     print(f"  Speech audio: {'✓' if result['speech'] else '✗'}")
     print(f"  Remix audio: {'✓' if result['remix'] else '✗'}")
     
+    # Test streaming pipeline - playback can start on the first chunk
+    print("\nStreaming speech audio...")
+    chunk_count = 0
+    total_bytes = 0
+    for chunk in manager.stream_text_to_audio(test_text, voice_settings):
+        chunk_count += 1
+        total_bytes += len(chunk)
+    if chunk_count:
+        print(f"  Streamed {total_bytes} bytes in {chunk_count} chunks")
+    else:
+        print("  Streaming failed (expected without proper dependencies/API keys)")
+    
     # Test audio info
     if result['speech']:
         info = manager.get_audio_info(result['speech'])
@@ -151,6 +199,8 @@ def demo_voice_data_class():
     """Demonstrate Voice data class."""
     print("=== Voice Data Class Demo ===")
     
+    from audio_processor import Voice
+    
     # Create different voice configurations
     voices = [
         Voice(id="voice1", name="Bella", language="en", gender="female", provider="elevenlabs"),
@@ -179,19 +229,28 @@ def demo_utility_functions():
         create_silence_audio
     )
     
-    # Test file validation
-    test_files = [
-        "test.wav",
-        "test.mp3", 
-        "test.txt",
-        "/nonexistent/file.wav"
-    ]
+    # Test file validation (only the header bytes are inspected)
+    sample_headers = {
+        "test.wav": b'RIFF\x24\x08\x00\x00WAVEfmt ',
+        "test.mp3": b'ID3\x03\x00\x00\x00',
+        "test.txt": b'plain text',
+        "mislabeled.wav": b'OggS\x00\x02\x00\x00',
+    }
     
     print("Audio file validation:")
-    for file_path in test_files:
-        is_valid = validate_audio_file(file_path)
-        status = "✓" if is_valid else "✗"
-        print(f"  {status} {file_path}")
+    with tempfile.TemporaryDirectory() as sample_dir:
+        test_files = []
+        for name, header in sample_headers.items():
+            file_path = os.path.join(sample_dir, name)
+            with open(file_path, 'wb') as f:
+                f.write(header)
+            test_files.append(file_path)
+        test_files.append("/nonexistent/file.wav")
+        
+        for file_path in test_files:
+            is_valid = validate_audio_file(file_path)
+            status = "✓" if is_valid else "✗"
+            print(f"  {status} {os.path.basename(file_path)}")
     
     # Test default background music
     default_music = get_default_background_music_path()
@@ -213,11 +272,27 @@ def main():
     print("=" * 50)
     print()
     
-    demo_tts_processor()
-    demo_audio_remixer()
-    demo_audio_manager()
-    demo_voice_data_class()
-    demo_utility_functions()
+    demos = [
+        demo_tts_processor,
+        demo_audio_remixer,
+        demo_audio_manager,
+        demo_voice_data_class,
+        demo_utility_functions,
+    ]
+    
+    # The demos are independent and mostly wait on TTS/file I/O, so run them
+    # concurrently and print each one's output in the original order
+    real_stdout = sys.stdout
+    sys.stdout = _ThreadRoutedStdout(real_stdout)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(_run_buffered, demo) for demo in demos]
+            outputs = [future.result() for future in futures]
+    finally:
+        sys.stdout = real_stdout
+    
+    for output in outputs:
+        print(output, end="")
     
     print("Demo completed!")
     print("\nNote: Some features may not work fully without:")
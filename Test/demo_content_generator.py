@@ -5,6 +5,7 @@ Shows the content generator in action with different input types.
 
 import os
 import sys
+import asyncio
 
 # Add app directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
@@ -42,20 +43,33 @@ def demo_content_generation():
         }
     ]
     
-    for i, demo_input in enumerate(demo_inputs, 1):
-        print(f"--- Demo {i}: {demo_input['description']} ---")
-        print(f"Input: {demo_input['content'][:60]}...")
-        
-        # Create processed input
-        processed_input = ProcessedInput(
+    # Create processed inputs
+    processed_inputs = [
+        ProcessedInput(
             content=demo_input['content'],
             input_type=demo_input['input_type'],
             metadata={"demo": True, "index": i}
         )
+        for i, demo_input in enumerate(demo_inputs, 1)
+    ]
+    
+    # Generation calls are independent network waits, so let them overlap
+    async def run_all():
+        return await asyncio.gather(
+            *(generator.agenerate_support_and_poem(inp) for inp in processed_inputs),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run_all())
+    
+    for i, (demo_input, result) in enumerate(zip(demo_inputs, results), 1):
+        print(f"--- Demo {i}: {demo_input['description']} ---")
+        print(f"Input: {demo_input['content'][:60]}...")
         
         try:
-            # Generate content
-            result = generator.generate_support_and_poem(processed_input)
+            # gather hands back failures in place of results
+            if isinstance(result, Exception):
+                raise result
             
             print(f"\n✨ Supportive Statement:")
             print(f"   {result.supportive_statement}")
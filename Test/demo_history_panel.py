@@ -7,8 +7,10 @@ import sys
 import os
 import tempfile
 import shutil
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 
 # Add app directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -16,6 +18,18 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from app.storage_manager import StorageManager, HistoryManager
 from app.data_models import User, Interaction, ProcessedInput, GeneratedContent, InputType
 
+# Display format for history timestamps
+FMT = "%Y-%m-%d %H:%M"
+
+# Mind map section labels per input type
+TYPE_ICONS = MappingProxyType({
+    'text': '📝 Text Conversations',
+    'audio': '🎤 Audio Messages',
+    'drawing': '🎨 Creative Drawings',
+    'unknown': '💭 Other Interactions'
+})
+UNKNOWN_ICON = '📋 {title}'
+
 
 def create_demo_user():
     """Create a demo user."""
@@ -93,68 +107,98 @@ def create_demo_interactions():
     return interactions
 
 
-def demonstrate_mind_map_logic(history_items):
+def scan_history(history_items, search_queries=()):
+    """
+    Collect search hits, type groups, date range and sample in one pass.
+    
+    Args:
+        history_items: History preview items
+        search_queries: Queries to count matches for
+        
+    Returns:
+        dict with hit_counts, type_groups, oldest_epoch, recent_epoch and sample
+    """
+    queries_lc = [q.lower() for q in search_queries]
+    hit_counts = [0] * len(queries_lc)
+    type_groups = defaultdict(list)
+    oldest_epoch = recent_epoch = None
+    sample = None
+    
+    for idx, item in enumerate(history_items):
+        if idx == 0:
+            sample = item
+        
+        blob = item['_search_blob']
+        for i, query in enumerate(queries_lc):
+            hit_counts[i] += query in blob
+        
+        # Group by input type and track the date range (same logic as in UI)
+        type_groups[item.get('input_type', 'unknown')].append(item)
+        ts_epoch = item['_ts_epoch']
+        if oldest_epoch is None or ts_epoch < oldest_epoch:
+            oldest_epoch = ts_epoch
+        if recent_epoch is None or ts_epoch > recent_epoch:
+            recent_epoch = ts_epoch
+    
+    return {
+        'hit_counts': hit_counts,
+        'type_groups': type_groups,
+        'oldest_epoch': oldest_epoch,
+        'recent_epoch': recent_epoch,
+        'sample': sample
+    }
+
+
+def demonstrate_mind_map_logic(history_items, scan=None):
     """Demonstrate the mind map visualization logic."""
     print("\n🗺️ Mind Map Visualization Demo")
     print("=" * 50)
     
-    # Group interactions by input type (same logic as in UI)
-    type_groups = {}
-    for item in history_items:
-        input_type = item.get('input_type', 'unknown')
-        if input_type not in type_groups:
-            type_groups[input_type] = []
-        type_groups[input_type].append(item)
+    if scan is None:
+        scan = scan_history(history_items)
+    type_groups = scan['type_groups']
+    oldest_epoch = scan['oldest_epoch']
+    recent_epoch = scan['recent_epoch']
     
     # Create mind map structure
-    mindmap_text = "**Your Interaction Journey:**\n\n"
-    
-    type_icons = {
-        'text': '📝 Text Conversations',
-        'audio': '🎤 Audio Messages', 
-        'drawing': '🎨 Creative Drawings',
-        'unknown': '💭 Other Interactions'
-    }
+    parts = ["**Your Interaction Journey:**\n\n"]
     
     for input_type, items in type_groups.items():
-        mindmap_text += f"**{type_icons.get(input_type, f'📋 {input_type.title()}')}** ({len(items)} interactions)\n"
+        label = TYPE_ICONS.get(input_type) or UNKNOWN_ICON.format(title=input_type.title())
+        parts.append(f"**{label}** ({len(items)} interactions)\n")
         
         # Show recent items in this category
         recent_items = items[:3]  # Show up to 3 recent items per type
         for item in recent_items:
-            preview = item.get('preview', 'Untitled')[:30] + "..." if len(item.get('preview', '')) > 30 else item.get('preview', 'Untitled')
+            p = item.get('preview') or 'Untitled'
+            preview = (p[:30] + '...') if len(p) > 30 else p
             timestamp = item.get('timestamp', 'Unknown')
-            mindmap_text += f"  └─ *{preview}* ({timestamp})\n"
+            parts.append(f"  └─ *{preview}* ({timestamp})\n")
         
         if len(items) > 3:
-            mindmap_text += f"  └─ ... and {len(items) - 3} more\n"
+            parts.append(f"  └─ ... and {len(items) - 3} more\n")
         
-        mindmap_text += "\n"
+        parts.append("\n")
     
+    mindmap_text = ''.join(parts)
     print(mindmap_text)
     
     # Add summary statistics
     total_interactions = len(history_items)
     if total_interactions > 0:
-        # Calculate some basic stats
-        recent_date = max(item.get('timestamp', '') for item in history_items)
-        oldest_date = min(item.get('timestamp', '') for item in history_items)
-        
-        print("**📊 Summary:**")
-        print(f"- Total interactions: {total_interactions}")
-        print(f"- Most recent: {recent_date}")
-        print(f"- First interaction: {oldest_date}")
-        
-        # Show distribution by type
-        type_counts = {}
-        for item in history_items:
-            input_type = item.get('input_type', 'unknown')
-            type_counts[input_type] = type_counts.get(input_type, 0) + 1
-        
-        print("- Input type distribution:")
-        for input_type, count in type_counts.items():
+        summary = [
+            "**📊 Summary:**",
+            f"- Total interactions: {total_interactions}",
+            f"- Most recent: {datetime.fromtimestamp(recent_epoch).strftime(FMT)}",
+            f"- First interaction: {datetime.fromtimestamp(oldest_epoch).strftime(FMT)}",
+            # Show distribution by type
+            "- Input type distribution:"
+        ]
+        for input_type, items in type_groups.items():
+            count = len(items)
             percentage = (count / total_interactions) * 100
-            print(f"  - {input_type.title()}: {count} ({percentage:.1f}%)")
+            summary.append(f"  - {input_type.title()}: {count} ({percentage:.1f}%)")
+        print('\n'.join(summary))
 
 
 def run_demo():
@@ -181,58 +225,61 @@ def run_demo():
         demo_interactions = create_demo_interactions()
         print(f"\nCreating {len(demo_interactions)} demo interactions...")
         
+        storage.save_interactions_bulk(user, demo_interactions)
         for i, interaction in enumerate(demo_interactions):
-            interaction_id = storage.save_interaction(user, interaction)
             print(f"  {i+1}. {interaction.input_data.content[:40]}... [{interaction.input_data.input_type.value}]")
         
-        # Load history and convert to preview format
-        loaded_user = storage.load_user_profile(user.nickname)
-        interactions = storage.load_user_history(loaded_user)
+        # Load history as parallel columns; the saved user is already current in memory
+        cols = storage.load_user_history_columnar(user)
+        ids, stamps, input_types = cols['id'], cols['ts'], cols['input_type']
+        contents, supportive, poems = cols['content'], cols['supportive'], cols['poem']
         
         # Convert to UI preview format
         history_items = []
-        for interaction in interactions:
+        for i in range(len(ids)):
             preview_text = "Untitled"
-            if interaction.input_data and interaction.input_data.content:
-                content = interaction.input_data.content.strip()
+            content = contents[i].strip()
+            if content:
                 preview_text = content[:50] + "..." if len(content) > 50 else content
             
-            timestamp_str = interaction.timestamp.strftime("%Y-%m-%d %H:%M")
+            ts = stamps[i]
             
             history_item = {
-                'id': interaction.id,
+                'id': ids[i],
                 'preview': preview_text,
-                'timestamp': timestamp_str,
-                'input_type': interaction.input_data.input_type.value if interaction.input_data else 'unknown',
-                'supportive_statement': interaction.generated_content.supportive_statement if interaction.generated_content else '',
-                'poem': interaction.generated_content.poem if interaction.generated_content else '',
-                'interaction_obj': interaction
+                'timestamp': ts.strftime(FMT),
+                '_ts_epoch': ts.timestamp(),
+                'input_type': input_types[i],
+                'supportive_statement': supportive[i],
+                'poem': poems[i]
             }
+            # Lowercased haystack built once so every query is a single scan
+            history_item['_search_blob'] = ' '.join((
+                history_item['preview'],
+                history_item['supportive_statement'],
+                history_item['poem']
+            )).lower()
             history_items.append(history_item)
         
         print(f"\n📚 Loaded {len(history_items)} history items")
         
-        # Demonstrate search functionality
-        print("\n🔍 Search Functionality Demo")
+        # Search, mind map and sample all come from a single traversal
         search_queries = ["work", "excited", "family", "drawing"]
+        scan = scan_history(history_items, search_queries)
         
-        for query in search_queries:
-            results = [
-                item for item in history_items
-                if query.lower() in item.get('preview', '').lower() or
-                   query.lower() in item.get('supportive_statement', '').lower() or
-                   query.lower() in item.get('poem', '').lower()
-            ]
-            print(f"  Search '{query}': {len(results)} results")
+        # Demonstrate search functionality
+        print("\n🔍 Search Functionality Demo")
+        for query, hits in zip(search_queries, scan['hit_counts']):
+            print(f"  Search '{query}': {hits} results")
         
         # Demonstrate mind map visualization
-        demonstrate_mind_map_logic(history_items)
+        demonstrate_mind_map_logic(history_items, scan)
         
         # Show detailed interaction example
         print("\n📝 Sample Interaction Detail")
         print("=" * 50)
-        if history_items:
-            sample = history_items[0]
+        sample = scan['sample']
+        if sample:
             print(f"ID: {sample['id']}")
             print(f"Timestamp: {sample['timestamp']}")
             print(f"Input Type: {sample['input_type']}")
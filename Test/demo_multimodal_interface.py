@@ -16,10 +16,21 @@ sys.path.insert(0, str(app_dir))
 from input_processor import InputProcessor
 from data_models import InputType, ProcessedInput
 from datetime import datetime
+import importlib
 import tempfile
-import io
-from PIL import Image
-import base64
+
+# Optional heavy dependencies are imported on first use and cached here
+_optional_modules = {}
+
+
+def _optional_import(module_name):
+    """Import an optional module on first use, returning None if unavailable."""
+    if module_name not in _optional_modules:
+        try:
+            _optional_modules[module_name] = importlib.import_module(module_name)
+        except ImportError:
+            _optional_modules[module_name] = None
+    return _optional_modules[module_name]
 
 
 def demo_text_processing():
@@ -56,6 +67,13 @@ def demo_text_processing():
             print(f"   ❌ Error: {e}")
 
 
+def mkpayload(header: bytes, size: int) -> bytes:
+    """Build a mock audio payload: header followed by size zero bytes, in one buffer."""
+    buf = bytearray(len(header) + size)
+    buf[:len(header)] = header
+    return bytes(buf)
+
+
 def demo_audio_processing():
     """Demonstrate audio input processing."""
     print("\n\n🎤 AUDIO INPUT PROCESSING DEMO")
@@ -65,9 +83,9 @@ def demo_audio_processing():
     
     # Create mock audio files with different formats
     audio_tests = [
-        ("WAV", b'RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x08\x00\x00' + b'\x00' * 1024),
-        ("MP3", b'ID3\x03\x00\x00\x00' + b'\x00' * 512),
-        ("OGG", b'OggS\x00\x02\x00\x00' + b'\x00' * 256),
+        ("WAV", mkpayload(b'RIFF\x24\x08\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x44\xac\x00\x00\x88X\x01\x00\x02\x00\x10\x00data\x00\x08\x00\x00', 1024)),
+        ("MP3", mkpayload(b'ID3\x03\x00\x00\x00', 512)),
+        ("OGG", mkpayload(b'OggS\x00\x02\x00\x00', 256)),
     ]
     
     for i, (format_name, audio_data) in enumerate(audio_tests, 1):
@@ -128,27 +146,32 @@ def demo_drawing_processing():
     except Exception as e:
         print(f"   ❌ Error: {e}")
     
-    # Test 2: Base64 image processing
-    print("\n🖼️ Test 2: Processing base64 image...")
+    # Test 2: Encoded image processing
+    print("\n🖼️ Test 2: Processing PNG image bytes...")
+    
+    Image = _optional_import("PIL.Image")
+    ImageDraw = _optional_import("PIL.ImageDraw")
+    if Image is None or ImageDraw is None:
+        print("   ⚠️ Skipped: PIL not available")
+        return
+    
+    import io
     
     # Create a simple test image
     test_image = Image.new('RGB', (200, 200), color='lightblue')
     # Draw a simple pattern
-    from PIL import ImageDraw
     draw = ImageDraw.Draw(test_image)
     draw.ellipse([50, 50, 150, 150], fill='red', outline='black')
     draw.rectangle([75, 75, 125, 125], fill='yellow')
     
-    # Convert to base64
+    # Encode to PNG bytes; the processor accepts them without a base64 round-trip
     buffer = io.BytesIO()
     test_image.save(buffer, format='PNG')
     image_data = buffer.getvalue()
-    base64_data = base64.b64encode(image_data).decode()
-    base64_with_prefix = f"data:image/png;base64,{base64_data}"
     
     try:
         processed = processor.process_drawing_input(
-            base64_with_prefix,
+            image_data,
             metadata={"source": "demo", "timestamp": datetime.now().isoformat()}
         )
         
@@ -7,8 +7,13 @@ Tests Google Gemini API connectivity, functionality, and integration
 import os
 import sys
 import json
+import logging
+import re
 import time
+import asyncio
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -16,13 +21,22 @@ from typing import Dict, List, Optional, Any
 app_dir = Path(__file__).parent.parent / "app"
 sys.path.insert(0, str(app_dir))
 
+# Progress is reported through logging so silent runs skip the formatting
+logger = logging.getLogger("gemini_validator")
+
 # Try to import required modules
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import google.generativeai as genai
     GENAI_AVAILABLE = True
 except ImportError:
     GENAI_AVAILABLE = False
-    print("⚠️ google.generativeai not available")
+    logger.warning("⚠️ google.generativeai not available")
 
 try:
     from content_generator import GeminiGenerator, ContentGenerator
@@ -30,97 +44,370 @@ try:
     ECHOVERSE_MODULES_AVAILABLE = True
 except ImportError as e:
     ECHOVERSE_MODULES_AVAILABLE = False
-    print(f"⚠️ EchoVerse modules not available: {e}")
+    logger.warning("⚠️ EchoVerse modules not available: %s", e)
+
+from llm_cache import FileCacheBackend, SemanticCache, cache_key
+
+
+# Evaluator word lists, each compiled into one pattern so a response is scanned
+# once per list; matching stays substring-based ("feel" also matches "feeling")
+EMPATHY_WORDS = ("understand", "feel", "know", "hear", "see", "acknowledge", "recognize")
+ENCOURAGING_WORDS = ("can", "will", "able", "strength", "capable", "possible", "hope", "believe")
+POETIC_WORDS = ("like", "as", "through", "beyond", "within", "beneath", "above")
+UPLIFTING_WORDS = ("light", "bright", "hope", "joy", "peace", "love", "strength", "grow", "rise")
+
+EMPATHY_PATTERN = re.compile("|".join(EMPATHY_WORDS))
+ENCOURAGING_PATTERN = re.compile("|".join(ENCOURAGING_WORDS))
+POETIC_PATTERN = re.compile("|".join(POETIC_WORDS))
+UPLIFTING_PATTERN = re.compile("|".join(UPLIFTING_WORDS))
+
+
+# Prompts are split into fixed instructions and a variable part. Models that
+# accept a system instruction get the fixed part once at construction and only
+# the variable part per request; older models get the full template, which
+# keeps the instructions first so every request shares the same prefix
+SUPPORT_SYSTEM_PROMPT = (
+    "You are a compassionate AI companion.\n"
+    "\n"
+    "Please provide a warm, supportive, and encouraging response to what the user shared that:\n"
+    "- Acknowledges their feelings with empathy\n"
+    "- Offers gentle encouragement and hope\n"
+    "- Provides practical perspective or gentle guidance\n"
+    "- Is personal and heartfelt, not generic\n"
+    "- Is 2-3 sentences long"
+)
+SUPPORT_USER_TEMPLATE = (
+    "The user has shared: \"{user_input}\"\n"
+    "\n"
+    "Response:"
+)
+SUPPORT_PROMPT_TEMPLATE = SUPPORT_SYSTEM_PROMPT + "\n\n" + SUPPORT_USER_TEMPLATE
+
+POEM_SYSTEM_PROMPT = (
+    "Write a short, uplifting poem. The poem should:\n"
+    "- Be 4-8 lines long\n"
+    "- Have a gentle, encouraging tone\n"
+    "- Use accessible, heartfelt language\n"
+    "- Offer comfort and inspiration\n"
+    "- Have a natural rhythm (doesn't need to rhyme perfectly)"
+)
+POEM_USER_TEMPLATE = (
+    "Theme: {theme}\n"
+    "\n"
+    "Poem:"
+)
+POEM_PROMPT_TEMPLATE = POEM_SYSTEM_PROMPT + "\n\n" + POEM_USER_TEMPLATE
+
+# Gemini 1.0 models reject system instructions
+LEGACY_MODEL_PREFIXES = ("gemini-pro", "gemini-1.0")
+
+# Invalid-input probes as (label, prompt text); a None input is sent as ""
+LONG_INPUT = "x" * 10000
+INVALID_INPUT_PROBES = (
+    ("empty", ""),
+    ("long", LONG_INPUT),
+    ("none", ""),
+)
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter: `rate` requests per `period` seconds, bursting up to `rate`"""
+    
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = float(rate)
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        # Guards the counters; held only between awaits, never across one
+        self._lock = threading.Lock()
+    
+    async def __aenter__(self):
+        # Only waits once the local budget is spent
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return self
+                wait = (1 - self.tokens) / self.fill_rate
+            await asyncio.sleep(wait)
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
 
 
 class GeminiAPIValidator:
     """Comprehensive Gemini API validation and testing"""
     
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize the validator with API key"""
+    # Concurrent requests allowed when a test sends several prompts at once
+    MAX_CONCURRENCY = 4
+    
+    DEFAULT_MODEL = 'gemini-pro'
+    
+    # Seconds a cached response is replayed before the prompt is sent again
+    CACHE_TTL = 3600
+    
+    EMBEDDING_MODEL = 'models/text-embedding-004'
+    
+    # Default requests-per-minute budget for the async prompt batches
+    DEFAULT_RPM = 60
+    
+    def __init__(self, api_key: Optional[str] = None, cache_dir: Optional[str] = None,
+                 semantic_cache: bool = False, rpm: int = DEFAULT_RPM,
+                 model_name: str = DEFAULT_MODEL):
+        """
+        Initialize the validator with API key and optional response caches
+        
+        With semantic_cache, supportive prompts whose user input embeds within
+        cosine 0.92 of an earlier one replay that earlier response.
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
+        self.model_name = model_name
         self.model = None
+        # Per-task models carrying their instructions as a system instruction
+        self.support_model = None
+        self.poem_model = None
+        # Fixed once __init__ finishes; is_available() just returns it
+        self._available = False
         self.test_results = []
+        self.limiter = AsyncTokenBucket(rpm, 60)
+        # Every async batch runs on this loop: the grpc.aio client binds to
+        # the first loop that uses it, so one loop must outlive each test
+        self._loop = asyncio.new_event_loop()
+        self.cache = FileCacheBackend(cache_dir) if cache_dir else None
+        self.semantic_cache = (
+            SemanticCache(self._embed, path=Path(cache_dir) / "semantic.json")
+            if semantic_cache and cache_dir else None
+        )
         
         if not self.api_key:
-            print("❌ No Gemini API key found. Set GEMINI_API_KEY environment variable.")
+            logger.error("❌ No Gemini API key found. Set GEMINI_API_KEY environment variable.")
             return
         
         if not GENAI_AVAILABLE:
-            print("❌ google.generativeai library not available")
+            logger.error("❌ google.generativeai library not available")
             return
         
         try:
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel('gemini-pro')
-            print("✅ Gemini API configured successfully")
+            # gRPC keeps one long-lived channel that every test call reuses
+            genai.configure(api_key=self.api_key, transport="grpc")
+            self.model = genai.GenerativeModel(self.model_name)
+            if not self.model_name.startswith(LEGACY_MODEL_PREFIXES):
+                self.support_model = genai.GenerativeModel(self.model_name, system_instruction=SUPPORT_SYSTEM_PROMPT)
+                self.poem_model = genai.GenerativeModel(self.model_name, system_instruction=POEM_SYSTEM_PROMPT)
+            self._available = True
+            logger.info("✅ Gemini API configured successfully")
         except Exception as e:
-            print(f"❌ Failed to configure Gemini API: {e}")
+            logger.error("❌ Failed to configure Gemini API: %s", e)
+            return
+        
+        # Open the channel (TLS handshake) up front so it is not charged to the
+        # first timed test; count_tokens generates nothing and is not billed
+        try:
+            self.model.count_tokens("ping")
+        except Exception as e:
+            logger.warning("⚠️ Gemini connection warm-up failed: %s", e)
     
     def is_available(self) -> bool:
         """Check if Gemini API is available and configured"""
-        return self.model is not None and GENAI_AVAILABLE
+        return self._available
+    
+    def _run(self, coro: Any) -> Any:
+        """Run a coroutine to completion on the validator's event loop"""
+        return self._loop.run_until_complete(coro)
+    
+    def close(self) -> None:
+        """Close the validator's event loop"""
+        if not self._loop.is_closed():
+            self._loop.close()
+    
+    def _embed(self, text: str) -> List[float]:
+        """Embed text with the Gemini embedding model"""
+        return genai.embed_content(model=self.EMBEDDING_MODEL, content=text)["embedding"]
+    
+    def _stream_generate(self, prompt: str) -> Dict[str, Any]:
+        """
+        Generate content with streaming, timing the first chunk and the whole response
+        
+        Returns:
+            Dict with "text", "time_to_first_token" and "response_time" (seconds);
+            cache hits report the lookup time for both timings
+        """
+        start_time = time.perf_counter()
+        key = cache_key(self.model_name, prompt) if self.cache is not None else None
+        cached = self.cache.get(key) if key is not None else None
+        if cached is not None:
+            elapsed = time.perf_counter() - start_time
+            return {"text": cached["text"], "time_to_first_token": elapsed, "response_time": elapsed}
+        
+        first_token_time = None
+        chunks = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            if first_token_time is None:
+                first_token_time = time.perf_counter()
+            chunks.append(chunk.text)
+        end_time = time.perf_counter()
+        
+        text = "".join(chunks)
+        if key is not None and text:
+            self.cache.set(key, {"text": text}, ttl=self.CACHE_TTL)
+        
+        return {
+            "text": text,
+            "time_to_first_token": (first_token_time or end_time) - start_time,
+            "response_time": end_time - start_time
+        }
+    
+    async def _cached_generate_async(self, prompt: str, model: Any = None,
+                                     system_instruction: Optional[str] = None) -> Any:
+        """Generate content asynchronously with caching; API calls draw from the rate limiter"""
+        model = model or self.model
+        if self.cache is None:
+            async with self.limiter:
+                return await model.generate_content_async(prompt)
+        
+        key = cache_key(self.model_name, prompt, system_instruction=system_instruction)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return SimpleNamespace(**cached)
+        
+        async with self.limiter:
+            response = await model.generate_content_async(prompt)
+        if response and response.text:
+            self.cache.set(key, {"text": response.text}, ttl=self.CACHE_TTL)
+        return response
+    
+    async def _generate_concurrently(self, prompts: List[str],
+                                     semantic_keys: Optional[List[str]] = None,
+                                     model: Any = None,
+                                     system_instruction: Optional[str] = None) -> List[Any]:
+        """
+        Send prompts concurrently, bounded by MAX_CONCURRENCY.
+        
+        With the semantic cache, prompts whose keys match an earlier prompt in
+        the batch wait for that prompt's response instead of being sent.
+        
+        Args:
+            prompts: Prompts to send
+            semantic_keys: Per-prompt text matched against the semantic cache, if enabled
+            model: Model to send to (defaults to self.model)
+            system_instruction: The model's system instruction, if any (part of the cache key)
+        
+        Returns:
+            One (response, response_time) tuple or Exception per prompt, in order
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        use_semantic = self.semantic_cache is not None and semantic_keys is not None
+        # Entries only match requests sent to the same model and instruction
+        scope = cache_key(self.model_name, "", system_instruction=system_instruction)
+        
+        async def generate(prompt: str, semantic_key: Optional[str], leader: Optional[asyncio.Task]):
+            start_time = time.perf_counter()
+            if leader is not None:
+                # A similar prompt earlier in the batch answers this one
+                try:
+                    response, _ = await leader
+                except Exception:
+                    response = None
+                if response and response.text:
+                    return SimpleNamespace(text=response.text), time.perf_counter() - start_time
+            
+            async with semaphore:
+                if use_semantic:
+                    cached = await asyncio.to_thread(self.semantic_cache.get, semantic_key, scope)
+                    if cached is not None:
+                        return SimpleNamespace(**cached), time.perf_counter() - start_time
+                
+                response = await self._cached_generate_async(prompt, model, system_instruction)
+                
+                if use_semantic and response and response.text:
+                    await asyncio.to_thread(self.semantic_cache.set, semantic_key,
+                                            {"text": response.text}, scope)
+                return response, time.perf_counter() - start_time
+        
+        if use_semantic:
+            keys = semantic_keys
+            leaders = await asyncio.to_thread(self.semantic_cache.leaders, keys)
+        else:
+            keys = [None] * len(prompts)
+            leaders = list(range(len(prompts)))
+        
+        tasks: List[asyncio.Task] = []
+        for i, (prompt, key) in enumerate(zip(prompts, keys)):
+            leader = tasks[leaders[i]] if leaders[i] != i else None
+            tasks.append(asyncio.ensure_future(generate(prompt, key, leader)))
+        return await asyncio.gather(*tasks, return_exceptions=True)
     
     def test_basic_connectivity(self) -> Dict[str, Any]:
         """Test basic API connectivity"""
-        print("\n🔌 Testing basic Gemini API connectivity...")
+        logger.info("\n🔌 Testing basic Gemini API connectivity...")
+        # One timestamp per test, shared by every result dict below
+        timestamp = datetime.now().isoformat()
         
         if not self.is_available():
             result = {
                 "test": "basic_connectivity",
                 "success": False,
                 "error": "API not available or configured",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             self.test_results.append(result)
             return result
         
         try:
-            start_time = time.time()
-            response = self.model.generate_content("Hello, this is a test message.")
-            end_time = time.time()
+            streamed = self._stream_generate("Hello, this is a test message.")
+            text = streamed["text"]
             
-            if response and response.text:
+            if text:
                 result = {
                     "test": "basic_connectivity",
                     "success": True,
-                    "response_time": end_time - start_time,
-                    "response_length": len(response.text),
-                    "response_preview": response.text[:100] + "..." if len(response.text) > 100 else response.text,
-                    "timestamp": datetime.now().isoformat()
+                    "time_to_first_token": streamed["time_to_first_token"],
+                    "response_time": streamed["response_time"],
+                    "response_length": len(text),
+                    "response_preview": text[:100] + "..." if len(text) > 100 else text,
+                    "timestamp": timestamp
                 }
-                print(f"✅ Basic connectivity test passed ({result['response_time']:.2f}s)")
+                logger.info("✅ Basic connectivity test passed (first token %.2fs, total %.2fs)",
+                            result['time_to_first_token'], result['response_time'])
             else:
                 result = {
                     "test": "basic_connectivity",
                     "success": False,
                     "error": "Empty or invalid response",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                print("❌ Basic connectivity test failed - empty response")
+                logger.error("❌ Basic connectivity test failed - empty response")
             
         except Exception as e:
             result = {
                 "test": "basic_connectivity",
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            print(f"❌ Basic connectivity test failed: {e}")
+            logger.error("❌ Basic connectivity test failed: %s", e)
         
         self.test_results.append(result)
         return result
     
     def test_supportive_content_generation(self) -> Dict[str, Any]:
         """Test supportive content generation"""
-        print("\n💝 Testing supportive content generation...")
+        return self._run(self._supportive_content_generation())
+    
+    async def _supportive_content_generation(self) -> Dict[str, Any]:
+        """Send the supportive prompts as one async batch and score the responses"""
+        logger.info("\n💝 Testing supportive content generation...")
+        timestamp = datetime.now().isoformat()
         
         if not self.is_available():
             result = {
                 "test": "supportive_content",
                 "success": False,
                 "error": "API not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             self.test_results.append(result)
             return result
@@ -132,103 +419,105 @@ class GeminiAPIValidator:
             "I feel lonely and disconnected from others lately."
         ]
         
+        if self.support_model is not None:
+            prompts = [SUPPORT_USER_TEMPLATE.format(user_input=user_input) for user_input in test_prompts]
+            model, system_instruction = self.support_model, SUPPORT_SYSTEM_PROMPT
+        else:
+            prompts = [SUPPORT_PROMPT_TEMPLATE.format(user_input=user_input) for user_input in test_prompts]
+            model, system_instruction = self.model, None
+        
+        logger.info("  📝 Sending %s prompts concurrently...", len(prompts))
+        # Paraphrased user inputs share a semantic cache entry, not the template
+        outcomes = await self._generate_concurrently(
+            prompts, semantic_keys=test_prompts, model=model, system_instruction=system_instruction)
+        
         results = []
+        # Running totals over successful prompts, kept during the loop
+        successful_count = 0
+        total_quality = 0
+        total_response_time = 0.0
         
-        for i, user_input in enumerate(test_prompts, 1):
-            print(f"  📝 Testing prompt {i}/{len(test_prompts)}...")
+        for i, (user_input, outcome) in enumerate(zip(test_prompts, outcomes), 1):
+            if isinstance(outcome, Exception):
+                test_result = {
+                    "prompt_index": i,
+                    "user_input": user_input,
+                    "success": False,
+                    "error": str(outcome)
+                }
+                results.append(test_result)
+                logger.error("    ❌ Prompt %s error: %s", i, outcome)
+                continue
             
-            try:
-                prompt = f"""
-                You are a compassionate AI companion. A user has shared: "{user_input}"
-                
-                Please provide a warm, supportive, and encouraging response that:
-                - Acknowledges their feelings with empathy
-                - Offers gentle encouragement and hope
-                - Provides practical perspective or gentle guidance
-                - Is personal and heartfelt, not generic
-                - Is 2-3 sentences long
-                
-                Response:
-                """
+            response, response_time = outcome
+            if response and response.text:
+                support_text = response.text.strip()
                 
-                start_time = time.time()
-                response = self.model.generate_content(prompt)
-                end_time = time.time()
+                # Validate response quality
+                quality_score = self._evaluate_supportive_response(user_input, support_text)
                 
-                if response and response.text:
-                    support_text = response.text.strip()
-                    
-                    # Validate response quality
-                    quality_score = self._evaluate_supportive_response(user_input, support_text)
-                    
-                    test_result = {
-                        "prompt_index": i,
-                        "user_input": user_input,
-                        "response": support_text,
-                        "response_time": end_time - start_time,
-                        "quality_score": quality_score,
-                        "success": True
-                    }
-                    
-                    print(f"    ✅ Generated supportive response (quality: {quality_score}/10)")
-                    
-                else:
-                    test_result = {
-                        "prompt_index": i,
-                        "user_input": user_input,
-                        "success": False,
-                        "error": "Empty response"
-                    }
-                    print(f"    ❌ Failed to generate response")
-                
-                results.append(test_result)
+                test_result = {
+                    "prompt_index": i,
+                    "user_input": user_input,
+                    "response": support_text,
+                    "response_time": response_time,
+                    "quality_score": quality_score,
+                    "success": True
+                }
                 
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
+                successful_count += 1
+                total_quality += quality_score
+                total_response_time += response_time
+                logger.info("    ✅ Prompt %s: generated supportive response (quality: %s/10)", i, quality_score)
                 
-            except Exception as e:
+            else:
                 test_result = {
                     "prompt_index": i,
                     "user_input": user_input,
                     "success": False,
-                    "error": str(e)
+                    "error": "Empty response"
                 }
-                results.append(test_result)
-                print(f"    ❌ Error: {e}")
+                logger.error("    ❌ Prompt %s: failed to generate response", i)
+            
+            results.append(test_result)
         
         # Calculate overall results
-        successful_tests = [r for r in results if r.get("success", False)]
-        avg_quality = sum(r.get("quality_score", 0) for r in successful_tests) / len(successful_tests) if successful_tests else 0
-        avg_response_time = sum(r.get("response_time", 0) for r in successful_tests) / len(successful_tests) if successful_tests else 0
+        avg_quality = total_quality / successful_count if successful_count else 0
+        avg_response_time = total_response_time / successful_count if successful_count else 0
         
         overall_result = {
             "test": "supportive_content",
-            "success": len(successful_tests) > 0,
+            "success": successful_count > 0,
             "total_prompts": len(test_prompts),
-            "successful_prompts": len(successful_tests),
-            "success_rate": len(successful_tests) / len(test_prompts),
+            "successful_prompts": successful_count,
+            "success_rate": successful_count / len(test_prompts),
             "average_quality_score": avg_quality,
             "average_response_time": avg_response_time,
             "individual_results": results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
-        print(f"📊 Supportive content test: {len(successful_tests)}/{len(test_prompts)} successful")
-        print(f"📊 Average quality score: {avg_quality:.1f}/10")
+        logger.info("📊 Supportive content test: %s/%s successful", successful_count, len(test_prompts))
+        logger.info("📊 Average quality score: %.1f/10", avg_quality)
         
         self.test_results.append(overall_result)
         return overall_result
     
     def test_poem_generation(self) -> Dict[str, Any]:
         """Test poem generation"""
-        print("\n🎭 Testing poem generation...")
+        return self._run(self._poem_generation())
+    
+    async def _poem_generation(self) -> Dict[str, Any]:
+        """Send the poem themes as one async batch and score the poems"""
+        logger.info("\n🎭 Testing poem generation...")
+        timestamp = datetime.now().isoformat()
         
         if not self.is_available():
             result = {
                 "test": "poem_generation",
                 "success": False,
                 "error": "API not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             self.test_results.append(result)
             return result
@@ -240,101 +529,101 @@ class GeminiAPIValidator:
             "new beginnings and growth"
         ]
         
+        if self.poem_model is not None:
+            prompts = [POEM_USER_TEMPLATE.format(theme=theme) for theme in test_themes]
+            model, system_instruction = self.poem_model, POEM_SYSTEM_PROMPT
+        else:
+            prompts = [POEM_PROMPT_TEMPLATE.format(theme=theme) for theme in test_themes]
+            model, system_instruction = self.model, None
+        
+        logger.info("  🎨 Sending %s poem themes concurrently...", len(prompts))
+        outcomes = await self._generate_concurrently(
+            prompts, model=model, system_instruction=system_instruction)
+        
         results = []
+        successful_count = 0
+        total_quality = 0
+        total_response_time = 0.0
         
-        for i, theme in enumerate(test_themes, 1):
-            print(f"  🎨 Testing poem theme {i}/{len(test_themes)}: {theme}...")
+        for i, (theme, outcome) in enumerate(zip(test_themes, outcomes), 1):
+            if isinstance(outcome, Exception):
+                test_result = {
+                    "theme_index": i,
+                    "theme": theme,
+                    "success": False,
+                    "error": str(outcome)
+                }
+                results.append(test_result)
+                logger.error("    ❌ Theme %s error: %s", i, outcome)
+                continue
             
-            try:
-                prompt = f"""
-                Write a short, uplifting poem about {theme}. The poem should:
-                - Be 4-8 lines long
-                - Have a gentle, encouraging tone
-                - Use accessible, heartfelt language
-                - Offer comfort and inspiration
-                - Have a natural rhythm (doesn't need to rhyme perfectly)
-                
-                Poem:
-                """
+            response, response_time = outcome
+            if response and response.text:
+                poem_text = response.text.strip()
                 
-                start_time = time.time()
-                response = self.model.generate_content(prompt)
-                end_time = time.time()
+                # Validate poem structure
+                lines = [line.strip() for line in poem_text.split('\n') if line.strip()]
+                quality_score = self._evaluate_poem_response(theme, poem_text, lines)
                 
-                if response and response.text:
-                    poem_text = response.text.strip()
-                    
-                    # Validate poem structure
-                    lines = [line.strip() for line in poem_text.split('\n') if line.strip()]
-                    quality_score = self._evaluate_poem_response(theme, poem_text, lines)
-                    
-                    test_result = {
-                        "theme_index": i,
-                        "theme": theme,
-                        "poem": poem_text,
-                        "line_count": len(lines),
-                        "response_time": end_time - start_time,
-                        "quality_score": quality_score,
-                        "success": True
-                    }
-                    
-                    print(f"    ✅ Generated poem ({len(lines)} lines, quality: {quality_score}/10)")
-                    
-                else:
-                    test_result = {
-                        "theme_index": i,
-                        "theme": theme,
-                        "success": False,
-                        "error": "Empty response"
-                    }
-                    print(f"    ❌ Failed to generate poem")
+                test_result = {
+                    "theme_index": i,
+                    "theme": theme,
+                    "poem": poem_text,
+                    "line_count": len(lines),
+                    "response_time": response_time,
+                    "quality_score": quality_score,
+                    "success": True
+                }
                 
-                results.append(test_result)
-                time.sleep(0.5)
+                successful_count += 1
+                total_quality += quality_score
+                total_response_time += response_time
+                logger.info("    ✅ %s: generated poem (%s lines, quality: %s/10)", theme, len(lines), quality_score)
                 
-            except Exception as e:
+            else:
                 test_result = {
                     "theme_index": i,
                     "theme": theme,
                     "success": False,
-                    "error": str(e)
+                    "error": "Empty response"
                 }
-                results.append(test_result)
-                print(f"    ❌ Error: {e}")
+                logger.error("    ❌ %s: failed to generate poem", theme)
+            
+            results.append(test_result)
         
         # Calculate overall results
-        successful_tests = [r for r in results if r.get("success", False)]
-        avg_quality = sum(r.get("quality_score", 0) for r in successful_tests) / len(successful_tests) if successful_tests else 0
-        avg_response_time = sum(r.get("response_time", 0) for r in successful_tests) / len(successful_tests) if successful_tests else 0
+        avg_quality = total_quality / successful_count if successful_count else 0
+        avg_response_time = total_response_time / successful_count if successful_count else 0
         
         overall_result = {
             "test": "poem_generation",
-            "success": len(successful_tests) > 0,
+            "success": successful_count > 0,
             "total_themes": len(test_themes),
-            "successful_themes": len(successful_tests),
-            "success_rate": len(successful_tests) / len(test_themes),
+            "successful_themes": successful_count,
+            "success_rate": successful_count / len(test_themes),
             "average_quality_score": avg_quality,
             "average_response_time": avg_response_time,
             "individual_results": results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
-        print(f"📊 Poem generation test: {len(successful_tests)}/{len(test_themes)} successful")
-        print(f"📊 Average quality score: {avg_quality:.1f}/10")
+        logger.info("📊 Poem generation test: %s/%s successful", successful_count, len(test_themes))
+        logger.info("📊 Average quality score: %.1f/10", avg_quality)
         
         self.test_results.append(overall_result)
         return overall_result
     
     def test_echoverse_integration(self) -> Dict[str, Any]:
         """Test integration with EchoVerse content generator"""
-        print("\n🔗 Testing EchoVerse integration...")
+        logger.info("\n🔗 Testing EchoVerse integration...")
+        timestamp = datetime.now().isoformat()
         
         if not ECHOVERSE_MODULES_AVAILABLE:
             result = {
                 "test": "echoverse_integration",
                 "success": False,
                 "error": "EchoVerse modules not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             self.test_results.append(result)
             return result
@@ -348,7 +637,7 @@ class GeminiAPIValidator:
                     "test": "echoverse_integration",
                     "success": False,
                     "error": "GeminiGenerator not available",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
                 self.test_results.append(result)
                 return result
@@ -360,9 +649,9 @@ class GeminiAPIValidator:
                 metadata={"test": True}
             )
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             generated_content = gemini_generator.generate_support_and_poem(test_input)
-            end_time = time.time()
+            end_time = time.perf_counter()
             
             if generated_content:
                 result = {
@@ -372,9 +661,9 @@ class GeminiAPIValidator:
                     "supportive_statement_length": len(generated_content.supportive_statement),
                     "poem_length": len(generated_content.poem),
                     "generator_metadata": generated_content.generation_metadata,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                print(f"✅ EchoVerse integration test passed ({result['response_time']:.2f}s)")
+                logger.info("✅ EchoVerse integration test passed (%.2fs)", result['response_time'])
                 
                 # Test ContentGenerator fallback system
                 content_generator = ContentGenerator()
@@ -389,90 +678,102 @@ class GeminiAPIValidator:
                         "success": True,
                         "generator_used": fallback_content.generation_metadata.get("generator", "unknown")
                     }
-                    print("✅ Fallback system integration working")
+                    logger.info("✅ Fallback system integration working")
                 else:
                     result["fallback_test"] = {"success": False}
-                    print("⚠️ Fallback system integration failed")
+                    logger.warning("⚠️ Fallback system integration failed")
                 
             else:
                 result = {
                     "test": "echoverse_integration",
                     "success": False,
                     "error": "No content generated",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": timestamp
                 }
-                print("❌ EchoVerse integration test failed - no content generated")
+                logger.error("❌ EchoVerse integration test failed - no content generated")
             
         except Exception as e:
             result = {
                 "test": "echoverse_integration",
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
-            print(f"❌ EchoVerse integration test failed: {e}")
+            logger.error("❌ EchoVerse integration test failed: %s", e)
         
         self.test_results.append(result)
         return result
     
     def test_rate_limiting_and_error_handling(self) -> Dict[str, Any]:
         """Test rate limiting and error handling"""
-        print("\n⚡ Testing rate limiting and error handling...")
+        return self._run(self._rate_limiting_and_error_handling())
+    
+    async def _limited(self, func: Any, *args: Any) -> Any:
+        """Call a blocking API function in a worker thread once the rate limiter allows it"""
+        async with self.limiter:
+            return await asyncio.to_thread(func, *args)
+    
+    async def _rate_limiting_and_error_handling(self) -> Dict[str, Any]:
+        """Send rapid and invalid-input probes together, paced by the rate limiter"""
+        logger.info("\n⚡ Testing rate limiting and error handling...")
+        timestamp = datetime.now().isoformat()
         
         if not self.is_available():
             result = {
                 "test": "rate_limiting",
                 "success": False,
                 "error": "API not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
             self.test_results.append(result)
             return result
         
+        rapid_prompts = [f"Quick test message {i+1}" for i in range(5)]
+        # Submit every probe at once; the limiter holds back any beyond the
+        # --rpm budget, and each outcome is a result or the exception raised
+        outcomes = await asyncio.gather(
+            *(self._limited(self._stream_generate, prompt) for prompt in rapid_prompts),
+            *(self._limited(self.model.generate_content, text) for _, text in INVALID_INPUT_PROBES),
+            return_exceptions=True
+        )
+        rapid_outcomes = outcomes[:len(rapid_prompts)]
+        invalid_outcomes = outcomes[len(rapid_prompts):]
+        
         # Test rapid requests
         rapid_requests = []
-        for i in range(5):
-            try:
-                start_time = time.time()
-                response = self.model.generate_content(f"Quick test message {i+1}")
-                end_time = time.time()
-                
+        for i, streamed in enumerate(rapid_outcomes):
+            if not isinstance(streamed, Exception):
                 rapid_requests.append({
                     "request_number": i + 1,
-                    "success": bool(response and response.text),
-                    "response_time": end_time - start_time
+                    "success": bool(streamed["text"]),
+                    "time_to_first_token": streamed["time_to_first_token"],
+                    "response_time": streamed["response_time"]
                 })
-                
-            except Exception as e:
+            else:
                 rapid_requests.append({
                     "request_number": i + 1,
                     "success": False,
-                    "error": str(e)
+                    "error": str(streamed)
                 })
         
         successful_rapid = [r for r in rapid_requests if r.get("success", False)]
         
         # Test invalid input handling
-        invalid_inputs = [
-            "",  # Empty string
-            "x" * 10000,  # Very long string
-            None,  # None value (will be converted to string)
-        ]
-        
         invalid_input_results = []
-        for i, invalid_input in enumerate(invalid_inputs):
-            try:
-                response = self.model.generate_content(str(invalid_input) if invalid_input is not None else "")
+        for i, ((label, _), response) in enumerate(zip(INVALID_INPUT_PROBES, invalid_outcomes)):
+            if not isinstance(response, Exception):
                 invalid_input_results.append({
                     "input_type": f"invalid_{i}",
+                    "probe": label,
                     "handled_gracefully": True,
                     "got_response": bool(response and response.text)
                 })
-            except Exception as e:
+            else:
                 invalid_input_results.append({
                     "input_type": f"invalid_{i}",
+                    "probe": label,
                     "handled_gracefully": False,
-                    "error": str(e)
+                    "error": str(response)
                 })
         
         result = {
@@ -484,11 +785,11 @@ class GeminiAPIValidator:
                 "success_rate": len(successful_rapid) / len(rapid_requests)
             },
             "invalid_input_handling": invalid_input_results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
-        print(f"📊 Rapid requests: {len(successful_rapid)}/{len(rapid_requests)} successful")
-        print(f"📊 Invalid input handling: {len(invalid_input_results)} tests completed")
+        logger.info("📊 Rapid requests: %s/%s successful", len(successful_rapid), len(rapid_requests))
+        logger.info("📊 Invalid input handling: %s tests completed", len(invalid_input_results))
         
         self.test_results.append(result)
         return result
@@ -496,23 +797,22 @@ class GeminiAPIValidator:
     def _evaluate_supportive_response(self, user_input: str, response: str) -> int:
         """Evaluate quality of supportive response (1-10 scale)"""
         score = 5  # Base score
+        response_lower = response.lower()
         
         # Check length (should be substantial but not too long)
         if 50 <= len(response) <= 500:
             score += 1
         
         # Check for empathetic language
-        empathy_words = ["understand", "feel", "know", "hear", "see", "acknowledge", "recognize"]
-        if any(word in response.lower() for word in empathy_words):
+        if EMPATHY_PATTERN.search(response_lower):
             score += 1
         
         # Check for encouraging language
-        encouraging_words = ["can", "will", "able", "strength", "capable", "possible", "hope", "believe"]
-        if any(word in response.lower() for word in encouraging_words):
+        if ENCOURAGING_PATTERN.search(response_lower):
             score += 1
         
         # Check that it's not generic
-        if "you" in response.lower() and len(response.split()) > 10:
+        if "you" in response_lower and len(response.split()) > 10:
             score += 1
         
         # Penalize if too short or too generic
@@ -524,6 +824,7 @@ class GeminiAPIValidator:
     def _evaluate_poem_response(self, theme: str, poem: str, lines: List[str]) -> int:
         """Evaluate quality of poem response (1-10 scale)"""
         score = 5  # Base score
+        poem_lower = poem.lower()
         
         # Check line count (4-8 is ideal)
         if 4 <= len(lines) <= 8:
@@ -534,49 +835,67 @@ class GeminiAPIValidator:
             score -= 1
         
         # Check for poetic language
-        poetic_indicators = ["like", "as", "through", "beyond", "within", "beneath", "above"]
-        if any(word in poem.lower() for word in poetic_indicators):
+        if POETIC_PATTERN.search(poem_lower):
             score += 1
         
         # Check for theme relevance
         theme_words = theme.lower().split()
-        if any(word in poem.lower() for word in theme_words):
+        if any(word in poem_lower for word in theme_words):
             score += 1
         
         # Check for emotional/uplifting content
-        uplifting_words = ["light", "bright", "hope", "joy", "peace", "love", "strength", "grow", "rise"]
-        if any(word in poem.lower() for word in uplifting_words):
+        if UPLIFTING_PATTERN.search(poem_lower):
             score += 1
         
         return max(1, min(10, score))
     
+    async def _run_independent_tests(self) -> None:
+        """
+        Run the API probes side by side on one event loop
+        
+        They share nothing but self.test_results. The async batches must share
+        a loop because the grpc.aio client binds to the first loop that uses
+        it; the blocking connectivity test runs in a worker thread.
+        """
+        independent_tests = [
+            ("test_basic_connectivity", asyncio.to_thread(self.test_basic_connectivity)),
+            ("test_supportive_content_generation", self._supportive_content_generation()),
+            ("test_poem_generation", self._poem_generation()),
+            ("test_rate_limiting_and_error_handling", self._rate_limiting_and_error_handling())
+        ]
+        outcomes = await asyncio.gather(*(test for _, test in independent_tests), return_exceptions=True)
+        for (name, _), outcome in zip(independent_tests, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("❌ Test %s failed with exception: %s", name, outcome)
+    
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all validation tests"""
-        print("🚀 Starting Gemini API Comprehensive Validation")
-        print("=" * 60)
+        logger.info("🚀 Starting Gemini API Comprehensive Validation")
+        logger.info("=" * 60)
+        timestamp = datetime.now().isoformat()
         
         if not self.is_available():
-            print("❌ Gemini API not available - cannot run tests")
+            logger.error("❌ Gemini API not available - cannot run tests")
             return {
                 "overall_success": False,
                 "error": "API not available",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
         
-        # Run all tests
-        tests = [
-            self.test_basic_connectivity,
-            self.test_supportive_content_generation,
-            self.test_poem_generation,
-            self.test_echoverse_integration,
-            self.test_rate_limiting_and_error_handling
-        ]
+        first_new = len(self.test_results)
+        self._run(self._run_independent_tests())
         
-        for test_func in tests:
-            try:
-                test_func()
-            except Exception as e:
-                print(f"❌ Test {test_func.__name__} failed with exception: {e}")
+        # Results were appended in completion order; restore the suite order
+        suite_order = {name: i for i, name in enumerate(
+            ("basic_connectivity", "supportive_content", "poem_generation", "rate_limiting"))}
+        self.test_results[first_new:] = sorted(
+            self.test_results[first_new:], key=lambda r: suite_order.get(r.get("test"), len(suite_order)))
+        
+        # Integration builds its own generators and runs after the API probes
+        try:
+            self.test_echoverse_integration()
+        except Exception as e:
+            logger.error("❌ Test test_echoverse_integration failed with exception: %s", e)
         
         # Calculate overall results
         successful_tests = [r for r in self.test_results if r.get("success", False)]
@@ -587,37 +906,37 @@ class GeminiAPIValidator:
             "successful_tests": len(successful_tests),
             "success_rate": len(successful_tests) / len(self.test_results) if self.test_results else 0,
             "individual_results": self.test_results,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
         
         # Print summary
-        print("\n" + "=" * 60)
-        print("📊 GEMINI API VALIDATION SUMMARY")
-        print("=" * 60)
-        print(f"Total Tests: {len(self.test_results)}")
-        print(f"Successful: {len(successful_tests)}")
-        print(f"Failed: {len(self.test_results) - len(successful_tests)}")
-        print(f"Success Rate: {overall_result['success_rate']:.1%}")
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 GEMINI API VALIDATION SUMMARY")
+        logger.info("=" * 60)
+        logger.info("Total Tests: %s", len(self.test_results))
+        logger.info("Successful: %s", len(successful_tests))
+        logger.info("Failed: %s", len(self.test_results) - len(successful_tests))
+        logger.info("Success Rate: %.1f%%", overall_result['success_rate'] * 100)
         
         if overall_result["overall_success"]:
-            print("\n🎉 All Gemini API tests passed!")
+            logger.info("\n🎉 All Gemini API tests passed!")
         else:
-            print("\n⚠️ Some Gemini API tests failed")
+            logger.warning("\n⚠️ Some Gemini API tests failed")
             failed_tests = [r for r in self.test_results if not r.get("success", False)]
             for failed_test in failed_tests:
-                print(f"  ❌ {failed_test.get('test', 'unknown')}: {failed_test.get('error', 'unknown error')}")
+                logger.error("  ❌ %s: %s", failed_test.get('test', 'unknown'), failed_test.get('error', 'unknown error'))
         
         return overall_result
     
     def save_results(self, filename: str = None) -> str:
         """Save test results to JSON file"""
+        now = datetime.now()
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"gemini_api_test_results_{timestamp}.json"
+            filename = f"gemini_api_test_results_{now.strftime('%Y%m%d_%H%M%S')}.json"
         
         results_data = {
             "test_session": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "api_key_configured": bool(self.api_key),
                 "genai_available": GENAI_AVAILABLE,
                 "echoverse_modules_available": ECHOVERSE_MODULES_AVAILABLE
@@ -626,12 +945,15 @@ class GeminiAPIValidator:
         }
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(results_data, f, indent=2, ensure_ascii=False)
-            print(f"📄 Test results saved to: {filename}")
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(results_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(results_data, indent=2, ensure_ascii=False).encode('utf-8')
+            Path(filename).write_bytes(data)
+            logger.info("📄 Test results saved to: %s", filename)
             return filename
         except Exception as e:
-            print(f"❌ Failed to save results: {e}")
+            logger.error("❌ Failed to save results: %s", e)
             return ""
 
 
@@ -643,11 +965,25 @@ def main():
     parser.add_argument("--api-key", help="Gemini API key (or set GEMINI_API_KEY env var)")
     parser.add_argument("--save-results", action="store_true", help="Save results to JSON file")
     parser.add_argument("--quick", action="store_true", help="Run quick connectivity test only")
+    parser.add_argument("--cache", action="store_true",
+                        help="Replay cached responses for repeated prompts (stored next to this script)")
+    parser.add_argument("--model", default=GeminiAPIValidator.DEFAULT_MODEL,
+                        help="Gemini model to validate (1.5+ models receive task instructions as system instructions)")
+    parser.add_argument("--rpm", type=int, default=GeminiAPIValidator.DEFAULT_RPM,
+                        help="Requests per minute allowed for concurrent prompt batches")
+    parser.add_argument("--semantic-cache", action="store_true",
+                        help="Also replay supportive responses for similar inputs (implies --cache)")
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Initialize validator
-    validator = GeminiAPIValidator(api_key=args.api_key)
+    use_cache = args.cache or args.semantic_cache
+    cache_dir = Path(__file__).parent / ".gemini_cache" if use_cache else None
+    validator = GeminiAPIValidator(api_key=args.api_key, cache_dir=cache_dir,
+                                   semantic_cache=args.semantic_cache, rpm=args.rpm,
+                                   model_name=args.model)
     
     if args.quick:
         # Quick test
@@ -658,6 +994,8 @@ def main():
         result = validator.run_all_tests()
         success = result.get("overall_success", False)
     
+    validator.close()
+    
     # Save results if requested
     if args.save_results:
         validator.save_results()
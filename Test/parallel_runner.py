@@ -0,0 +1,107 @@
+"""
+Helpers for running test classes in parallel worker processes.
+Used by the test modules that can be run directly as scripts.
+"""
+
+import importlib
+import io
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class _PassedSoFarSuite(unittest.TestSuite):
+    """Suite that only runs if every test before it in the same run passed"""
+    
+    def run(self, result, debug=False):
+        if not result.wasSuccessful():
+            return result
+        return super().run(result, debug)
+
+
+def discover_test_classes(module: ModuleType) -> List[str]:
+    """
+    Find the test classes of a module.
+    
+    Args:
+        module: Module to search
+    
+    Returns:
+        List of names of TestCase classes in the module that have tests
+    """
+    names = []
+    for suite in unittest.TestLoader().loadTestsFromModule(module):
+        for test in suite:
+            names.append(type(test).__name__)
+            break
+    return names
+
+
+def _load_tests(module_name: str, class_name: str, smoke_test: Optional[str] = None) -> unittest.TestSuite:
+    """
+    Load the tests of one test class.
+    
+    Args:
+        module_name: Name of the module defining the class
+        class_name: Name of the test class
+        smoke_test: "Class.test" to run first; the rest of its class only runs if it passes
+    
+    Returns:
+        unittest.TestSuite: Tests to run
+    """
+    loader = unittest.TestLoader()
+    module = importlib.import_module(module_name)
+    tests = loader.loadTestsFromTestCase(getattr(module, class_name))
+    if not smoke_test or not smoke_test.startswith(class_name + "."):
+        return tests
+    
+    # Nested suites share the class fixtures, so setUpClass still runs once
+    smoke = loader.loadTestsFromName(smoke_test, module=module)
+    smoke_id = next(iter(smoke)).id()
+    rest = _PassedSoFarSuite(test for test in tests if test.id() != smoke_id)
+    return unittest.TestSuite([smoke, rest])
+
+
+def run_test_class(module_name: str, class_name: str, smoke_test: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run one test class in a worker process.
+    
+    Args:
+        module_name: Name of the module defining the class
+        class_name: Name of the test class
+        smoke_test: Gate the class on this test (see _load_tests)
+    
+    Returns:
+        dict: Runner output and picklable failure/error/skip details
+    """
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(verbosity=2, stream=stream)
+    result = runner.run(_load_tests(module_name, class_name, smoke_test))
+    return {
+        "output": stream.getvalue(),
+        "tests_run": result.testsRun,
+        "failures": [(str(test), traceback) for test, traceback in result.failures],
+        "errors": [(str(test), traceback) for test, traceback in result.errors],
+        "skipped": len(result.skipped)
+    }
+
+
+def run_test_classes(module_name: str, class_names: Sequence[str], smoke_test: Optional[str] = None,
+                     max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Run test classes in parallel, one worker process per class.
+    
+    Args:
+        module_name: Name of the module defining the classes (__name__ of a script)
+        class_names: Names of the test classes
+        smoke_test: Gate its class on this test (see _load_tests)
+        max_workers: Maximum number of worker processes (defaults to one per class)
+    
+    Returns:
+        One run_test_class result per class, in the given order
+    """
+    count = len(class_names)
+    with ProcessPoolExecutor(max_workers=max_workers or count) as executor:
+        return list(executor.map(run_test_class, [module_name] * count, class_names,
+                                 [smoke_test] * count))
@@ -7,96 +7,160 @@ Tests the complete pipeline: authentication → input processing → content gen
 import sys
 import os
 import tempfile
-import shutil
+import time
 from pathlib import Path
-from datetime import datetime
 import json
+import logging
+import importlib
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the app directory to the Python path
 app_dir = Path(__file__).parent.parent / "app"
 sys.path.insert(0, str(app_dir))
 
-# Import all modules for testing
+logger = logging.getLogger(__name__)
+
+# Data models have no third-party dependencies; every other app module is
+# imported by the test class that needs it
+from data_models import User, ProcessedInput, GeneratedContent, Interaction, InputType
+from parallel_runner import run_test_classes
+
+
+def _require(module_name: str):
+    """
+    Import an app module for a test class.
+    
+    Args:
+        module_name: Name of the module in the app directory
+        
+    Returns:
+        The imported module
+        
+    Raises:
+        unittest.SkipTest: If the module or one of its dependencies is missing
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as e:
+        raise unittest.SkipTest(f"Required module {module_name} not available: {e}")
+
+
+# User records and interactions are written to an in-memory filesystem when
+# pyfakefs is installed; set ECHOVERSE_REAL_FS=1 to exercise the real disk
 try:
-    from streamlit_workspace import StreamlitApp
-    from content_generator import ContentGenerator, MockGenerator, GeminiGenerator
-    from audio_processor import AudioManager, TTSProcessor, AudioRemixer
-    from input_processor import InputProcessor
-    from storage_manager import StorageManager
-    from auth_manager import UserManager
-    from data_models import User, ProcessedInput, GeneratedContent, Interaction, InputType, AudioFile
-    from model_manager import ModelRegistry, get_model_registry
-    from model_selector import ModelSelector
-    from environment_checker import check_environment
-    from defensive_system import DefensiveSystem
-    IMPORTS_SUCCESSFUL = True
-except ImportError as e:
-    print(f"❌ Import error: {e}")
-    IMPORTS_SUCCESSFUL = False
+    from pyfakefs.fake_filesystem_unittest import TestCase as FakeFilesystemTestCase
+    PYFAKEFS_AVAILABLE = True
+except ImportError:
+    PYFAKEFS_AVAILABLE = False
+
+USE_FAKE_FILESYSTEM = PYFAKEFS_AVAILABLE and not os.getenv("ECHOVERSE_REAL_FS")
+StorageTestCase = FakeFilesystemTestCase if USE_FAKE_FILESYSTEM else unittest.TestCase
+
+
+# Benchmark limits in seconds; CI can tighten them through the environment
+MAX_GENERATION_SECONDS = float(os.getenv("ECHOVERSE_MAX_GENERATION_SECONDS", "30"))
+MAX_STORAGE_SECONDS = float(os.getenv("ECHOVERSE_MAX_STORAGE_SECONDS", "5"))
 
 
-class EchoVerseEndToEndTest(unittest.TestCase):
+class EchoVerseEndToEndTest(StorageTestCase):
     """End-to-end testing of the complete EchoVerse pipeline"""
     
+    # Mock input payloads shared by the input workflow tests. The drawing
+    # stays a plain dict because the canvas processor dispatches on dict
+    MOCK_AUDIO_DATA = b"fake_audio_data_for_testing"
+    MOCK_DRAWING_DATA = {
+        "objects": [{"type": "path", "stroke": "#000000"}],
+        "background": "#ffffff"
+    }
+    
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
-        if not IMPORTS_SUCCESSFUL:
-            cls.skipTest(cls, "Required modules not available")
-        
-        # Create temporary directory for testing
-        cls.test_dir = tempfile.mkdtemp(prefix="echoverse_test_")
+        content_generator = _require("content_generator")
+        audio_processor = _require("audio_processor")
+        input_processor = _require("input_processor")
+        storage_manager = _require("storage_manager")
+        auth_manager = _require("auth_manager")
+        cls.StorageManager = storage_manager.StorageManager
+        
+        # Components are built once per class; tests only change them
+        # through patch.object, which restores the original on exit
+        cls.shared_input_processor = input_processor.InputProcessor()
+        # Gemini and OpenAI clients go through gRPC/httpx, so leave them out of
+        # the generator chain rather than waiting on connection timeouts when
+        # offline; ECHOVERSE_TEST_ONLINE=1 keeps them for live runs
+        offline_env = {} if os.getenv("ECHOVERSE_TEST_ONLINE") else {"GEMINI_API_KEY": "", "OPENAI_API_KEY": ""}
+        with patch.dict(os.environ, offline_env):
+            cls.shared_content_generator = content_generator.ContentGenerator()
+        cls.shared_audio_manager = audio_processor.AudioManager()
+        # Capabilities don't change during the run; probe them once
+        cls.audio_capabilities = cls.shared_audio_manager.is_audio_processing_available()
+        
+        # Components may read model and engine files from the real disk, so
+        # the fake filesystem is only switched on once they exist
+        if USE_FAKE_FILESYSTEM:
+            cls.setUpClassPyfakefs()
+        
+        # Create temporary directory for testing; class cleanups remove it
+        # even if the rest of setUpClass raises
+        cls._tmp_ctx = tempfile.TemporaryDirectory(prefix="echoverse_test_")
+        cls.addClassCleanup(cls._tmp_ctx.cleanup)
+        cls.test_dir = cls._tmp_ctx.name
         cls.test_users_dir = Path(cls.test_dir) / "users"
         cls.test_users_dir.mkdir(exist_ok=True)
         
-        print(f"🧪 Test environment created: {cls.test_dir}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up test environment"""
-        if hasattr(cls, 'test_dir') and os.path.exists(cls.test_dir):
-            shutil.rmtree(cls.test_dir)
-            print(f"🧹 Test environment cleaned up")
-    
-    def setUp(self):
-        """Set up individual test"""
-        self.test_user = User(
+        # Register and authenticate once; password hashing is the slowest
+        # part of setup and every workflow test can share the same user
+        cls.test_user = User(
             nickname="testuser",
             password="testpass123"
         )
+        cls.shared_user_manager = auth_manager.UserManager(users_dir=str(cls.test_users_dir))
+        cls.registration_result = cls.shared_user_manager.register_user(
+            cls.test_user.nickname,
+            cls.test_user.password
+        )
+        cls.shared_authenticated_user = cls.shared_user_manager.authenticate_user(
+            cls.test_user.nickname,
+            cls.test_user.password
+        )
+        
+        logger.debug("🧪 Test environment created: %s", cls.test_dir)
+    
+    def setUp(self):
+        """Set up individual test"""
+        self.user_manager = self.shared_user_manager
+        self.authenticated_user = self.shared_authenticated_user
         
         # Initialize components
-        self.user_manager = UserManager(users_dir=str(self.test_users_dir))
-        self.storage_manager = StorageManager(users_dir=str(self.test_users_dir))
-        self.input_processor = InputProcessor()
-        self.content_generator = ContentGenerator()
-        self.audio_manager = AudioManager()
+        self.storage_manager = self.StorageManager(users_dir=str(self.test_users_dir))
+        self.input_processor = self.shared_input_processor
+        self.content_generator = self.shared_content_generator
+        self.audio_manager = self.shared_audio_manager
     
     def test_complete_text_workflow(self):
         """Test complete workflow with text input"""
-        print("\n🔄 Testing complete text workflow...")
+        logger.debug("🔄 Testing complete text workflow...")
         
-        # Step 1: User registration and authentication
-        print("  📝 Testing user registration...")
-        registration_success = self.user_manager.register_user(
-            self.test_user.nickname, 
-            self.test_user.password
-        )
-        self.assertTrue(registration_success, "User registration should succeed")
+        # Step 1: User registration and authentication (performed in setUpClass)
+        logger.debug("  📝 Testing user registration...")
+        self.assertTrue(self.registration_result, "User registration should succeed")
         
         # Step 2: User authentication
-        print("  🔐 Testing user authentication...")
-        authenticated_user = self.user_manager.authenticate_user(
-            self.test_user.nickname, 
-            self.test_user.password
-        )
+        logger.debug("  🔐 Testing user authentication...")
+        authenticated_user = self.authenticated_user
         self.assertIsNotNone(authenticated_user, "User authentication should succeed")
         self.assertEqual(authenticated_user.nickname, self.test_user.nickname)
         
         # Step 3: Input processing
-        print("  📥 Testing input processing...")
+        logger.debug("  📥 Testing input processing...")
         test_input = "I'm feeling overwhelmed with work today and need some encouragement."
         processed_input = self.input_processor.process_text_input(test_input)
         
@@ -105,7 +169,7 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         self.assertEqual(processed_input.input_type, InputType.TEXT)
         
         # Step 4: Content generation
-        print("  🤖 Testing content generation...")
+        logger.debug("  🤖 Testing content generation...")
         generated_content = self.content_generator.generate_support_and_poem(processed_input)
         
         self.assertIsNotNone(generated_content, "Content generation should succeed")
@@ -115,10 +179,8 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         self.assertTrue(len(generated_content.poem) > 0)
         
         # Step 5: Audio processing (if available)
-        print("  🔊 Testing audio processing...")
-        audio_capabilities = self.audio_manager.is_audio_processing_available()
-        
-        if audio_capabilities.get('any_tts', False):
+        logger.debug("  🔊 Testing audio processing...")
+        if self.audio_capabilities.get('any_tts', False):
             audio_result = self.audio_manager.process_text_to_audio(
                 generated_content.supportive_statement[:100],  # Limit for testing
                 create_remix=False
@@ -127,10 +189,10 @@ class EchoVerseEndToEndTest(unittest.TestCase):
             self.assertIsNotNone(audio_result, "Audio processing should succeed")
             self.assertIn('speech', audio_result)
         else:
-            print("    ⚠️ Audio processing not available, skipping audio tests")
+            logger.debug("    ⚠️ Audio processing not available, skipping audio tests")
         
         # Step 6: Storage
-        print("  💾 Testing storage...")
+        logger.debug("  💾 Testing storage...")
         interaction = Interaction(
             input_data=processed_input,
             generated_content=generated_content
@@ -140,30 +202,25 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         self.assertIsNotNone(saved_path, "Interaction storage should succeed")
         
         # Step 7: History retrieval
-        print("  📚 Testing history retrieval...")
+        logger.debug("  📚 Testing history retrieval...")
         user_history = self.storage_manager.load_user_history(authenticated_user)
         self.assertIsInstance(user_history, list)
         self.assertGreater(len(user_history), 0, "History should contain saved interaction")
         
-        print("  ✅ Complete text workflow test passed!")
+        logger.debug("  ✅ Complete text workflow test passed!")
         return True
     
     def test_audio_input_workflow(self):
         """Test workflow with audio input (mocked)"""
-        print("\n🎵 Testing audio input workflow...")
+        logger.debug("🎵 Testing audio input workflow...")
         
-        # Register user
-        self.user_manager.register_user(self.test_user.nickname, self.test_user.password)
-        user = self.user_manager.authenticate_user(self.test_user.nickname, self.test_user.password)
-        
-        # Mock audio file data
-        mock_audio_data = b"fake_audio_data_for_testing"
+        user = self.authenticated_user
         
         # Process audio input
         with patch.object(self.input_processor, '_transcribe_audio') as mock_transcribe:
             mock_transcribe.return_value = "This is a transcribed audio message about feeling happy."
             
-            processed_input = self.input_processor.process_audio_input(mock_audio_data)
+            processed_input = self.input_processor.process_audio_input(self.MOCK_AUDIO_DATA)
             
             self.assertIsNotNone(processed_input)
             self.assertEqual(processed_input.input_type, InputType.AUDIO)
@@ -181,25 +238,17 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         saved_path = self.storage_manager.save_interaction(user, interaction)
         self.assertIsNotNone(saved_path)
         
-        print("  ✅ Audio input workflow test passed!")
+        logger.debug("  ✅ Audio input workflow test passed!")
         return True
     
     def test_drawing_input_workflow(self):
         """Test workflow with drawing input (mocked)"""
-        print("\n🎨 Testing drawing input workflow...")
-        
-        # Register user
-        self.user_manager.register_user(self.test_user.nickname, self.test_user.password)
-        user = self.user_manager.authenticate_user(self.test_user.nickname, self.test_user.password)
+        logger.debug("🎨 Testing drawing input workflow...")
         
-        # Mock drawing data
-        mock_drawing_data = {
-            "objects": [{"type": "path", "stroke": "#000000"}],
-            "background": "#ffffff"
-        }
+        user = self.authenticated_user
         
         # Process drawing input
-        processed_input = self.input_processor.process_drawing_input(mock_drawing_data)
+        processed_input = self.input_processor.process_drawing_input(self.MOCK_DRAWING_DATA)
         
         self.assertIsNotNone(processed_input)
         self.assertEqual(processed_input.input_type, InputType.DRAWING)
@@ -209,81 +258,78 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         generated_content = self.content_generator.generate_support_and_poem(processed_input)
         self.assertIsNotNone(generated_content)
         
-        print("  ✅ Drawing input workflow test passed!")
+        logger.debug("  ✅ Drawing input workflow test passed!")
         return True
     
-    def test_fallback_systems(self):
+    # Force Gemini to fail, should fallback to Mock; the targets are resolved
+    # when the test runs, after setUpClass has imported content_generator
+    @patch('content_generator.GeminiGenerator.is_available', return_value=True)
+    @patch('content_generator.GeminiGenerator.generate_support_and_poem',
+           side_effect=Exception("API Error"))
+    def test_fallback_systems(self, mock_gemini, mock_available):
         """Test fallback systems and error handling"""
-        print("\n🛡️ Testing fallback systems...")
+        logger.debug("🛡️ Testing fallback systems...")
         
         # Test content generation fallback
-        print("  🔄 Testing content generation fallback...")
+        logger.debug("  🔄 Testing content generation fallback...")
         
-        # Force Gemini to fail, should fallback to Mock
-        with patch.object(GeminiGenerator, 'generate_support_and_poem') as mock_gemini:
-            mock_gemini.side_effect = Exception("API Error")
-            
-            test_input = ProcessedInput(
-                content="Test fallback content",
-                input_type=InputType.TEXT
-            )
-            
-            result = self.content_generator.generate_support_and_poem(test_input)
-            self.assertIsNotNone(result, "Should fallback to mock generator")
-            self.assertEqual(result.generation_metadata.get("generator"), "mock")
+        # The shared generator leaves Gemini out of its chain, so build one
+        # with a dummy key; no request is made since the call is patched
+        with patch.dict(os.environ, {"GEMINI_API_KEY": "dummy-key", "OPENAI_API_KEY": ""}):
+            content_generator = _require("content_generator").ContentGenerator()
+        self.assertEqual(content_generator.generators[0].get_generator_name(), "gemini")
         
-        # Test audio processing fallback
-        print("  🔊 Testing audio processing fallback...")
-        audio_capabilities = self.audio_manager.is_audio_processing_available()
+        test_input = ProcessedInput(
+            content="Test fallback content",
+            input_type=InputType.TEXT
+        )
         
-        if audio_capabilities.get('pyttsx3_tts', False):
+        result = content_generator.generate_support_and_poem(test_input)
+        mock_gemini.assert_called_once()
+        self.assertIsNotNone(result, "Should fallback to mock generator")
+        self.assertEqual(result.generation_metadata.get("generator"), "mock")
+        
+        # Test audio processing fallback
+        logger.debug("  🔊 Testing audio processing fallback...")
+        if self.audio_capabilities.get('pyttsx3_tts', False):
             # Test with ElevenLabs disabled
             with patch.object(self.audio_manager.tts_processor, 'elevenlabs_api_key', None):
                 result = self.audio_manager.process_text_to_audio("Test fallback audio")
                 if result and result.get('speech'):
                     self.assertEqual(result['speech'].metadata.get('provider'), 'pyttsx3')
         
-        print("  ✅ Fallback systems test passed!")
+        logger.debug("  ✅ Fallback systems test passed!")
         return True
     
     def test_data_validation(self):
         """Test data validation and integrity"""
-        print("\n🔍 Testing data validation...")
-        
-        # Test invalid user data
-        with self.assertRaises(ValueError):
-            User(nickname="", password="test")
-        
-        with self.assertRaises(ValueError):
-            User(nickname="test", password="")
-        
-        with self.assertRaises(ValueError):
-            User(nickname="a", password="test")  # Too short nickname
-        
-        # Test invalid processed input
-        with self.assertRaises(ValueError):
-            ProcessedInput(content="", input_type=InputType.TEXT)
-        
-        with self.assertRaises(ValueError):
-            ProcessedInput(content="test", input_type="invalid")
-        
-        # Test invalid generated content
-        with self.assertRaises(ValueError):
-            GeneratedContent(supportive_statement="", poem="test")
-        
-        with self.assertRaises(ValueError):
-            GeneratedContent(supportive_statement="test", poem="")
-        
-        print("  ✅ Data validation test passed!")
+        logger.debug("🔍 Testing data validation...")
+        
+        invalid_cases = [
+            # Invalid user data
+            (User, {"nickname": "", "password": "test"}),
+            (User, {"nickname": "test", "password": ""}),
+            (User, {"nickname": "a", "password": "test"}),  # Too short nickname
+            # Invalid processed input
+            (ProcessedInput, {"content": "", "input_type": InputType.TEXT}),
+            (ProcessedInput, {"content": "test", "input_type": "invalid"}),
+            # Invalid generated content
+            (GeneratedContent, {"supportive_statement": "", "poem": "test"}),
+            (GeneratedContent, {"supportive_statement": "test", "poem": ""}),
+        ]
+        
+        for model, kwargs in invalid_cases:
+            with self.subTest(model=model.__name__, **kwargs), self.assertRaises(ValueError):
+                model(**kwargs)
+        
+        logger.debug("  ✅ Data validation test passed!")
         return True
     
     def test_storage_integrity(self):
         """Test storage system integrity"""
-        print("\n💾 Testing storage integrity...")
+        logger.debug("💾 Testing storage integrity...")
         
-        # Register user and create interaction
-        self.user_manager.register_user(self.test_user.nickname, self.test_user.password)
-        user = self.user_manager.authenticate_user(self.test_user.nickname, self.test_user.password)
+        user = self.authenticated_user
         
         # Create test interaction
         processed_input = ProcessedInput(
@@ -303,40 +349,42 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         saved_path = self.storage_manager.save_interaction(user, interaction)
         self.assertIsNotNone(saved_path)
         
-        # Verify files were created
+        # Verify files were created; one directory read lists them all
         interaction_dir = Path(saved_path)
-        self.assertTrue(interaction_dir.exists())
-        self.assertTrue((interaction_dir / "support.txt").exists())
-        self.assertTrue((interaction_dir / "poem.txt").exists())
-        self.assertTrue((interaction_dir / "meta.json").exists())
+        self.assertTrue(interaction_dir.is_dir())
+        entries = {entry.name for entry in os.scandir(interaction_dir)}
+        self.assertIn("support.txt", entries)
+        self.assertIn("poem.txt", entries)
+        self.assertIn("meta.json", entries)
         
         # Load and verify content
-        with open(interaction_dir / "support.txt", 'r', encoding='utf-8') as f:
-            saved_support = f.read()
+        saved_support = (interaction_dir / "support.txt").read_text(encoding='utf-8')
         self.assertEqual(saved_support, generated_content.supportive_statement)
         
-        with open(interaction_dir / "poem.txt", 'r', encoding='utf-8') as f:
-            saved_poem = f.read()
+        saved_poem = (interaction_dir / "poem.txt").read_text(encoding='utf-8')
         self.assertEqual(saved_poem, generated_content.poem)
         
         # Load metadata
-        with open(interaction_dir / "meta.json", 'r', encoding='utf-8') as f:
-            metadata = json.load(f)
+        raw_metadata = (interaction_dir / "meta.json").read_bytes()
+        metadata = orjson.loads(raw_metadata) if ORJSON_AVAILABLE else json.loads(raw_metadata)
         self.assertEqual(metadata["input"]["content"], processed_input.content)
         
-        print("  ✅ Storage integrity test passed!")
+        logger.debug("  ✅ Storage integrity test passed!")
         return True
     
     def test_performance_benchmarks(self):
         """Test performance benchmarks"""
-        print("\n⚡ Testing performance benchmarks...")
+        logger.debug("⚡ Testing performance benchmarks...")
+        
+        # Coverage and debuggers slow everything down several times over,
+        # so wall-clock limits would only produce flaky failures
+        if sys.gettrace() is not None or os.getenv("COVERAGE_RUN"):
+            self.skipTest("Benchmarks disabled under a tracer or coverage")
         
-        # Register user
-        self.user_manager.register_user(self.test_user.nickname, self.test_user.password)
-        user = self.user_manager.authenticate_user(self.test_user.nickname, self.test_user.password)
+        user = self.authenticated_user
         
         # Benchmark content generation
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         test_input = ProcessedInput(
             content="Performance test input for benchmarking",
@@ -345,15 +393,16 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         
         generated_content = self.content_generator.generate_support_and_poem(test_input)
         
-        generation_time = (datetime.now() - start_time).total_seconds()
+        generation_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        self.assertLess(generation_time, 30.0, "Content generation should complete within 30 seconds")
+        self.assertLess(generation_time, MAX_GENERATION_SECONDS,
+                        f"Content generation should complete within {MAX_GENERATION_SECONDS} seconds")
         self.assertIsNotNone(generated_content)
         
-        print(f"  📊 Content generation time: {generation_time:.2f}s")
+        logger.debug("  📊 Content generation time: %.2fs", generation_time)
         
         # Benchmark storage
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         interaction = Interaction(
             input_data=test_input,
@@ -361,29 +410,32 @@ class EchoVerseEndToEndTest(unittest.TestCase):
         )
         
         saved_path = self.storage_manager.save_interaction(user, interaction)
-        storage_time = (datetime.now() - start_time).total_seconds()
+        storage_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        self.assertLess(storage_time, 5.0, "Storage should complete within 5 seconds")
+        self.assertLess(storage_time, MAX_STORAGE_SECONDS,
+                        f"Storage should complete within {MAX_STORAGE_SECONDS} seconds")
         self.assertIsNotNone(saved_path)
         
-        print(f"  📊 Storage time: {storage_time:.2f}s")
-        print("  ✅ Performance benchmarks test passed!")
+        logger.debug("  📊 Storage time: %.2fs", storage_time)
+        logger.debug("  ✅ Performance benchmarks test passed!")
         return True
 
 
 class ModelSystemTest(unittest.TestCase):
     """Test local model management system"""
     
-    def setUp(self):
-        """Set up model system tests"""
-        if not IMPORTS_SUCCESSFUL:
-            self.skipTest("Required modules not available")
+    @classmethod
+    def setUpClass(cls):
+        """Import the model management modules"""
+        cls.model_manager = _require("model_manager")
+        cls.model_selector = _require("model_selector")
+        cls.environment_checker = _require("environment_checker")
     
     def test_model_registry(self):
         """Test model registry functionality"""
-        print("\n🤖 Testing model registry...")
+        logger.debug("🤖 Testing model registry...")
         
-        registry = get_model_registry()
+        registry = self.model_manager.get_model_registry()
         self.assertIsNotNone(registry)
         
         # Test getting all models
@@ -401,23 +453,22 @@ class ModelSystemTest(unittest.TestCase):
         self.assertIsInstance(cpu_models, dict)
         self.assertGreater(len(cpu_models), 0, "Should have CPU-compatible models")
         
-        print("  ✅ Model registry test passed!")
+        logger.debug("  ✅ Model registry test passed!")
     
     def test_model_selector(self):
         """Test model selection logic"""
-        print("\n🎯 Testing model selector...")
+        logger.debug("🎯 Testing model selector...")
         
         # Create temporary config directory
         with tempfile.TemporaryDirectory() as temp_dir:
-            selector = ModelSelector(
+            selector = self.model_selector.ModelSelector(
                 cache_dir=temp_dir + "/models",
                 config_dir=temp_dir + "/config"
             )
             
             # Test getting candidates
-            from model_selector import ModelSelectionCriteria, SelectionStrategy
-            criteria = ModelSelectionCriteria(
-                strategy=SelectionStrategy.MINIMAL_RESOURCES,
+            criteria = self.model_selector.ModelSelectionCriteria(
+                strategy=self.model_selector.SelectionStrategy.MINIMAL_RESOURCES,
                 max_size_gb=5.0
             )
             
@@ -431,13 +482,13 @@ class ModelSystemTest(unittest.TestCase):
                 self.assertIsNotNone(best_model.model_spec)
                 self.assertLessEqual(best_model.model_spec.size_gb, 5.0)
             
-            print("  ✅ Model selector test passed!")
+            logger.debug("  ✅ Model selector test passed!")
     
     def test_environment_checker(self):
         """Test environment checking"""
-        print("\n🔧 Testing environment checker...")
+        logger.debug("🔧 Testing environment checker...")
         
-        env_report = check_environment()
+        env_report = self.environment_checker.check_environment()
         self.assertIsNotNone(env_report)
         self.assertIsNotNone(env_report.hardware)
         self.assertIsNotNone(env_report.dependencies)
@@ -450,19 +501,19 @@ class ModelSystemTest(unittest.TestCase):
         # Verify dependency checking
         self.assertIsInstance(env_report.dependencies, list)
         
-        print(f"  📊 GPU Available: {env_report.hardware.has_gpu}")
-        print(f"  📊 RAM Available: {env_report.hardware.available_ram_gb:.1f}GB")
-        print(f"  📊 Dependencies Checked: {len(env_report.dependencies)}")
-        print("  ✅ Environment checker test passed!")
+        logger.debug("  📊 GPU Available: %s", env_report.hardware.has_gpu)
+        logger.debug("  📊 RAM Available: %.1fGB", env_report.hardware.available_ram_gb)
+        logger.debug("  📊 Dependencies Checked: %s", len(env_report.dependencies))
+        logger.debug("  ✅ Environment checker test passed!")
     
     def test_local_model_integration(self):
         """Test local model integration with content generation"""
-        print("\n🔗 Testing local model integration...")
+        logger.debug("🔗 Testing local model integration...")
         
         try:
             # Test model recommendation for current hardware
-            env_report = check_environment()
-            registry = get_model_registry()
+            env_report = self.environment_checker.check_environment()
+            registry = self.model_manager.get_model_registry()
             
             # Get hardware-appropriate model recommendations
             recommendations = registry.get_recommended_models_for_hardware(
@@ -472,18 +523,17 @@ class ModelSystemTest(unittest.TestCase):
             )
             
             self.assertIsInstance(recommendations, list)
-            print(f"  📊 Found {len(recommendations)} compatible models")
+            logger.debug("  📊 Found %s compatible models", len(recommendations))
             
             if recommendations:
                 best_model = recommendations[0]
-                print(f"  🏆 Best model: {best_model.name} ({best_model.size_gb:.1f}GB)")
-                print(f"    Quality: {best_model.quality_score}/10")
-                print(f"    Speed: {best_model.speed_score}/10")
-                print(f"    CPU Compatible: {best_model.is_cpu_compatible}")
+                logger.debug("  🏆 Best model: %s (%.1fGB)", best_model.name, best_model.size_gb)
+                logger.debug("    Quality: %s/10", best_model.quality_score)
+                logger.debug("    Speed: %s/10", best_model.speed_score)
+                logger.debug("    CPU Compatible: %s", best_model.is_cpu_compatible)
                 
                 # Test model validation
-                from model_manager import validate_model_compatibility
-                is_compatible, reason = validate_model_compatibility(
+                is_compatible, reason = self.model_manager.validate_model_compatibility(
                     best_model.name,
                     env_report.hardware.has_gpu,
                     env_report.hardware.total_vram_gb,
@@ -491,12 +541,12 @@ class ModelSystemTest(unittest.TestCase):
                 )
                 
                 self.assertTrue(is_compatible, f"Best model should be compatible: {reason}")
-                print(f"  ✅ Model compatibility validated: {reason}")
+                logger.debug("  ✅ Model compatibility validated: %s", reason)
             
-            print("  ✅ Local model integration test passed!")
+            logger.debug("  ✅ Local model integration test passed!")
             
         except Exception as e:
-            print(f"  ⚠️ Local model integration test failed: {e}")
+            logger.debug("  ⚠️ Local model integration test failed: %s", e)
             # Don't fail the test if model modules aren't available
             pass
 
@@ -504,17 +554,20 @@ class ModelSystemTest(unittest.TestCase):
 class DefensiveSystemTest(unittest.TestCase):
     """Test defensive programming systems"""
     
-    def setUp(self):
-        """Set up defensive system tests"""
-        if not IMPORTS_SUCCESSFUL:
-            self.skipTest("Required modules not available")
+    @classmethod
+    def setUpClass(cls):
+        """Import the defensive system module"""
+        defensive_system = _require("defensive_system")
+        if not hasattr(defensive_system, "DefensiveSystem"):
+            raise unittest.SkipTest("defensive_system does not provide DefensiveSystem")
+        cls.DefensiveSystem = defensive_system.DefensiveSystem
     
     def test_defensive_system(self):
         """Test defensive programming features"""
-        print("\n🛡️ Testing defensive system...")
+        logger.debug("🛡️ Testing defensive system...")
         
         try:
-            defensive_system = DefensiveSystem()
+            defensive_system = self.DefensiveSystem()
             
             # Test dependency checking
             deps_available = defensive_system.check_dependencies()
@@ -524,52 +577,61 @@ class DefensiveSystemTest(unittest.TestCase):
             degradation_status = defensive_system.get_degradation_status()
             self.assertIsInstance(degradation_status, dict)
             
-            print("  ✅ Defensive system test passed!")
+            logger.debug("  ✅ Defensive system test passed!")
         except ImportError:
-            print("  ⚠️ Defensive system module not available, skipping")
+            logger.debug("  ⚠️ Defensive system module not available, skipping")
+
+
+# Test classes are independent (each has its own fixtures), so each one runs
+# in its own worker process
+COMPREHENSIVE_TEST_CLASSES = ("EchoVerseEndToEndTest", "ModelSystemTest", "DefensiveSystemTest")
+
+# The smoke test is the full text workflow; it runs first in its class so the
+# rest of the class reuses its setUpClass fixtures
+SMOKE_TEST = "EchoVerseEndToEndTest.test_complete_text_workflow"
 
 
-def run_comprehensive_tests():
-    """Run all comprehensive tests"""
+def run_comprehensive_tests(smoke_first: bool = False):
+    """
+    Run all comprehensive tests.
+    
+    Args:
+        smoke_first: Run the smoke test before the rest of its class and skip
+            that class's remaining tests if it fails
+    """
     print("🚀 Starting EchoVerse Comprehensive Test Suite")
     print("=" * 80)
     
-    if not IMPORTS_SUCCESSFUL:
-        print("❌ Cannot run tests - import failures detected")
-        return False
+    # Run test classes in parallel; output is printed per class in suite order
+    results = run_test_classes(__name__, COMPREHENSIVE_TEST_CLASSES,
+                               SMOKE_TEST if smoke_first else None)
     
-    # Create test suite
-    test_suite = unittest.TestSuite()
+    for result in results:
+        sys.stdout.write(result["output"])
     
-    # Add test cases
-    test_suite.addTest(unittest.makeSuite(EchoVerseEndToEndTest))
-    test_suite.addTest(unittest.makeSuite(ModelSystemTest))
-    test_suite.addTest(unittest.makeSuite(DefensiveSystemTest))
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
-    result = runner.run(test_suite)
+    failures = [failure for result in results for failure in result["failures"]]
+    errors = [error for result in results for error in result["errors"]]
     
     # Print summary
     print("\n" + "=" * 80)
     print("📊 TEST SUMMARY")
     print("=" * 80)
-    print(f"Tests Run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped) if hasattr(result, 'skipped') else 0}")
+    print(f"Tests Run: {sum(result['tests_run'] for result in results)}")
+    print(f"Failures: {len(failures)}")
+    print(f"Errors: {len(errors)}")
+    print(f"Skipped: {sum(result['skipped'] for result in results)}")
     
-    success = len(result.failures) == 0 and len(result.errors) == 0
+    success = len(failures) == 0 and len(errors) == 0
     print(f"\nOverall Result: {'🎉 ALL TESTS PASSED' if success else '❌ SOME TESTS FAILED'}")
     
-    if result.failures:
+    if failures:
         print("\n❌ FAILURES:")
-        for test, traceback in result.failures:
+        for test, traceback in failures:
             print(f"  - {test}: {traceback}")
     
-    if result.errors:
+    if errors:
         print("\n❌ ERRORS:")
-        for test, traceback in result.errors:
+        for test, traceback in errors:
             print(f"  - {test}: {traceback}")
     
     return success
@@ -580,38 +642,9 @@ def run_quick_smoke_test():
     print("💨 Running Quick Smoke Test")
     print("=" * 40)
     
-    if not IMPORTS_SUCCESSFUL:
-        print("❌ Import failures detected")
-        return False
-    
-    try:
-        # Test basic imports and initialization
-        print("📦 Testing imports...")
-        content_generator = ContentGenerator()
-        audio_manager = AudioManager()
-        input_processor = InputProcessor()
-        print("✅ Core components initialized")
-        
-        # Test basic functionality
-        print("🧪 Testing basic functionality...")
-        test_input = ProcessedInput(
-            content="Quick smoke test",
-            input_type=InputType.TEXT
-        )
-        
-        generated_content = content_generator.generate_support_and_poem(test_input)
-        if generated_content:
-            print("✅ Content generation working")
-        else:
-            print("⚠️ Content generation failed")
-            return False
-        
-        print("🎉 Smoke test passed!")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Smoke test failed: {e}")
-        return False
+    suite = unittest.TestLoader().loadTestsFromName(SMOKE_TEST, module=sys.modules[__name__])
+    result = unittest.TextTestRunner(verbosity=2, stream=sys.stdout).run(suite)
+    return result.wasSuccessful()
 
 
 if __name__ == "__main__":
@@ -620,21 +653,18 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="EchoVerse Test Suite")
     parser.add_argument("--smoke", action="store_true", help="Run quick smoke test only")
     parser.add_argument("--comprehensive", action="store_true", help="Run comprehensive test suite")
+    parser.add_argument("--verbose", action="store_true", help="Show per-step progress of each test")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING, format="%(message)s")
     
     if args.smoke:
         success = run_quick_smoke_test()
     elif args.comprehensive:
         success = run_comprehensive_tests()
     else:
-        # Default: run smoke test first, then comprehensive if it passes
+        # Default: smoke test first, then the rest of the suite in the same run
         print("Running default test sequence...")
-        smoke_success = run_quick_smoke_test()
-        if smoke_success:
-            print("\n" + "="*50)
-            success = run_comprehensive_tests()
-        else:
-            success = False
+        success = run_comprehensive_tests(smoke_first=True)
     
     sys.exit(0 if success else 1)
\ No newline at end of file
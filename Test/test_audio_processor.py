@@ -6,6 +6,8 @@ Tests TTS processing, audio remixing, and fallback systems.
 import unittest
 from unittest.mock import Mock, patch, MagicMock, mock_open
 import tempfile
+import shutil
+import threading
 import os
 import sys
 from pathlib import Path
@@ -14,19 +16,37 @@ from pathlib import Path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
 
 from audio_processor import (
-    TTSProcessor, AudioRemixer, AudioManager, Voice,
-    get_default_background_music_path, validate_audio_file, create_silence_audio
+    TTSProcessor, TTSAudioCache, AudioRemixer, AudioManager, Voice,
+    get_default_background_music_path, validate_audio_file, create_silence_audio,
+    NUMPY_AVAILABLE, _TempFilePool, _temp_file_pool
 )
 from data_models import AudioFile
+from parallel_runner import discover_test_classes, run_test_classes
 
 
-class TestTTSProcessor(unittest.TestCase):
+class AudioTestCase(unittest.TestCase):
+    """Base class giving each test class its own default cache directory."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Point the per-user cache directories at a directory private to this class."""
+        cache_home = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cache_home.cleanup)
+        cache_env = patch.dict(os.environ, {"XDG_CACHE_HOME": cache_home.name})
+        cache_env.start()
+        cls.addClassCleanup(cache_env.stop)
+
+
+class TestTTSProcessor(AudioTestCase):
     """Test cases for TTSProcessor class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.tts_processor = TTSProcessor()
-        self.test_text = "Hello, this is a test message for TTS conversion."
+    test_text = "Hello, this is a test message for TTS conversion."
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build one processor for the tests that do not modify it."""
+        super().setUpClass()
+        cls.tts_processor = TTSProcessor()
     
     def test_init_without_api_key(self):
         """Test TTSProcessor initialization without API key."""
@@ -56,6 +76,61 @@ class TestTTSProcessor(unittest.TestCase):
         mock_engine.setProperty.assert_any_call('rate', 150)
         mock_engine.setProperty.assert_any_call('volume', 0.8)
     
+    @patch('audio_processor._pyttsx3_configured_engine', None)
+    @patch('audio_processor._pyttsx3_engine', None)
+    @patch('audio_processor.PYTTSX3_AVAILABLE', True)
+    @patch('audio_processor.pyttsx3', create=True)
+    def test_engine_reused(self, mock_pyttsx3):
+        """Test that processors share one engine, initialized and configured once."""
+        mock_engine = Mock()
+        mock_engine.getProperty.return_value = []
+        mock_pyttsx3.init.return_value = mock_engine
+        
+        first = TTSProcessor()
+        second = TTSProcessor()
+        
+        self.assertIs(first.pyttsx3_engine, second.pyttsx3_engine)
+        mock_pyttsx3.init.assert_called_once()
+        mock_engine.getProperty.assert_called_once_with('voices')
+    
+    def test_concurrent_pyttsx3(self):
+        """Test that concurrent pyttsx3 calls all run on the engine thread."""
+        engine_threads = set()
+        
+        def write_speech(text, path):
+            engine_threads.add(threading.current_thread().name)
+            with open(path, 'wb') as f:
+                f.write(text.encode())
+        
+        processor = TTSProcessor()
+        processor.pyttsx3_engine = Mock()
+        processor.pyttsx3_engine.save_to_file.side_effect = write_speech
+        results = []
+        
+        def speak(i):
+            results.append(processor._pyttsx3_tts(f"Concurrent text {i}", {}))
+        
+        workers = [threading.Thread(target=speak, args=(i,)) for i in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(isinstance(audio, AudioFile) for audio in results))
+        self.assertEqual(len(engine_threads), 1)
+        self.assertTrue(engine_threads.pop().startswith("pyttsx3-engine"))
+        for audio in results:
+            os.unlink(audio.file_path)
+    
+    def test_instance_is_shared(self):
+        """Test that TTSProcessor.instance returns one shared processor."""
+        first = TTSProcessor.instance()
+        second = TTSProcessor.instance()
+        
+        self.assertIs(first, second)
+        self.assertIsInstance(first, TTSProcessor)
+    
     def test_text_to_speech_empty_text(self):
         """Test TTS with empty text."""
         result = self.tts_processor.text_to_speech("")
@@ -64,19 +139,15 @@ class TestTTSProcessor(unittest.TestCase):
         result = self.tts_processor.text_to_speech("   ")
         self.assertIsNone(result)
     
-    @patch('audio_processor.requests')
-    @patch('audio_processor.tempfile')
-    def test_elevenlabs_tts_success(self, mock_tempfile, mock_requests):
+    @patch('audio_processor.requests', create=True)
+    @patch('audio_processor._get_http_session')
+    def test_elevenlabs_tts_success(self, mock_get_session, mock_requests):
         """Test successful ElevenLabs TTS conversion."""
         # Setup mocks
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = b"fake_audio_data"
-        mock_requests.post.return_value = mock_response
-        
-        mock_temp_file = Mock()
-        mock_temp_file.name = "/tmp/test_audio.mp3"
-        mock_tempfile.NamedTemporaryFile.return_value = mock_temp_file
+        mock_response.iter_content.return_value = [b"fake_audio", b"_data"]
+        mock_get_session.return_value.post.return_value = mock_response
         
         processor = TTSProcessor(elevenlabs_api_key="test_key")
         
@@ -86,6 +157,60 @@ class TestTTSProcessor(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIsInstance(result, AudioFile)
         self.assertEqual(result.metadata["provider"], "elevenlabs")
+        self.assertTrue(mock_get_session.return_value.post.call_args.kwargs["stream"])
+        self.assertEqual(Path(result.file_path).read_bytes(), b"fake_audio_data")
+        os.unlink(result.file_path)
+    
+    def _streaming_processor(self, mock_get_session, chunks):
+        """Build a processor whose ElevenLabs stream yields chunks (raising any exception among them)."""
+        def iter_content(chunk_size):
+            for chunk in chunks:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield chunk
+        
+        response = Mock(status_code=200)
+        response.iter_content.side_effect = iter_content
+        mock_get_session.return_value.post.return_value.__enter__.return_value = response
+        
+        processor = TTSProcessor()
+        processor.elevenlabs_api_key = "test_key"  # The constructor disables ElevenLabs
+        processor.text_to_speech = Mock()
+        return processor
+    
+    @patch('audio_processor.REQUESTS_AVAILABLE', True)
+    @patch('audio_processor._get_http_session')
+    def test_text_to_speech_stream_elevenlabs(self, mock_get_session):
+        """Test streaming yields the ElevenLabs chunks without local synthesis."""
+        processor = self._streaming_processor(mock_get_session, [b"ab", b"cd"])
+        
+        self.assertEqual(list(processor.text_to_speech_stream(self.test_text)), [b"ab", b"cd"])
+        self.assertIn("/stream", mock_get_session.return_value.post.call_args.args[0])
+        processor.text_to_speech.assert_not_called()
+    
+    @patch('audio_processor.REQUESTS_AVAILABLE', True)
+    @patch('audio_processor._get_http_session')
+    def test_text_to_speech_stream_interrupted(self, mock_get_session):
+        """Test that a stream failing after its first chunk raises instead of ending quietly."""
+        processor = self._streaming_processor(mock_get_session, [b"ab", ConnectionError("reset")])
+        
+        stream = processor.text_to_speech_stream(self.test_text)
+        self.assertEqual(next(stream), b"ab")
+        with self.assertRaises(RuntimeError):
+            next(stream)
+        processor.text_to_speech.assert_not_called()
+    
+    @patch('audio_processor.REQUESTS_AVAILABLE', True)
+    @patch('audio_processor._get_http_session')
+    def test_text_to_speech_stream_falls_back_and_cleans_up(self, mock_get_session):
+        """Test that a stream failing before any audio falls back to local synthesis."""
+        processor = self._streaming_processor(mock_get_session, [ConnectionError("refused")])
+        speech_path = _temp_file_pool.acquire('.wav')
+        Path(speech_path).write_bytes(b"local audio")
+        processor.text_to_speech.return_value = AudioFile(file_path=speech_path, format="wav")
+        
+        self.assertEqual(b"".join(processor.text_to_speech_stream(self.test_text)), b"local audio")
+        self.assertFalse(os.path.exists(speech_path))
     
     @patch('audio_processor.requests')
     def test_elevenlabs_tts_api_error(self, mock_requests):
@@ -102,13 +227,11 @@ class TestTTSProcessor(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    @patch('audio_processor.tempfile')
-    def test_pyttsx3_tts_success(self, mock_tempfile):
+    @patch('audio_processor._temp_file_pool')
+    def test_pyttsx3_tts_success(self, mock_pool):
         """Test successful pyttsx3 TTS conversion."""
         mock_engine = Mock()
-        mock_temp_file = Mock()
-        mock_temp_file.name = "/tmp/test_audio.wav"
-        mock_tempfile.NamedTemporaryFile.return_value = mock_temp_file
+        mock_pool.acquire.return_value = "/tmp/test_audio.wav"
         
         processor = TTSProcessor()
         processor.pyttsx3_engine = mock_engine
@@ -122,6 +245,47 @@ class TestTTSProcessor(unittest.TestCase):
         mock_engine.save_to_file.assert_called_once()
         mock_engine.runAndWait.assert_called_once()
     
+    def test_pyttsx3_settings_do_not_leak(self):
+        """Test that a custom rate is not kept by the shared engine for later calls."""
+        processor = TTSProcessor()
+        processor.pyttsx3_engine = Mock()
+        
+        processor._render_pyttsx3([("Slow", "/tmp/slow.wav")], {'rate': 120})
+        processor._render_pyttsx3([("Default", "/tmp/default.wav")], {})
+        
+        self.assertEqual(processor.pyttsx3_engine.setProperty.call_args_list[-2:],
+                         [(('rate', 150),), (('volume', 0.8),)])
+    
+    def test_get_available_voices_cached(self):
+        """Test that voice listings are served from the TTL cache."""
+        mock_engine = Mock()
+        mock_voice = Mock()
+        mock_voice.id = "voice1"
+        mock_voice.name = "Test Voice"
+        mock_voice.languages = ["en"]
+        mock_engine.getProperty.return_value = [mock_voice]
+        
+        processor = TTSProcessor()
+        processor.pyttsx3_engine = mock_engine
+        
+        first = processor.get_available_voices()
+        second = processor.get_available_voices()
+        
+        self.assertEqual(first, second)
+        mock_engine.getProperty.assert_called_once_with('voices')
+        
+        # An expired entry triggers a fresh listing
+        with patch.object(TTSProcessor, 'VOICES_CACHE_TTL', 0):
+            processor._voices_cache = None
+            processor.get_available_voices()
+            processor.get_available_voices()
+        self.assertEqual(mock_engine.getProperty.call_count, 3)
+        
+        # refresh bypasses a still-valid entry
+        processor.get_available_voices()
+        processor.get_available_voices(refresh=True)
+        self.assertEqual(mock_engine.getProperty.call_count, 5)
+    
     @patch('audio_processor.pyttsx3')
     def test_get_available_voices(self, mock_pyttsx3):
         """Test getting available voices."""
@@ -149,42 +313,148 @@ class TestTTSProcessor(unittest.TestCase):
         self.assertGreater(len(elevenlabs_voices), 0)
 
 
-class TestAudioRemixer(unittest.TestCase):
+class TestTTSAudioCache(AudioTestCase):
+    """Test cases for TTSAudioCache class."""
+    
+    def setUp(self):
+        """Set up test fixtures in a directory private to this test."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_dir = os.path.join(temp_dir.name, "cache")
+        self.cache = TTSAudioCache(self.cache_dir)
+        
+        speech_path = os.path.join(temp_dir.name, "speech.wav")
+        Path(speech_path).write_bytes(b"fake_speech_data")
+        self.audio = AudioFile(file_path=speech_path, format="wav",
+                               duration=1.5, metadata={"provider": "pyttsx3"})
+    
+    def test_key_normalization(self):
+        """Test that whitespace differences share a cache key but case does not."""
+        key1 = self.cache.make_key("Hello.", {"rate": 150})
+        key2 = self.cache.make_key("  Hello.  ", {"rate": 150})
+        key3 = self.cache.make_key("Hello.", {"rate": 120})
+        
+        self.assertEqual(key1, key2)
+        self.assertNotEqual(key1, key3)
+        # "US" and "us" are pronounced differently
+        self.assertNotEqual(self.cache.make_key("US", {}), self.cache.make_key("us", {}))
+    
+    def test_default_cache_dir_is_per_user(self):
+        """Test that the default cache lives in the user's cache directory."""
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": self.cache_dir}):
+            cache = TTSAudioCache()
+        
+        self.assertEqual(cache.cache_dir, Path(self.cache_dir) / "echoverse" / "tts")
+        self.assertFalse(str(cache.cache_dir).startswith(tempfile.gettempdir() + os.sep + "echoverse"))
+    
+    def test_put_and_get(self):
+        """Test storing and retrieving cached audio."""
+        key = self.cache.make_key("Hello", {})
+        self.assertIsNone(self.cache.get(key))
+        
+        self.cache.put(key, self.audio)
+        cached = self.cache.get(key)
+        
+        self.assertIsNotNone(cached)
+        self.assertEqual(cached.format, "wav")
+        self.assertNotEqual(cached.file_path, self.audio.file_path)
+        with open(cached.file_path, 'rb') as f:
+            self.assertEqual(f.read(), b"fake_speech_data")
+        os.unlink(cached.file_path)
+        
+        # Duration and the original metadata come back from the sidecar
+        self.assertEqual(cached.duration, 1.5)
+        self.assertEqual(cached.metadata["provider"], "pyttsx3")
+        self.assertTrue(cached.metadata["cache_hit"])
+        self.assertEqual(cached.metadata["cache_key"], key)
+    
+    def test_sweep_evicts_oldest(self):
+        """Test that the cache is trimmed to its size budget."""
+        self.cache.max_bytes = 20
+        old_key = self.cache.make_key("old", {})
+        new_key = self.cache.make_key("new", {})
+        
+        self.cache.put(old_key, self.audio)
+        os.utime(os.path.join(self.cache_dir, f"{old_key}.wav"), (0, 0))
+        self.cache.put(new_key, self.audio)
+        
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, f"{old_key}.wav")))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, f"{old_key}.json")))
+        self.assertTrue(os.path.exists(os.path.join(self.cache_dir, f"{new_key}.wav")))
+    
+    def test_text_to_speech_uses_cache(self):
+        """Test that repeat TTS requests skip synthesis."""
+        processor = TTSProcessor(cache_dir=self.cache_dir)
+        processor._synthesize = Mock(return_value=self.audio)
+        
+        first = processor.text_to_speech("Hello there")
+        second = processor.text_to_speech("Hello   there")
+        
+        processor._synthesize.assert_called_once()
+        self.assertEqual(first, self.audio)
+        self.assertEqual(second.metadata["provider"], "pyttsx3")
+        self.assertTrue(second.metadata["cache_hit"])
+        os.unlink(second.file_path)
+    
+    def test_texts_to_speech_batches_engine_run(self):
+        """Test that batched texts share one pyttsx3 run and fill the cache."""
+        def write_speech(text, path):
+            with open(path, 'wb') as f:
+                f.write(text.encode())
+        
+        processor = TTSProcessor(cache_dir=self.cache_dir)
+        processor.pyttsx3_engine = Mock()
+        processor.pyttsx3_engine.save_to_file.side_effect = write_speech
+        texts = [f"Batch text {i}" for i in range(5)]
+        
+        first = processor.texts_to_speech(texts)
+        second = processor.texts_to_speech(texts)
+        
+        self.assertEqual(len(first), 5)
+        self.assertTrue(all(isinstance(audio, AudioFile) for audio in first))
+        self.assertEqual(processor.pyttsx3_engine.save_to_file.call_count, 5)
+        processor.pyttsx3_engine.runAndWait.assert_called_once()
+        self.assertTrue(all(audio.metadata["provider"] == "pyttsx3" for audio in second))
+        self.assertTrue(all(audio.metadata["cache_hit"] for audio in second))
+        for audio in first + second:
+            os.unlink(audio.file_path)
+
+
+class TestAudioRemixer(AudioTestCase):
     """Test cases for AudioRemixer class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one remixer, with an effects cache private to this class."""
+        super().setUpClass()
+        cache_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cache_dir.cleanup)
+        cls.remixer = AudioRemixer(effects_cache_dir=cache_dir.name)
+    
     def setUp(self):
-        """Set up test fixtures."""
-        self.remixer = AudioRemixer()
+        """Set up test fixtures in a directory private to this test."""
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
         
         # Create temporary test files
-        self.temp_speech_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        self.temp_speech_file.write(b"fake_speech_data")
-        self.temp_speech_file.close()
+        speech_path = os.path.join(temp_dir.name, "tmp_speech.wav")
+        Path(speech_path).write_bytes(b"fake_speech_data")
         
-        self.temp_music_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        self.temp_music_file.write(b"fake_music_data")
-        self.temp_music_file.close()
+        music_path = os.path.join(temp_dir.name, "tmp_music.wav")
+        Path(music_path).write_bytes(b"fake_music_data")
         
         self.speech_audio = AudioFile(
-            file_path=self.temp_speech_file.name,
+            file_path=speech_path,
             duration=5.0,
             format="wav"
         )
         
         self.music_audio = AudioFile(
-            file_path=self.temp_music_file.name,
+            file_path=music_path,
             duration=10.0,
             format="wav"
         )
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        try:
-            os.unlink(self.temp_speech_file.name)
-            os.unlink(self.temp_music_file.name)
-        except:
-            pass
-    
     def test_create_remix_no_background_music(self):
         """Test remix creation without background music."""
         result = self.remixer.create_remix(self.speech_audio)
@@ -242,6 +512,57 @@ class TestAudioRemixer(unittest.TestCase):
         self.assertEqual(result.metadata["provider"], "numpy_fallback")
         mock_shutil.copy2.assert_called_once()
     
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+    def test_numpy_mix(self):
+        """Test saturating int16 mixing with looped, broadcast music."""
+        import numpy as np
+        speech = np.full((7, 2), 30000, dtype=np.int16)
+        music = np.array([[30000], [0], [-30000]], dtype=np.int16)
+        
+        mixed = AudioRemixer._numpy_mix(speech, music, 0.5)
+        
+        self.assertEqual(mixed.shape, (7, 2))
+        self.assertEqual(mixed.dtype, np.int16)
+        # Music loops every three frames and is shared by both channels
+        self.assertEqual(mixed[:, 0].tolist(), [30000, 15000, 0, 30000, 15000, 0, 30000])
+        self.assertTrue((mixed[:, 0] == mixed[:, 1]).all())
+        
+        # Full-scale inputs clip instead of wrapping around
+        loud = AudioRemixer._numpy_mix(speech, music, 1.5)
+        self.assertEqual(int(loud.max()), 32767)
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+    def test_numpy_mix_reuses_buffer(self):
+        """Test that repeat mixes reuse the pooled scratch buffer."""
+        import numpy as np
+        import audio_processor
+        speech = np.zeros((4096, 1), dtype=np.int16)
+        music = np.ones((100, 1), dtype=np.int16)
+        
+        AudioRemixer._mix_buffers.by_channels = {}
+        with patch.object(audio_processor.np, 'empty', wraps=np.empty) as mock_empty:
+            AudioRemixer._numpy_mix(speech, music, 0.5)
+            AudioRemixer._numpy_mix(speech[:1000], music, 0.5)
+        
+        mock_empty.assert_called_once()
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+    def test_numpy_mix_does_not_pool_long_buffers(self):
+        """Test that mixes above the pooling limit get one-off buffers."""
+        import numpy as np
+        import audio_processor
+        speech = np.zeros((4096, 1), dtype=np.int16)
+        music = np.ones((100, 1), dtype=np.int16)
+        
+        AudioRemixer._mix_buffers.by_channels = {}
+        with patch.object(AudioRemixer, 'MAX_POOLED_MIX_FRAMES', 1024), \
+                patch.object(audio_processor.np, 'empty', wraps=np.empty) as mock_empty:
+            AudioRemixer._numpy_mix(speech, music, 0.5)
+            AudioRemixer._numpy_mix(speech, music, 0.5)
+        
+        self.assertEqual(mock_empty.call_count, 2)
+        self.assertEqual(AudioRemixer._mix_buffers.by_channels, {})
+    
     @patch('audio_processor.PYDUB_AVAILABLE', True)
     @patch('audio_processor.AudioSegment')
     @patch('audio_processor.tempfile')
@@ -271,15 +592,91 @@ class TestAudioRemixer(unittest.TestCase):
         self.assertEqual(result.metadata["effects_applied"], effects)
         mock_audio.fade_in.assert_called_with(1000)  # 1 second in ms
         mock_audio.fade_out.assert_called_with(2000)  # 2 seconds in ms
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+    def test_fused_effects(self):
+        """Test that volume and fades are applied as one gain envelope."""
+        import numpy as np
+        samples = np.full((100, 2), 1000, dtype=np.int16)
+        
+        processed = AudioRemixer._fused_effects(
+            samples, {'volume': 20, 'fade_in': 0.1, 'fade_out': 0.1}, framerate=100
+        )
+        
+        self.assertEqual(processed.shape, samples.shape)
+        self.assertEqual(processed.dtype, np.int16)
+        self.assertEqual(processed[0, 0], 0)  # Fade in starts silent
+        self.assertEqual(processed[-1, 1], 0)  # Fade out ends silent
+        self.assertEqual(processed[50, 0], 10000)  # +20 dB is 10x
+        self.assertTrue((processed[:10, 0] <= processed[1:11, 0]).all())
+        self.assertEqual(AudioRemixer._fused_effects(samples, {'volume': 60}, 100).max(), 32767)
+    
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not available")
+    def test_apply_audio_effects_numpy(self):
+        """Test that 16-bit WAV input is processed with numpy."""
+        import wave
+        wav_path = os.path.join(os.path.dirname(self.speech_audio.file_path), "tone.wav")
+        with wave.open(wav_path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(8000)
+            wav.writeframes(b"\x10\x00" * 8000)
+        
+        result = self.remixer.apply_audio_effects(AudioFile(file_path=wav_path), {'fade_in': 0.5})
+        
+        self.assertEqual(result.metadata["processed_by"], "numpy_effects")
+        self.assertAlmostEqual(result.duration, 1.0)
+        os.unlink(result.file_path)
+    
+    @patch('audio_processor.PYDUB_AVAILABLE', True)
+    @patch('audio_processor.AudioSegment', create=True)
+    def test_apply_effects_cached(self, mock_audio_segment):
+        """Test that identical effect chains over identical audio render once."""
+        def export(path, format):
+            with open(path, 'wb') as f:
+                f.write(b"rendered_effects")
+        
+        mock_audio = Mock()
+        mock_audio.__len__ = Mock(return_value=5000)
+        mock_audio.fade_in.return_value = mock_audio
+        mock_audio.export.side_effect = export
+        mock_audio_segment.from_file.return_value = mock_audio
+        
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        remixer = AudioRemixer(effects_cache_dir=cache_dir)
+        effects = {'fade_in': 1.0}
+        
+        first = remixer.apply_audio_effects(self.speech_audio, effects)
+        second = remixer.apply_audio_effects(self.speech_audio, effects)
+        
+        mock_audio.fade_in.assert_called_once_with(1000)
+        self.assertEqual(first.metadata["processed_by"], "pydub_effects")
+        self.assertTrue(second.metadata["cache_hit"])
+        self.assertEqual(second.metadata["effects_applied"], effects)
+        with open(second.file_path, 'rb') as f:
+            self.assertEqual(f.read(), b"rendered_effects")
+        os.unlink(first.file_path)
+        os.unlink(second.file_path)
 
 
-class TestAudioManager(unittest.TestCase):
+class TestAudioManager(AudioTestCase):
     """Test cases for AudioManager class."""
     
+    test_text = "This is a test message for audio processing."
+    
+    @classmethod
+    def setUpClass(cls):
+        """Build one manager whose speech and remix steps are stubbed."""
+        super().setUpClass()
+        cls.manager = AudioManager()
+        cls.manager.tts_processor.text_to_speech = Mock()
+        cls.manager.audio_remixer.create_remix = Mock()
+    
     def setUp(self):
-        """Set up test fixtures."""
-        self.manager = AudioManager()
-        self.test_text = "This is a test message for audio processing."
+        """Reset the shared stubs instead of rebuilding the manager."""
+        self.manager.tts_processor.text_to_speech.reset_mock(return_value=True, side_effect=True)
+        self.manager.audio_remixer.create_remix.reset_mock(return_value=True, side_effect=True)
     
     @patch('audio_processor.TTSProcessor')
     @patch('audio_processor.AudioRemixer')
@@ -293,7 +690,7 @@ class TestAudioManager(unittest.TestCase):
     def test_process_text_to_audio_speech_only(self):
         """Test text-to-audio processing without remix."""
         mock_audio = AudioFile(file_path="/tmp/speech.wav", format="wav")
-        self.manager.tts_processor.text_to_speech = Mock(return_value=mock_audio)
+        self.manager.tts_processor.text_to_speech.return_value = mock_audio
         
         result = self.manager.process_text_to_audio(self.test_text)
         
@@ -307,8 +704,8 @@ class TestAudioManager(unittest.TestCase):
         mock_speech = AudioFile(file_path="/tmp/speech.wav", format="wav")
         mock_remix = AudioFile(file_path="/tmp/remix.wav", format="wav")
         
-        self.manager.tts_processor.text_to_speech = Mock(return_value=mock_speech)
-        self.manager.audio_remixer.create_remix = Mock(return_value=mock_remix)
+        self.manager.tts_processor.text_to_speech.return_value = mock_speech
+        self.manager.audio_remixer.create_remix.return_value = mock_remix
         
         result = self.manager.process_text_to_audio(
             self.test_text,
@@ -319,9 +716,29 @@ class TestAudioManager(unittest.TestCase):
         self.assertEqual(result['speech'], mock_speech)
         self.assertEqual(result['remix'], mock_remix)
     
+    def test_stream_text_to_audio_local_fallback(self):
+        """Test streaming falls back to chunking the locally synthesized file."""
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
+        temp_file.write(b"x" * 10000)
+        temp_file.close()
+        
+        mock_audio = AudioFile(file_path=temp_file.name, format="wav")
+        self.manager.tts_processor.text_to_speech.return_value = mock_audio
+        
+        chunks = list(self.manager.stream_text_to_audio(self.test_text))
+        
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), b"x" * 10000)
+        # The synthesized file is removed once it has been streamed
+        self.assertFalse(os.path.exists(temp_file.name))
+    
+    def test_stream_text_to_audio_empty_text(self):
+        """Test streaming with empty text yields nothing."""
+        self.assertEqual(list(self.manager.stream_text_to_audio("   ")), [])
+    
     def test_process_text_to_audio_tts_failure(self):
         """Test text-to-audio processing when TTS fails."""
-        self.manager.tts_processor.text_to_speech = Mock(return_value=None)
+        self.manager.tts_processor.text_to_speech.return_value = None
         
         result = self.manager.process_text_to_audio(self.test_text)
         
@@ -350,22 +767,41 @@ class TestAudioManager(unittest.TestCase):
         self.assertTrue(info['exists'])
         self.assertEqual(info['file_size'], 1024)
     
-    @patch('audio_processor.os.path.exists')
-    @patch('audio_processor.os.unlink')
-    def test_cleanup_temp_files(self, mock_unlink, mock_exists):
+    @patch('audio_processor._temp_file_pool')
+    def test_cleanup_temp_files(self, mock_pool):
         """Test cleanup of temporary files."""
-        mock_exists.return_value = True
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        temp_paths = [os.path.join(temp_dir, name) for name in ("temp1.wav", "temp2.wav")]
+        for path in temp_paths:
+            Path(path).write_bytes(b"audio")
         
         temp_files = [
-            AudioFile(file_path="/tmp/temp1.wav"),
-            AudioFile(file_path="/tmp/temp2.wav"),
+            AudioFile(file_path=temp_paths[0]),
+            AudioFile(file_path=temp_paths[1]),
+            AudioFile(file_path=os.path.join(temp_dir, "missing.wav")),  # Already gone
             AudioFile(file_path="/permanent/file.wav")  # Should not be deleted
         ]
         
-        self.manager.cleanup_temp_files(temp_files)
+        with patch('audio_processor.os.path.exists') as mock_exists:
+            self.manager.cleanup_temp_files(temp_files)
+        
+        # Only existing temp files are released, found by one directory listing
+        mock_exists.assert_not_called()
+        released = sorted(call.args[0] for call in mock_pool.release.call_args_list)
+        self.assertEqual(released, temp_paths)
+    
+    def test_cleanup_temp_files_twice(self):
+        """Test that cleaning up the same file twice spares later outputs."""
+        first = AudioFile(file_path=_temp_file_pool.acquire('.wav'))
+        self.manager.cleanup_temp_files([first])
+        
+        second = AudioFile(file_path=_temp_file_pool.acquire('.wav'))
+        self.addCleanup(_temp_file_pool.release, second.file_path)
+        Path(second.file_path).write_bytes(b"live audio")
+        self.manager.cleanup_temp_files([first])
         
-        # Only temp files should be deleted
-        self.assertEqual(mock_unlink.call_count, 2)
+        self.assertEqual(Path(second.file_path).read_bytes(), b"live audio")
     
     def test_is_audio_processing_available(self):
         """Test checking audio processing availability."""
@@ -377,23 +813,115 @@ class TestAudioManager(unittest.TestCase):
         self.assertIn('pydub_mixing', availability)
         self.assertIn('numpy_fallback', availability)
         self.assertIn('any_tts', availability)
+    
+    def test_availability_memoized(self):
+        """Test that availability is computed once and handed out as copies."""
+        first = self.manager.is_audio_processing_available()
+        first['any_tts'] = 'mutated'
+        first.clear()
+        
+        second = self.manager.is_audio_processing_available()
+        
+        self.assertIsNot(first, second)
+        self.assertIn('any_tts', second)
+        self.assertNotEqual(second['any_tts'], 'mutated')
 
 
-class TestUtilityFunctions(unittest.TestCase):
+class TestUtilityFunctions(AudioTestCase):
     """Test cases for utility functions."""
     
-    @patch('audio_processor.os.path.exists')
-    def test_get_default_background_music_path(self, mock_exists):
-        """Test getting default background music path."""
-        # Test when no files exist
-        mock_exists.return_value = False
-        result = get_default_background_music_path()
-        self.assertIsNone(result)
+    def test_temp_file_pool_reuses(self):
+        """Test that released temp files are truncated and handed out again."""
+        pool = _TempFilePool(max_per_suffix=2)
+        self.addCleanup(pool.clear)
+        
+        with patch('os.open', wraps=os.open) as mock_open_fd:
+            for _ in range(10):
+                path = pool.acquire('.wav')
+                with open(path, 'wb') as f:
+                    f.write(b"audio")
+                pool.release(path)
+        
+        self.assertLess(mock_open_fd.call_count, 10)
+        self.assertFalse(os.path.exists(path))  # Retired under a fresh name
+        reused = pool.acquire('.wav')
+        self.assertEqual(os.path.getsize(reused), 0)
+        pool.release(reused)
+    
+    def test_temp_file_pool_double_release(self):
+        """Test that releasing a stale path never touches a later acquisition."""
+        pool = _TempFilePool()
+        self.addCleanup(pool.clear)
+        first = pool.acquire('.wav')
+        pool.release(first)
+        
+        second = pool.acquire('.wav')
+        self.addCleanup(pool.release, second)
+        Path(second).write_bytes(b"live audio")
+        pool.release(first)
+        
+        self.assertEqual(Path(second).read_bytes(), b"live audio")
+        self.assertIsNot(pool.acquire('.wav'), second)
+    
+    def test_temp_file_pool_foreign_path(self):
+        """Test that files the pool never issued are deleted, not recycled."""
+        pool = _TempFilePool()
+        self.addCleanup(pool.clear)
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        foreign = os.path.join(temp_dir, "speech.wav")
+        Path(foreign).write_bytes(b"user audio")
+        
+        pool.release(foreign)
         
-        # Test when first file exists
-        mock_exists.side_effect = lambda path: path == 'assets/background_music.mp3'
-        result = get_default_background_music_path()
-        self.assertEqual(result, 'assets/background_music.mp3')
+        self.assertFalse(os.path.exists(foreign))
+        fresh = pool.acquire('.wav')
+        self.addCleanup(pool.release, fresh)
+        self.assertNotEqual(os.path.dirname(fresh), temp_dir)
+    
+    def test_get_default_background_music_path(self):
+        """Test getting default background music path."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            assets_dir = os.path.join(temp_dir, 'assets')
+            os.makedirs(assets_dir)
+            search_dirs = [assets_dir, os.path.join(temp_dir, 'missing')]
+            
+            # Test when no audio files exist
+            Path(assets_dir, 'notes.txt').write_text("not audio")
+            result = get_default_background_music_path(search_dirs)
+            self.assertIsNone(result)
+            
+            # Any audio file is used when no preferred name exists
+            Path(assets_dir, 'ambient.ogg').write_bytes(b'OggS')
+            result = get_default_background_music_path(search_dirs)
+            self.assertEqual(result, os.path.join(assets_dir, 'ambient.ogg'))
+            
+            # The alphabetically first audio file is used, whatever the listing order
+            Path(assets_dir, 'calm.wav').write_bytes(b'RIFF')
+            result = get_default_background_music_path(search_dirs)
+            self.assertEqual(result, os.path.join(assets_dir, 'ambient.ogg'))
+            
+            # Preferred names win in the order they are listed
+            Path(assets_dir, 'music.mp3').write_bytes(b'ID3')
+            Path(assets_dir, 'background.wav').write_bytes(b'RIFF')
+            result = get_default_background_music_path(search_dirs)
+            self.assertEqual(result, os.path.join(assets_dir, 'background.wav'))
+            
+            Path(assets_dir, 'background_music.mp3').write_bytes(b'ID3')
+            for _ in range(3):
+                result = get_default_background_music_path(search_dirs)
+                self.assertEqual(result, os.path.join(assets_dir, 'background_music.mp3'))
+            
+            # An earlier directory's preferred file beats a better name in a later one
+            audio_dir = os.path.join(temp_dir, 'audio')
+            os.makedirs(audio_dir)
+            os.remove(os.path.join(assets_dir, 'background_music.mp3'))
+            Path(audio_dir, 'background_music.mp3').write_bytes(b'ID3')
+            result = get_default_background_music_path([assets_dir, audio_dir])
+            self.assertEqual(result, os.path.join(assets_dir, 'background.wav'))
+        finally:
+            shutil.rmtree(temp_dir)
     
     @patch('audio_processor.os.path.exists')
     def test_validate_audio_file_nonexistent(self, mock_exists):
@@ -409,12 +937,45 @@ class TestUtilityFunctions(unittest.TestCase):
         result = validate_audio_file("/path/to/file.txt")
         self.assertFalse(result)
     
-    @patch('audio_processor.os.path.exists')
-    def test_validate_audio_file_valid(self, mock_exists):
+    def test_validate_audio_file_valid(self):
         """Test validating valid audio file."""
-        mock_exists.return_value = True
-        result = validate_audio_file("/path/to/file.wav")
-        self.assertTrue(result)
+        headers = {
+            '.wav': b'RIFF\x24\x08\x00\x00WAVEfmt ',
+            '.mp3': b'ID3\x03\x00\x00\x00',
+            '.ogg': b'OggS\x00\x02\x00\x00',
+        }
+        for suffix, header in headers.items():
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+                temp_file.write(header + b'\x00' * 64)
+            try:
+                self.assertTrue(validate_audio_file(temp_file.name), suffix)
+            finally:
+                os.unlink(temp_file.name)
+    
+    def test_validate_audio_file_bad_header(self):
+        """Test that a valid extension with the wrong header is rejected."""
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
+            temp_file.write(b'ID3\x03\x00\x00\x00' + b'\x00' * 64)
+        try:
+            self.assertFalse(validate_audio_file(temp_file.name))
+        finally:
+            os.unlink(temp_file.name)
+    
+    def test_rejects_header_mismatch(self):
+        """Test that headers of another format or container are rejected."""
+        mismatches = {
+            '.wav': b'RIFF\x24\x08\x00\x00AVI LIST',  # RIFF but not WAVE
+            '.flac': b'OggS\x00\x02\x00\x00',
+            '.ogg': b'fLaC\x00\x00\x00\x22',
+            '.mp3': b'RIFF\x24\x08\x00\x00WAVEfmt ',
+        }
+        for suffix, header in mismatches.items():
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as temp_file:
+                temp_file.write(header + b'\x00' * 64)
+            try:
+                self.assertFalse(validate_audio_file(temp_file.name), suffix)
+            finally:
+                os.unlink(temp_file.name)
     
     @patch('audio_processor.PYDUB_AVAILABLE', True)
     @patch('audio_processor.AudioSegment')
@@ -436,7 +997,7 @@ class TestUtilityFunctions(unittest.TestCase):
         mock_audio_segment.silent.assert_called_with(duration=3500)  # 3.5 seconds in ms
 
 
-class TestVoiceDataClass(unittest.TestCase):
+class TestVoiceDataClass(AudioTestCase):
     """Test cases for Voice data class."""
     
     def test_voice_creation(self):
@@ -462,6 +1023,15 @@ class TestVoiceDataClass(unittest.TestCase):
         self.assertEqual(voice.language, "en")
         self.assertEqual(voice.gender, "neutral")
         self.assertEqual(voice.provider, "pyttsx3")
+    
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots need Python 3.10+")
+    def test_voice_is_slotted(self):
+        """Test that Voice instances are slotted and immutable."""
+        voice = Voice('a', 'b')
+        
+        self.assertFalse(hasattr(voice, '__dict__'))
+        with self.assertRaises(AttributeError):
+            voice.name = 'c'
 
 
 if __name__ == '__main__':
@@ -469,4 +1039,15 @@ if __name__ == '__main__':
     import logging
     logging.basicConfig(level=logging.WARNING)
     
-    unittest.main()
\ No newline at end of file
+    # Named tests or options go to the standard runner
+    if len(sys.argv) > 1:
+        unittest.main()
+    
+    # Each class has its own fixtures and cache directory, so each can run
+    # in its own process
+    test_classes = discover_test_classes(sys.modules[__name__])
+    results = run_test_classes(__name__, test_classes,
+                               max_workers=min(len(test_classes), os.cpu_count() or 1))
+    for result in results:
+        sys.stdout.write(result["output"])
+    sys.exit(1 if any(result["failures"] or result["errors"] for result in results) else 0)
\ No newline at end of file
@@ -206,13 +206,12 @@ class TestUtilityFunctions(unittest.TestCase):
         """Test validating file with valid extension."""
         # Create a temporary file with valid extension
         with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-            temp_file.write(b"fake audio data")
+            temp_file.write(b"RIFF\x24\x08\x00\x00WAVEfmt fake audio data")
             temp_file_path = temp_file.name
         
         try:
             result = validate_audio_file(temp_file_path)
-            # Should return True for valid extension even if not real audio
-            # (since pydub is not available to validate actual audio content)
+            # Only the RIFF/WAVE header is checked, not the audio content
             self.assertTrue(result)
         finally:
             os.unlink(temp_file_path)
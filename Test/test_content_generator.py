@@ -4,6 +4,7 @@ Tests both MockGenerator and GeminiGenerator with fallback logic.
 """
 
 import unittest
+import asyncio
 from unittest.mock import Mock, patch, MagicMock
 import os
 import sys
@@ -358,6 +359,26 @@ class TestContentGenerator(unittest.TestCase):
         self.assertTrue(len(result.poem) > 0)
         self.assertIn("generator", result.generation_metadata)
 
+    
+    def test_agenerate_support_and_poem_gather(self):
+        """Test async generation keeps results in input order."""
+        generator = ContentGenerator()
+        inputs = [
+            ProcessedInput(content=f"Input number {i}", input_type=InputType.TEXT)
+            for i in range(3)
+        ]
+        
+        async def run_all():
+            return await asyncio.gather(
+                *(generator.agenerate_support_and_poem(inp) for inp in inputs)
+            )
+        
+        results = asyncio.run(run_all())
+        
+        self.assertEqual(len(results), 3)
+        for inp, result in zip(inputs, results):
+            self.assertIsInstance(result, GeneratedContent)
+            self.assertEqual(result.generation_metadata.get("content_length"), len(inp.content))
 
 class TestContentGeneratorInterface(unittest.TestCase):
     """Test cases for ContentGeneratorInterface."""
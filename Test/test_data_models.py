@@ -9,10 +9,12 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'app'))
 
 from data_models import (
     User, ProcessedInput, GeneratedContent, AudioFile, Interaction,
-    InputType, validate_nickname, validate_password, validate_input_content,
+    InputType, generate_interaction_id, validate_nickname, validate_password, validate_input_content,
     validate_user_data_integrity, validate_interaction_data_integrity
 )
 from datetime import datetime
+import random
+import uuid
 
 
 def test_user_creation():
@@ -101,6 +103,33 @@ def test_interaction():
         print(f"✗ Failed to create Interaction: {e}")
         return False
     
+    # Generated IDs are distinct UUID4 strings
+    ids = {generate_interaction_id() for _ in range(1000)}
+    assert len(ids) == 1000
+    assert all(uuid.UUID(i).version == 4 for i in ids)
+    print("✓ Interaction IDs are unique UUID4 strings")
+    
+    # Seeding the global PRNG must not make IDs repeat
+    random.seed(42)
+    first = generate_interaction_id()
+    random.seed(42)
+    assert generate_interaction_id() != first
+    print("✓ Interaction IDs ignore random.seed()")
+    
+    # Instances are slot-backed on interpreters that support it
+    if sys.version_info >= (3, 10):
+        assert not hasattr(interaction, "__dict__")
+        print("✓ Interaction uses __slots__")
+    
+    # The fast path builds the same shape as the validating constructor
+    fast = Interaction._fast("Hello", InputType.DRAWING, "Support", "Poem",
+                             raw=b"png", meta={"demo": True})
+    assert fast.id != interaction.id and fast.audio_files == [] and fast.file_paths == {}
+    assert fast.input_data == ProcessedInput(content="Hello", input_type=InputType.DRAWING,
+                                             metadata={"demo": True}, raw_data=b"png")
+    assert fast.generated_content == GeneratedContent(supportive_statement="Support", poem="Poem")
+    print("✓ Interaction._fast matches the validating constructor")
+    
     return True
 
 
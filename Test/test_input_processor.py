@@ -177,6 +177,20 @@ class TestInputProcessor(unittest.TestCase):
         self.assertEqual(result.input_type, InputType.DRAWING)
         self.assertIsNotNone(result.raw_data)
     
+    def test_process_drawing_input_raw_bytes(self):
+        """Test processing drawing input from raw PNG bytes."""
+        test_image = Image.new('RGB', (100, 100), color='green')
+        buffer = io.BytesIO()
+        test_image.save(buffer, format='PNG')
+        image_bytes = buffer.getvalue()
+        
+        result = self.processor.process_drawing_input(image_bytes)
+        
+        self.assertIsInstance(result, ProcessedInput)
+        self.assertEqual(result.input_type, InputType.DRAWING)
+        self.assertEqual(result.raw_data, image_bytes)
+        self.assertIn("Hand-drawn sketch", result.content)
+    
     def test_process_drawing_input_canvas_dict(self):
         """Test processing drawing input from canvas dictionary."""
         canvas_data = {
@@ -0,0 +1,159 @@
+"""
+Tests for the LLM response cache module
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_cache import cache_key, MemoryCacheBackend, FileCacheBackend, SemanticCache
+
+
+class TestCacheKey(unittest.TestCase):
+    """Test cache key derivation"""
+    
+    def test_key_is_stable_and_parameter_sensitive(self):
+        """Identical requests share a key; any differing input changes it"""
+        key = cache_key("gemini-pro", "Hello", temperature=0)
+        self.assertEqual(key, cache_key("gemini-pro", "Hello", temperature=0))
+        self.assertEqual(len(key), 64)
+        
+        self.assertNotEqual(key, cache_key("gemini-pro", "Hello!", temperature=0))
+        self.assertNotEqual(key, cache_key("gemini-1.5", "Hello", temperature=0))
+        self.assertNotEqual(key, cache_key("gemini-pro", "Hello", temperature=0.7))
+
+
+class TestCacheBackends(unittest.TestCase):
+    """Test memory and file cache backends"""
+    
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def _check_backend(self, backend):
+        self.assertIsNone(backend.get("missing"))
+        
+        backend.set("key", {"text": "cached response"})
+        self.assertEqual(backend.get("key"), {"text": "cached response"})
+        
+        backend.set("short", {"text": "expires"}, ttl=10)
+        with patch("app.llm_cache.time.time", return_value=1e12):
+            self.assertIsNone(backend.get("short"))
+            self.assertEqual(backend.get("key"), {"text": "cached response"})
+    
+    def test_memory_backend(self):
+        """Test in-memory get/set and expiry"""
+        self._check_backend(MemoryCacheBackend())
+    
+    def test_file_backend(self):
+        """Test on-disk get/set, expiry and persistence across instances"""
+        backend = FileCacheBackend(os.path.join(self.test_dir, "cache"))
+        self._check_backend(backend)
+        
+        reopened = FileCacheBackend(os.path.join(self.test_dir, "cache"))
+        self.assertEqual(reopened.get("key"), {"text": "cached response"})
+        self.assertEqual(sorted(os.listdir(backend.directory)), ["key.json"])
+    
+    def test_file_backend_ignores_corrupt_entries(self):
+        """Unreadable cache files are treated as misses"""
+        backend = FileCacheBackend(self.test_dir)
+        with open(os.path.join(self.test_dir, "bad.json"), "w") as f:
+            f.write("{not json")
+        self.assertIsNone(backend.get("bad"))
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test the embedding-similarity cache"""
+    
+    VECTORS = {
+        "I feel overwhelmed at work": [1.0, 0.1, 0.0],
+        "Work is overwhelming me": [0.95, 0.15, 0.0],
+        "Write a poem about spring": [0.0, 0.2, 1.0],
+    }
+    
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.embed_calls = []
+    
+    def tearDown(self):
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+    
+    def _embed(self, text):
+        self.embed_calls.append(text)
+        return self.VECTORS[text]
+    
+    def test_similar_text_hits_and_unrelated_text_misses(self):
+        """Paraphrases above the threshold share an entry"""
+        cache = SemanticCache(self._embed, threshold=0.92)
+        self.assertIsNone(cache.get("I feel overwhelmed at work"))
+        cache.set("I feel overwhelmed at work", {"text": "You are doing your best."})
+        
+        self.assertEqual(cache.get("Work is overwhelming me"), {"text": "You are doing your best."})
+        self.assertIsNone(cache.get("Write a poem about spring"))
+        
+        # The miss-then-set sequence embeds each text only once
+        self.assertEqual(self.embed_calls.count("I feel overwhelmed at work"), 1)
+    
+    def test_entries_only_match_their_scope(self):
+        """An entry stored under one scope is a miss in another"""
+        cache = SemanticCache(self._embed, threshold=0.92)
+        cache.set("I feel overwhelmed at work", {"text": "pro"}, scope="gemini-pro")
+        
+        self.assertIsNone(cache.get("Work is overwhelming me", scope="gemini-1.5"))
+        self.assertIsNone(cache.get("Work is overwhelming me"))
+        self.assertEqual(cache.get("Work is overwhelming me", scope="gemini-pro"), {"text": "pro"})
+    
+    def test_leaders_group_similar_texts(self):
+        """Each text is led by the first earlier text it matches"""
+        cache = SemanticCache(self._embed, threshold=0.92)
+        texts = ["I feel overwhelmed at work", "Write a poem about spring", "Work is overwhelming me"]
+        self.assertEqual(cache.leaders(texts), [0, 1, 0])
+    
+    def test_entries_persist_to_path(self):
+        """Entries saved to a path are loaded by a new instance"""
+        path = os.path.join(self.test_dir, "semantic.jsonl")
+        SemanticCache(self._embed, path=path).set("I feel overwhelmed at work", {"text": "cached"})
+        
+        reopened = SemanticCache(self._embed, path=path)
+        self.assertEqual(reopened.get("Work is overwhelming me"), {"text": "cached"})
+        
+        reopened.set("Write a poem about spring", {"text": "poem"}, scope="poems")
+        self.assertEqual(SemanticCache(self._embed, path=path).get("Write a poem about spring", scope="poems"),
+                         {"text": "poem"})
+        
+        # Each set appends one line rather than rewriting the file
+        with open(path, "r", encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 2)
+    
+    def test_loads_legacy_list_file(self):
+        """A file saved as a single JSON list still loads and accepts appends"""
+        path = os.path.join(self.test_dir, "semantic.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([{"vector": [1.0, 0.1, 0.0], "value": {"text": "old"}, "scope": ""}], f)
+        
+        SemanticCache(self._embed, path=path).set("Write a poem about spring", {"text": "new"})
+        
+        reopened = SemanticCache(self._embed, path=path)
+        self.assertEqual(reopened.get("Work is overwhelming me"), {"text": "old"})
+        self.assertEqual(reopened.get("Write a poem about spring"), {"text": "new"})
+    
+    def test_embeddings_are_bounded(self):
+        """Only the most recently used embeddings are kept"""
+        cache = SemanticCache(lambda text: [1.0, float(len(text))], threshold=0.92)
+        cache.MIN_EMBEDDING_CACHE = 2
+        for text in ["a", "bb", "ccc"]:
+            cache.get(text)
+        
+        self.assertEqual(list(cache._embeddings), ["bb", "ccc"])
+
+
+if __name__ == "__main__":
+    unittest.main()
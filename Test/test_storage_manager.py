@@ -6,9 +6,11 @@ Tests all storage operations, user directory management, and data persistence.
 import json
 import os
 import shutil
+import tarfile
 import tempfile
 import unittest
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
@@ -233,6 +235,60 @@ class TestStorageManager(unittest.TestCase):
         loaded_interaction = self.storage.load_interaction("testuser", interaction.id)
         self.assertEqual(loaded_interaction.input_data.raw_data, b"fake PNG data")
     
+    def test_raw_data_stored_out_of_band(self):
+        """Test raw input bytes are kept out of the profile JSON and loaded on demand."""
+        input_data = ProcessedInput(
+            content="Drawing description",
+            input_type=InputType.DRAWING,
+            raw_data=b"\x89PNG fake drawing bytes"
+        )
+        interaction = Interaction(
+            input_data=input_data,
+            generated_content=GeneratedContent(
+                supportive_statement="Nice drawing!",
+                poem="Art is beautiful"
+            )
+        )
+        
+        self.storage.save_interaction(self.test_user, interaction)
+        
+        blob_path = self.storage._get_interaction_directory("testuser", interaction.id) / f"{interaction.id}.bin"
+        self.assertEqual(blob_path.read_bytes(), b"\x89PNG fake drawing bytes")
+        profile_text = self.storage._get_user_profile_path("testuser").read_text()
+        self.assertNotIn("fake drawing bytes", profile_text)
+        self.assertIn(f"{interaction.id}.bin", profile_text)
+        
+        # History loads skip the blob until it is asked for
+        loaded = self.storage.load_user_history("testuser")[0]
+        self.assertIsNone(loaded.input_data.raw_data)
+        self.assertEqual(self.storage.load_raw_data(loaded), b"\x89PNG fake drawing bytes")
+        self.assertEqual(loaded.input_data.raw_data, b"\x89PNG fake drawing bytes")
+        
+        # Corrupted blobs are reported rather than returned
+        blob_path.write_bytes(b"tampered")
+        with self.assertRaises(StorageError):
+            self.storage.load_raw_data(loaded)
+    
+    def test_raw_data_staged_until_profile_saved(self):
+        """Test that a failed profile save leaves no raw blob and saves don't touch the caller's file_paths."""
+        interaction = Interaction(
+            input_data=ProcessedInput(content="Drawing description", input_type=InputType.DRAWING,
+                                      raw_data=b"drawing bytes"),
+            generated_content=GeneratedContent(supportive_statement="Nice drawing!", poem="Art is beautiful")
+        )
+        interaction_dir = self.storage._get_interaction_directory("testuser", interaction.id)
+        
+        with patch.object(self.storage, 'save_user_profile', side_effect=OSError("Disk full")):
+            with self.assertRaises(StorageError):
+                self.storage.save_interaction(self.test_user, interaction)
+        self.assertEqual(list(interaction_dir.glob("*")), [])
+        
+        self.storage.save_interaction(self.test_user, interaction)
+        self.assertEqual(interaction.file_paths, {})
+        self.assertEqual([path.name for path in interaction_dir.iterdir()], [f"{interaction.id}.bin"])
+        self.assertEqual(self.storage.load_user_history("testuser")[0].file_paths["raw_file"],
+                         (interaction_dir / f"{interaction.id}.bin").relative_to(self.test_dir).as_posix())
+    
     def test_load_user_history(self):
         """Test loading complete user interaction history."""
         # Create multiple interactions
@@ -265,6 +321,112 @@ class TestStorageManager(unittest.TestCase):
         self.assertTrue(history[0].timestamp >= history[1].timestamp)
         self.assertTrue(history[1].timestamp >= history[2].timestamp)
     
+    def test_save_interactions_bulk(self):
+        """Test saving several interactions with a single profile write."""
+        interactions = [
+            Interaction(
+                input_data=ProcessedInput(content=f"Bulk input {i}", input_type=InputType.TEXT),
+                generated_content=GeneratedContent(
+                    supportive_statement=f"Support {i}",
+                    poem=f"Poem {i}"
+                )
+            )
+            for i in range(3)
+        ]
+        
+        with patch.object(self.storage, 'save_user_profile',
+                          wraps=self.storage.save_user_profile) as mock_save:
+            ids = self.storage.save_interactions_bulk(self.test_user, interactions)
+        
+        self.assertEqual(ids, [interaction.id for interaction in interactions])
+        mock_save.assert_called_once()
+        
+        loaded_user = self.storage.load_user_profile("testuser")
+        self.assertEqual({p["id"] for p in loaded_user.prompts}, set(ids))
+        
+        # Re-saving the same interactions must not duplicate them
+        self.storage.save_interactions_bulk(self.test_user, interactions)
+        self.assertEqual(len(self.test_user.prompts), 3)
+    
+    def test_save_interaction_concurrent(self):
+        """Test that concurrent saves for one user keep every interaction."""
+        interactions = [
+            Interaction(
+                input_data=ProcessedInput(content=f"Threaded input {i}", input_type=InputType.TEXT),
+                generated_content=GeneratedContent(
+                    supportive_statement=f"Support {i}",
+                    poem=f"Poem {i}"
+                )
+            )
+            for i in range(8)
+        ]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.storage.save_interaction, self.test_user, interaction)
+                for interaction in interactions
+            ]
+            saved_ids = [future.result() for future in futures]
+        
+        loaded_user = self.storage.load_user_profile("testuser")
+        self.assertEqual({p["id"] for p in loaded_user.prompts}, set(saved_ids))
+    
+    def test_load_user_history_columnar(self):
+        """Test loading history as parallel column lists."""
+        base_time = datetime(2024, 1, 1, 12, 0)
+        interactions = [
+            Interaction(
+                timestamp=base_time + timedelta(hours=i),
+                input_data=ProcessedInput(content=f"Column input {i}", input_type=InputType.AUDIO),
+                generated_content=GeneratedContent(
+                    supportive_statement=f"Support {i}",
+                    poem=f"Poem {i}"
+                )
+            )
+            for i in range(3)
+        ]
+        self.storage.save_interactions_bulk(self.test_user, interactions)
+        
+        cols = self.storage.load_user_history_columnar(self.test_user)
+        
+        self.assertEqual(set(cols), {"id", "ts", "input_type", "content", "supportive", "poem"})
+        self.assertTrue(all(len(column) == 3 for column in cols.values()))
+        # Newest first
+        self.assertEqual(cols["id"], [interaction.id for interaction in reversed(interactions)])
+        self.assertEqual(cols["ts"][0], base_time + timedelta(hours=2))
+        self.assertEqual(cols["input_type"], ["audio"] * 3)
+        self.assertEqual(cols["content"][0], "Column input 2")
+        self.assertEqual(cols["supportive"][-1], "Support 0")
+        self.assertEqual(cols["poem"][-1], "Poem 0")
+        
+        # A nickname resolves to the saved profile
+        self.assertEqual(self.storage.load_user_history_columnar("testuser"), cols)
+        with self.assertRaises(StorageError):
+            self.storage.load_user_history_columnar("nobody")
+    
+    def test_load_interaction_legacy_meta(self):
+        """Test loading legacy per-directory interactions by id."""
+        ids = []
+        for i in range(2):
+            interaction_id = f"legacy-{i}"
+            interaction_dir = Path(self.test_dir) / "users" / "testuser" / interaction_id
+            interaction_dir.mkdir(parents=True)
+            meta = {
+                "id": interaction_id,
+                "timestamp": datetime(2024, 1, 1, 10 + i).isoformat(),
+                "input": {"content": f"Legacy input {i}", "type": "text"}
+            }
+            (interaction_dir / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+            ids.append(interaction_id)
+        
+        first = self.storage.load_interaction("testuser", ids[0])
+        second = self.storage.load_interaction("testuser", ids[1])
+        
+        # Each id gets its own cache entry
+        self.assertEqual(first.id, ids[0])
+        self.assertEqual(second.id, ids[1])
+        self.assertEqual(second.input_data.content, "Legacy input 1")
+    
     def test_delete_interaction(self):
         """Test deleting interactions and associated files."""
         # Create and save interaction
@@ -335,6 +497,76 @@ class TestStorageManager(unittest.TestCase):
         self.assertGreater(stats["file_count"], 0)
         # Note: total_size_mb might be 0 for very small files, so we check total_size instead
         self.assertGreaterEqual(stats["total_size_mb"], 0)
+        
+        # Repeat calls are served without walking the directory
+        with patch('pathlib.Path.rglob') as mock_rglob:
+            self.assertEqual(self.storage.get_storage_stats("testuser"), stats)
+            mock_rglob.assert_not_called()
+        
+        # Saving through the manager refreshes the counters
+        self.storage.save_interaction(self.test_user, Interaction(input_data=ProcessedInput(
+            content="Another drawing",
+            input_type=InputType.DRAWING,
+            raw_data=b"more bytes"
+        )))
+        refreshed = self.storage.get_storage_stats("testuser")
+        self.assertEqual(refreshed["interaction_count"], 2)
+        self.assertGreater(refreshed["total_size"], stats["total_size"])
+    
+    def test_export_user(self):
+        """Test exporting a user's whole directory as a tar stream through a file descriptor."""
+        self.storage.create_user_directory(self.test_user)
+        interaction = Interaction(
+            input_data=ProcessedInput(content="Exported input", input_type=InputType.TEXT,
+                                      raw_data=b"raw bytes"),
+            generated_content=GeneratedContent(supportive_statement="Support", poem="Poem")
+        )
+        self.storage.save_interaction(self.test_user, interaction)
+        user_dir = self.storage._get_user_directory("testuser")
+        expected = {
+            path.relative_to(user_dir).as_posix(): path.read_bytes()
+            for path in user_dir.rglob("*") if path.is_file()
+        }
+        self.assertTrue(any(name.endswith(".bin") for name in expected))
+        export_path = Path(self.test_dir) / "export.tar"
+        
+        def exported_files():
+            with tarfile.open(export_path) as archive:
+                return {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+        
+        with open(export_path, "wb") as f:
+            written = self.storage.export_user("testuser", f.fileno())
+        self.assertEqual(written, export_path.stat().st_size)
+        self.assertEqual(exported_files(), expected)
+        
+        # Falls back to a buffered copy when sendfile rejects the descriptors
+        with patch('app.storage_manager.os.sendfile', side_effect=OSError("unsupported"), create=True):
+            with open(export_path, "wb") as f:
+                written = self.storage.export_user("testuser", f.fileno())
+        self.assertEqual(written, export_path.stat().st_size)
+        self.assertEqual(exported_files(), expected)
+        
+        with self.assertRaises(StorageError):
+            self.storage.export_user("nonexistent", 1)
+    
+    def test_profile_survives_user_directory_recreation(self):
+        """Test cached user directory fds are not reused after the directory is removed."""
+        self.storage.create_user_directory(self.test_user)
+        self.storage.save_user_profile(self.test_user)
+        self.assertEqual(self.storage.load_user_profile("testuser").nickname, "testuser")
+        
+        # Account deletion removes the directory without going through the manager
+        shutil.rmtree(self.storage._get_user_directory("testuser"))
+        self.assertIsNone(self.storage.load_user_profile("testuser"))
+        
+        self.storage.create_user_directory(self.test_user)
+        self.test_user.preferences = {"theme": "light"}
+        self.storage.save_user_profile(self.test_user)
+        self.assertTrue(self.storage._get_user_profile_path("testuser").exists())
+        self.assertEqual(self.storage.load_user_profile("testuser").preferences, {"theme": "light"})
+        
+        self.storage.close()
+        self.assertEqual(self.storage.load_user_profile("testuser").preferences, {"theme": "light"})
     
     def test_error_handling(self):
         """Test error handling in storage operations."""
@@ -347,6 +579,16 @@ class TestStorageManager(unittest.TestCase):
         with patch('builtins.open', side_effect=IOError("File error")):
             with self.assertRaises(StorageError):
                 self.storage.save_user_profile(self.test_user)
+        
+        # Save failures are reported once, not wrapped again per layer
+        interaction = Interaction(
+            input_data=ProcessedInput(content="Unsaved input", input_type=InputType.TEXT),
+            generated_content=GeneratedContent(supportive_statement="Support", poem="Poem")
+        )
+        with patch.object(self.storage, 'save_user_profile', side_effect=OSError("Disk full")):
+            with self.assertRaises(StorageError) as context:
+                self.storage.save_interaction(self.test_user, interaction)
+        self.assertEqual(str(context.exception), "Failed to save interactions: Disk full")
 
 
 class TestFileManager(unittest.TestCase):
@@ -420,6 +662,23 @@ class TestFileManager(unittest.TestCase):
         size = FileManager.get_file_size(test_file)
         self.assertEqual(size, len(test_content.encode('utf-8')))
     
+    def test_remove_tree(self):
+        """Test recursive directory removal without following symlinks."""
+        root = Path(self.test_dir) / "tree"
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "top.txt").write_text("top")
+        (root / "a" / "b" / "deep.txt").write_text("deep")
+        
+        outside = Path(self.test_dir) / "outside"
+        outside.mkdir()
+        (outside / "keep.txt").write_text("keep")
+        (root / "link").symlink_to(outside, target_is_directory=True)
+        
+        FileManager.remove_tree(root)
+        
+        self.assertFalse(root.exists())
+        self.assertTrue((outside / "keep.txt").exists())
+    
     def test_copy_file_safe(self):
         """Test safe file copying."""
         # Create source file
@@ -524,6 +783,79 @@ class TestHistoryManager(unittest.TestCase):
         results = self.history_manager.search_interactions(self.test_user, "KEYWORD")
         self.assertEqual(len(results), 5)
     
+    def test_search_after_content_change(self):
+        """Test that re-saving an interaction under the same ID refreshes search."""
+        interaction = self.interactions[0]
+        interaction.input_data.content = "I like apples"
+        self.storage.save_interactions_bulk(self.test_user, [interaction])
+        
+        results = self.history_manager.search_interactions(self.test_user, "apples")
+        self.assertEqual(len(results), 1)
+        
+        interaction.input_data.content = "I like bananas"
+        self.storage.save_interactions_bulk(self.test_user, [interaction])
+        
+        self.assertEqual(len(self.history_manager.search_interactions(self.test_user, "apples")), 0)
+        self.assertEqual(len(self.history_manager.search_interactions(self.test_user, "bananas")), 1)
+        self.assertEqual(len(self.history_manager.search_any(self.test_user, ["apples"])), 0)
+    
+    def test_get_recent_interactions_stops_early(self):
+        """Test that recent interactions only decode the entries returned."""
+        with patch.object(self.storage, '_deserialize_interaction',
+                          wraps=self.storage._deserialize_interaction) as mock_decode:
+            recent = self.history_manager.get_recent_interactions(self.test_user, limit=2)
+        
+        self.assertEqual(len(recent), 2)
+        self.assertEqual(mock_decode.call_count, 2)
+        self.assertEqual(
+            [interaction.id for interaction in recent],
+            [interaction.id for interaction in self.storage.load_user_history(self.test_user)[:2]]
+        )
+    
+    def test_search_interactions_prefix_cache(self):
+        """Test that longer queries reuse cached prefix results and history changes reset them."""
+        results = self.history_manager.search_interactions(self.test_user, "input")
+        self.assertEqual(len(results), 5)
+        
+        results = self.history_manager.search_interactions(self.test_user, "input 3")
+        self.assertEqual(len(results), 1)
+        self.assertIn("input 3", results[0].input_data.content)
+        
+        # A new interaction invalidates the cached results
+        new_interaction = Interaction(
+            input_data=ProcessedInput(content="Another input 3 entry", input_type=InputType.TEXT),
+            generated_content=GeneratedContent(supportive_statement="Support", poem="Poem")
+        )
+        self.storage.save_interaction(self.test_user, new_interaction)
+        
+        results = self.history_manager.search_interactions(self.test_user, "input 3")
+        self.assertEqual(len(results), 2)
+    
+    def test_search_decodes_history_once_per_revision(self):
+        """Test that repeated searches reuse the decoded history until the profile is saved."""
+        with patch.object(self.storage, 'iter_user_history',
+                          wraps=self.storage.iter_user_history) as mock_iter:
+            self.history_manager.search_interactions(self.test_user, "input")
+            self.history_manager.search_interactions(self.test_user, "keyword")
+            self.history_manager.search_any(self.test_user, ["poem"])
+            self.assertEqual(mock_iter.call_count, 1)
+            
+            self.storage.save_user_profile(self.test_user)
+            self.history_manager.search_interactions(self.test_user, "input")
+            self.assertEqual(mock_iter.call_count, 2)
+    
+    def test_search_any(self):
+        """Test multi-term search matches interactions containing any term."""
+        results = self.history_manager.search_any(self.test_user, ["INPUT 1", "input 3", "nonexistent"])
+        self.assertEqual(
+            sorted(interaction.input_data.content for interaction in results),
+            ["Test input 1 with keyword search", "Test input 3 with keyword search"]
+        )
+        
+        # Regex metacharacters in terms are matched literally
+        self.assertEqual(self.history_manager.search_any(self.test_user, ["input.*"]), [])
+        self.assertEqual(self.history_manager.search_any(self.test_user, []), [])
+    
     def test_get_interaction_summary(self):
         """Test getting interaction summary statistics."""
         summary = self.history_manager.get_interaction_summary(self.test_user)
@@ -6,7 +6,6 @@ Tests complete system integration, performance, and reliability.
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
-import shutil
 import json
 import time
 import threading
@@ -45,7 +44,10 @@ class SystemValidationTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up system-wide test environment"""
-        cls.test_dir = tempfile.mkdtemp(prefix="echoverse_system_test_")
+        # Class cleanups run even if the rest of setUpClass raises
+        cls._tmp_ctx = tempfile.TemporaryDirectory(prefix="echoverse_system_test_")
+        cls.addClassCleanup(cls._tmp_ctx.cleanup)
+        cls.test_dir = cls._tmp_ctx.name
         cls.users_dir = Path(cls.test_dir) / "users"
         cls.models_dir = Path(cls.test_dir) / "models"
         cls.config_dir = Path(cls.test_dir) / "config"
@@ -57,12 +59,6 @@ class SystemValidationTest(unittest.TestCase):
         
         print(f"System test environment: {cls.test_dir}")
     
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up system test environment"""
-        if hasattr(cls, 'test_dir') and os.path.exists(cls.test_dir):
-            shutil.rmtree(cls.test_dir)
-    
     def setUp(self):
         """Set up individual test"""
         # Initialize all system components
@@ -668,7 +664,7 @@ def run_system_validation():
     
     # Create test suite
     test_suite = unittest.TestSuite()
-    test_suite.addTest(unittest.makeSuite(SystemValidationTest))
+    test_suite.addTests(unittest.TestLoader().loadTestsFromTestCase(SystemValidationTest))
     
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2, stream=sys.stdout)
@@ -5,8 +5,17 @@ with graceful fallback systems for offline functionality.
 """
 
 import os
+import json
+import atexit
+import time
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List
+import mmap
+import uuid
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 import tempfile
@@ -79,15 +88,225 @@ try:
 except ImportError:
     SHUTIL_AVAILABLE = False
 
+# Library-backed capabilities are fixed once the imports above have run
+_AVAILABILITY = {
+    'pydub_mixing': PYDUB_AVAILABLE,
+    'numpy_fallback': NUMPY_AVAILABLE
+}
+
+# blake3 hashes large audio files several times faster than SHA-256
+try:
+    from blake3 import blake3 as _content_hasher
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    from hashlib import sha256 as _content_hasher
+    BLAKE3_AVAILABLE = False
+
 try:
-    from .data_models import AudioFile
+    from .data_models import AudioFile, SLOTS
 except ImportError:
-    from data_models import AudioFile
+    from data_models import AudioFile, SLOTS
+
+# pyttsx3 drivers (SAPI/COM in particular) are bound to the thread that
+# created the engine and its event loop is not thread-safe, so every engine
+# call runs on one dedicated worker thread
+_PYTTSX3_THREAD_PREFIX = "pyttsx3-engine"
+
+# Engine defaults, restored for every render that does not override them
+PYTTSX3_DEFAULT_RATE = 150  # words per minute
+PYTTSX3_DEFAULT_VOLUME = 0.8  # 0.0 to 1.0
+_pyttsx3_executor = None
+_pyttsx3_executor_lock = threading.Lock()
+
+# Process-wide warm clients: engine bring-up and TLS handshakes are paid once
+_pyttsx3_engine = None
+_pyttsx3_configured_engine = None
+_http_session = None
+_clients_lock = threading.Lock()
+
+
+def _run_on_engine_thread(func, *args):
+    """
+    Run a pyttsx3 call on the dedicated engine thread and wait for its result.
+    
+    Callers block on a future rather than on a lock, and calls made from the
+    engine thread itself run inline.
+    
+    Args:
+        func: Callable that uses the engine
+        *args: Arguments for func
+        
+    Returns:
+        Whatever func returns (exceptions are re-raised in the caller)
+    """
+    global _pyttsx3_executor
+    if threading.current_thread().name.startswith(_PYTTSX3_THREAD_PREFIX):
+        return func(*args)
+    with _pyttsx3_executor_lock:
+        if _pyttsx3_executor is None:
+            _pyttsx3_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=_PYTTSX3_THREAD_PREFIX)
+    return _pyttsx3_executor.submit(func, *args).result()
+
+
+def _get_pyttsx3_engine():
+    """
+    Return the shared pyttsx3 engine, initializing it on first use.
+    
+    Returns:
+        pyttsx3 engine or None if pyttsx3 is unavailable or fails to start
+    """
+    global _pyttsx3_engine
+    if not PYTTSX3_AVAILABLE:
+        return None
+    with _clients_lock:
+        if _pyttsx3_engine is None:
+            _pyttsx3_engine = _run_on_engine_thread(pyttsx3.init)
+        return _pyttsx3_engine
+
+
+def _get_http_session():
+    """
+    Return the shared HTTP session used for ElevenLabs calls.
+    
+    Keep-alive connections in the pool are reused across requests.
+    
+    Returns:
+        requests.Session or None if requests is unavailable
+    """
+    global _http_session
+    if not REQUESTS_AVAILABLE:
+        return None
+    with _clients_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=8, max_retries=2)
+            session.mount("https://", adapter)
+            _http_session = session
+        return _http_session
+
+
+def _file_digest(file_path: str, extra: bytes = b"") -> str:
+    """
+    Hash a file's content, mapped into memory and fed in 1 MiB blocks.
+    
+    Args:
+        file_path: File to hash
+        extra: Bytes mixed in after the content (e.g. parameters of a rendering)
+        
+    Returns:
+        Hex digest (blake3 when available, SHA-256 otherwise)
+    """
+    digest = _content_hasher()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, size, 1 << 20):
+                        digest.update(view[start:start + (1 << 20)])
+                finally:
+                    view.release()
+    digest.update(b"\x00")
+    digest.update(extra)
+    return digest.hexdigest()
+
+
+class _TempFilePool:
+    """
+    Pool of reusable temporary files, kept per suffix.
+    Released files are truncated and handed out again instead of being
+    unlinked and recreated, saving the create/unlink syscalls per call.
+    Only files the pool issued are recycled, and each is renamed on release
+    so a stale path from an earlier acquisition never aliases a live one.
+    """
+    
+    MAX_PER_SUFFIX = 32
+    
+    def __init__(self, max_per_suffix: int = MAX_PER_SUFFIX):
+        """
+        Initialize an empty pool.
+        
+        Args:
+            max_per_suffix: Maximum number of idle files kept per suffix
+        """
+        self.max_per_suffix = max_per_suffix
+        self._idle: Dict[str, List[str]] = {}
+        self._issued: set = set()
+        self._lock = threading.Lock()
+    
+    def acquire(self, suffix: str = '.wav') -> str:
+        """
+        Get an empty temporary file path.
+        
+        Args:
+            suffix: File suffix, including the dot
+            
+        Returns:
+            Path of an existing, empty file owned by the caller
+        """
+        with self._lock:
+            idle = self._idle.get(suffix)
+            if idle:
+                path = idle.pop()
+                self._issued.add(path)
+                return path
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        with self._lock:
+            self._issued.add(path)
+        return path
+    
+    def release(self, path: str) -> None:
+        """
+        Give a temporary file back.
+        
+        A file issued by acquire() is recycled (or deleted if the pool is
+        full); releasing the same acquisition again does nothing. Any other
+        path is deleted.
+        
+        Args:
+            path: File to release
+        """
+        suffix = os.path.splitext(path)[1]
+        with self._lock:
+            issued = path in self._issued
+            self._issued.discard(path)
+            idle = self._idle.setdefault(suffix, [])
+            if issued and len(idle) < self.max_per_suffix:
+                try:
+                    os.truncate(path, 0)
+                    # A fresh name retires the old path along with this acquisition
+                    recycled = os.path.join(os.path.dirname(path), f"tmp{uuid.uuid4().hex}{suffix}")
+                    os.rename(path, recycled)
+                    idle.append(recycled)
+                    return
+                except OSError:
+                    pass
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    
+    def clear(self) -> None:
+        """Delete every idle file in the pool."""
+        with self._lock:
+            paths = [path for idle in self._idle.values() for path in idle]
+            self._idle.clear()
+        for path in paths:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+_temp_file_pool = _TempFilePool()
+atexit.register(_temp_file_pool.clear)
 
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class Voice:
-    """Voice configuration for TTS."""
+    """Voice configuration for TTS; immutable, so cached voice lists can be shared."""
     id: str
     name: str
     language: str = "en"
@@ -95,55 +314,274 @@ class Voice:
     provider: str = "pyttsx3"
 
 
+def _user_cache_dir(name: str) -> Path:
+    """
+    Get a cache directory private to the current user.
+    
+    Args:
+        name: Subdirectory name for the cache
+        
+    Returns:
+        Path under XDG_CACHE_HOME (or LOCALAPPDATA on Windows, ~/.cache otherwise)
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.environ.get("LOCALAPPDATA")
+    return Path(base or Path.home() / ".cache") / "echoverse" / name
+
+
+class TTSAudioCache:
+    """
+    Content-addressed on-disk cache for synthesized speech.
+    Entries are keyed by a SHA-256 of the normalized text and voice settings
+    and evicted least-recently-used once the cache exceeds its size budget.
+    Each entry has a small JSON sidecar recording its format, duration and
+    the metadata of the original synthesis; hits keep that metadata and add
+    cache_hit=True.
+    """
+    
+    DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+    
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the TTS audio cache.
+        
+        Args:
+            cache_dir: Directory for cached audio (default: per-user cache directory)
+            max_bytes: Maximum total size of cached audio in bytes
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else _user_cache_dir("tts")
+        self.max_bytes = max_bytes
+        self.logger = logging.getLogger(__name__)
+    
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Collapse whitespace so reflowed text shares a cache slot; case can change pronunciation."""
+        return " ".join(text.split())
+    
+    def make_key(self, text: str, voice_settings: Dict[str, Any], provider: str = "") -> str:
+        """
+        Build the cache key for a synthesis request.
+        
+        Args:
+            text: Text to convert to speech
+            voice_settings: Voice configuration
+            provider: Identifier of the TTS backend in use
+            
+        Returns:
+            Hex digest identifying the request
+        """
+        settings = json.dumps(voice_settings, sort_keys=True, default=str)
+        payload = "\x00".join((self.normalize_text(text), settings, provider))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def _read_sidecar(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the sidecar of a cache entry, or None if it is missing or unreadable."""
+        try:
+            with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def get(self, key: str) -> Optional[AudioFile]:
+        """
+        Look up cached audio and copy it into a caller-owned temporary file.
+        
+        Args:
+            key: Cache key from make_key
+            
+        Returns:
+            AudioFile for the cached audio or None on a cache miss
+        """
+        sidecar = self._read_sidecar(key) or {}
+        # The sidecar names the format; entries without one are probed
+        formats = (sidecar["format"],) if sidecar.get("format") else ("wav", "mp3")
+        
+        for audio_format in formats:
+            cached_path = self.cache_dir / f"{key}.{audio_format}"
+            if not cached_path.exists():
+                continue
+            try:
+                temp_path = _temp_file_pool.acquire(f'.{audio_format}')
+                shutil.copyfile(cached_path, temp_path)
+                os.utime(cached_path)  # Mark as recently used
+                return AudioFile(
+                    file_path=temp_path,
+                    duration=sidecar.get("duration"),
+                    format=audio_format,
+                    metadata={
+                        **sidecar.get("metadata", {}),
+                        "cache_hit": True,
+                        "cache_key": key
+                    }
+                )
+            except OSError as e:
+                self.logger.warning(f"Failed to read TTS cache entry {key}: {e}")
+        return None
+    
+    def put(self, key: str, audio_file: AudioFile) -> None:
+        """
+        Store synthesized audio in the cache.
+        
+        Args:
+            key: Cache key from make_key
+            audio_file: Synthesized audio to store
+        """
+        try:
+            if not audio_file or not os.path.exists(audio_file.file_path):
+                return
+            if os.path.getsize(audio_file.file_path) == 0:
+                return
+            
+            self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cached_path = self.cache_dir / f"{key}.{audio_file.format}"
+            
+            # Write the sidecar first so any visible audio entry has one
+            sidecar = {
+                "format": audio_file.format,
+                "duration": audio_file.duration,
+                "metadata": audio_file.metadata
+            }
+            sidecar_path = self.cache_dir / f"{key}.json"
+            partial_sidecar = sidecar_path.with_name(sidecar_path.name + ".part")
+            with open(partial_sidecar, "w", encoding="utf-8") as f:
+                json.dump(sidecar, f, default=str)
+            os.replace(partial_sidecar, sidecar_path)
+            
+            # Copy then rename so readers never see a partially written entry
+            partial_path = cached_path.with_name(cached_path.name + ".part")
+            shutil.copyfile(audio_file.file_path, partial_path)
+            os.replace(partial_path, cached_path)
+            
+            self.sweep()
+        except OSError as e:
+            self.logger.warning(f"Failed to store TTS cache entry {key}: {e}")
+    
+    def sweep(self) -> int:
+        """
+        Evict least recently used entries until the cache fits its size budget.
+        
+        Returns:
+            Number of evicted entries
+        """
+        try:
+            entries = []
+            total_size = 0
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.endswith((".part", ".json")):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+                        total_size += stat.st_size
+        except OSError:
+            return 0
+        
+        evicted = 0
+        if total_size > self.max_bytes:
+            entries.sort()
+            for _, size, path in entries:
+                if total_size <= self.max_bytes:
+                    break
+                try:
+                    os.unlink(path)
+                    total_size -= size
+                    evicted += 1
+                except OSError:
+                    continue
+                try:
+                    os.unlink(os.path.splitext(path)[0] + ".json")
+                except OSError:
+                    pass
+        return evicted
+
+
 class TTSProcessor:
     """
     Text-to-speech processor with ElevenLabs API and pyttsx3 fallback.
     Handles voice synthesis with graceful degradation.
     """
     
-    def __init__(self, elevenlabs_api_key: Optional[str] = None):
+    # Chunk size used when streaming synthesized audio to callers
+    STREAM_CHUNK_SIZE = 4096
+    
+    # Seconds a voice listing stays valid; voices rarely change at runtime
+    VOICES_CACHE_TTL = float(os.getenv("ECHOVERSE_VOICES_TTL", "300"))
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls) -> "TTSProcessor":
+        """
+        Get the process-wide TTS processor, creating it on first use.
+        
+        Returns:
+            Shared TTSProcessor with a warm engine and audio cache
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def __init__(self, elevenlabs_api_key: Optional[str] = None, cache_dir: Optional[str] = None):
         """
         Initialize TTS processor with LOCAL MODELS ONLY - ElevenLabs disabled.
         
         Args:
             elevenlabs_api_key: Ignored - using only local TTS
+            cache_dir: Optional directory for the synthesized audio cache
         """
         self.elevenlabs_api_key = None  # Force disable ElevenLabs
         self.logger = logging.getLogger(__name__)
         self.logger.info("TTS initialized with LOCAL MODELS ONLY - ElevenLabs API disabled")
         
-        # Initialize pyttsx3 engine if available
+        # Repeat phrases are served from disk instead of being re-synthesized
+        self.audio_cache = TTSAudioCache(cache_dir)
+        
+        # (expiry, voices) from the last get_available_voices call
+        self._voices_cache = None
+        
+        # Reuse the shared pyttsx3 engine if available
         self.pyttsx3_engine = None
         if PYTTSX3_AVAILABLE:
             try:
-                self.pyttsx3_engine = pyttsx3.init()
+                self.pyttsx3_engine = _get_pyttsx3_engine()
                 self._configure_pyttsx3()
             except Exception as e:
                 self.logger.warning(f"Failed to initialize pyttsx3: {e}")
                 self.pyttsx3_engine = None
     
     def _configure_pyttsx3(self):
-        """Configure pyttsx3 engine with optimal settings."""
+        """Configure pyttsx3 engine with optimal settings, once per engine."""
         if not self.pyttsx3_engine:
             return
-            
+        
+        # The engine is shared, so later processors skip the voice enumeration
+        if self.pyttsx3_engine is _pyttsx3_configured_engine:
+            return
+        
         try:
-            # Set speech rate (words per minute)
-            self.pyttsx3_engine.setProperty('rate', 150)
-            
-            # Set volume (0.0 to 1.0)
-            self.pyttsx3_engine.setProperty('volume', 0.8)
-            
-            # Try to set a pleasant voice
-            voices = self.pyttsx3_engine.getProperty('voices')
-            if voices:
-                # Prefer female voices for supportive content
-                for voice in voices:
-                    if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
-                        self.pyttsx3_engine.setProperty('voice', voice.id)
-                        break
+            _run_on_engine_thread(self._apply_default_pyttsx3_settings)
         except Exception as e:
-            self.logger.warning(f"Failed to configure pyttsx3: {e}")    
+            self.logger.warning(f"Failed to configure pyttsx3: {e}")
+    
+    def _apply_default_pyttsx3_settings(self):
+        """Apply default rate, volume and voice; runs on the engine thread."""
+        global _pyttsx3_configured_engine
+        
+        # Set speech rate (words per minute)
+        self.pyttsx3_engine.setProperty('rate', PYTTSX3_DEFAULT_RATE)
+        
+        # Set volume (0.0 to 1.0)
+        self.pyttsx3_engine.setProperty('volume', PYTTSX3_DEFAULT_VOLUME)
+        
+        # Try to set a pleasant voice
+        voices = self.pyttsx3_engine.getProperty('voices')
+        if voices:
+            # Prefer female voices for supportive content
+            for voice in voices:
+                if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
+                    self.pyttsx3_engine.setProperty('voice', voice.id)
+                    break
+        _pyttsx3_configured_engine = self.pyttsx3_engine
 
     @defensive_wrapper(fallback_value=None, component_name="tts_processor")
     @monitor_performance("text_to_speech_conversion")
@@ -164,6 +602,74 @@ class TTSProcessor:
         
         voice_settings = voice_settings or {}
         
+        # Serve repeat requests from the content cache
+        provider = "elevenlabs" if (self.elevenlabs_api_key and REQUESTS_AVAILABLE) else "local"
+        cache_key = self.audio_cache.make_key(text, voice_settings, provider)
+        cached_audio = self.audio_cache.get(cache_key)
+        if cached_audio:
+            return cached_audio
+        
+        result = self._synthesize(text, voice_settings)
+        if result:
+            self.audio_cache.put(cache_key, result)
+        return result
+    
+    def texts_to_speech(self, texts: List[str],
+                        voice_settings: Optional[Dict[str, Any]] = None) -> List[Optional[AudioFile]]:
+        """
+        Convert several texts to speech with shared engine setup.
+        
+        Cached texts are served from the audio cache. With the local engine,
+        the remaining texts are queued together and rendered in a single
+        engine run instead of one run per text.
+        
+        Args:
+            texts: Texts to convert to speech
+            voice_settings: Optional voice configuration applied to every text
+            
+        Returns:
+            AudioFile (or None on failure) for each text, in input order
+        """
+        voice_settings = voice_settings or {}
+        results: List[Optional[AudioFile]] = [None] * len(texts)
+        
+        provider = "elevenlabs" if (self.elevenlabs_api_key and REQUESTS_AVAILABLE) else "local"
+        misses = []
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            cache_key = self.audio_cache.make_key(text, voice_settings, provider)
+            cached_audio = self.audio_cache.get(cache_key)
+            if cached_audio:
+                results[index] = cached_audio
+            else:
+                misses.append((index, cache_key))
+        
+        if not misses:
+            return results
+        
+        if provider == "local" and self.pyttsx3_engine:
+            synthesized = self._pyttsx3_tts_batch([texts[index] for index, _ in misses], voice_settings)
+        else:
+            synthesized = [self._synthesize(texts[index], voice_settings) for index, _ in misses]
+        
+        for (index, cache_key), audio in zip(misses, synthesized):
+            if audio:
+                self.audio_cache.put(cache_key, audio)
+            results[index] = audio
+        return results
+    
+    def _synthesize(self, text: str, voice_settings: Dict[str, Any]) -> Optional[AudioFile]:
+        """
+        Synthesize speech with the best available engine.
+        
+        Args:
+            text: Text to convert to speech
+            voice_settings: Voice configuration
+            
+        Returns:
+            AudioFile object or None if conversion fails
+        """
         # Try ElevenLabs first if API key is available
         if self.elevenlabs_api_key and REQUESTS_AVAILABLE:
             def elevenlabs_call():
@@ -237,21 +743,35 @@ class TTSProcessor:
                 }
             }
             
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            # Level 3 is the strongest latency mode that keeps text normalization
+            params = {
+                "optimize_streaming_latency": voice_settings.get('optimize_streaming_latency', 3)
+            }
+            
+            response = _get_http_session().post(url, json=data, headers=headers, params=params,
+                                                stream=True, timeout=30)
             
             if response.status_code == 200:
-                # Save audio to temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-                temp_file.write(response.content)
-                temp_file.close()
+                # Write chunks to disk as they arrive
+                temp_path = _temp_file_pool.acquire('.mp3')
+                size = 0
+                with open(temp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        if chunk:
+                            f.write(chunk)
+                            size += len(chunk)
+                if size == 0:
+                    logger.logger.error("ElevenLabs API returned no audio")
+                    _temp_file_pool.release(temp_path)
+                    return None
                 
                 # Convert to WAV if pydub is available
                 if PYDUB_AVAILABLE:
                     try:
-                        audio = AudioSegment.from_mp3(temp_file.name)
-                        wav_file = temp_file.name.replace('.mp3', '.wav')
+                        audio = AudioSegment.from_mp3(temp_path)
+                        wav_file = temp_path.replace('.mp3', '.wav')
                         audio.export(wav_file, format="wav")
-                        os.unlink(temp_file.name)  # Remove MP3 file
+                        _temp_file_pool.release(temp_path)  # Recycle MP3 file
                         
                         return AudioFile(
                             file_path=wav_file,
@@ -263,13 +783,13 @@ class TTSProcessor:
                         logger.logger.warning(f"Audio conversion failed, using MP3: {conversion_error}")
                         # Fallback to MP3 if conversion fails
                         return AudioFile(
-                            file_path=temp_file.name,
+                            file_path=temp_path,
                             format="mp3",
                             metadata={"provider": "elevenlabs", "voice_id": voice_id, "conversion_failed": True}
                         )
                 else:
                     return AudioFile(
-                        file_path=temp_file.name,
+                        file_path=temp_path,
                         format="mp3",
                         metadata={"provider": "elevenlabs", "voice_id": voice_id}
                     )
@@ -306,6 +826,128 @@ class TTSProcessor:
             logger.logger.error(f"ElevenLabs TTS failed: {e}")
             return None
     
+    def text_to_speech_stream(self, text: str, voice_settings: Optional[Dict[str, Any]] = None,
+                              chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Convert text to speech and yield audio bytes as soon as they are available.
+        
+        Uses the ElevenLabs streaming endpoint when an API key is configured so
+        playback can start on the first chunk. Otherwise the audio is synthesized
+        locally and the resulting file is streamed back in chunks.
+        
+        Args:
+            text: Text to convert to speech
+            voice_settings: Optional voice configuration
+            chunk_size: Optional chunk size in bytes
+            
+        Yields:
+            Chunks of encoded audio data
+            
+        Raises:
+            RuntimeError: If the ElevenLabs stream fails after audio was yielded
+        """
+        if not text or not text.strip():
+            logger.logger.error("Empty text provided for TTS streaming")
+            return
+        
+        voice_settings = voice_settings or {}
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        
+        if self.elevenlabs_api_key and REQUESTS_AVAILABLE:
+            streamed_any = False
+            for chunk in self._elevenlabs_tts_stream(text, voice_settings, chunk_size):
+                streamed_any = True
+                yield chunk
+            if streamed_any:
+                return
+        
+        # Fall back to full synthesis and stream the resulting file
+        audio_file = self.text_to_speech(text, voice_settings)
+        if not audio_file or not os.path.exists(audio_file.file_path):
+            return
+        
+        # The synthesized file belongs to this call; recycle it once streamed
+        try:
+            with open(audio_file.file_path, 'rb') as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            _temp_file_pool.release(audio_file.file_path)
+    
+    def _elevenlabs_tts_stream(self, text: str, voice_settings: Dict[str, Any],
+                               chunk_size: int) -> Iterator[bytes]:
+        """
+        Stream speech from the ElevenLabs streaming endpoint.
+        
+        Args:
+            text: Text to convert
+            voice_settings: Voice configuration
+            chunk_size: Chunk size in bytes
+            
+        Yields:
+            Chunks of MP3 audio data; nothing if the request fails before the first chunk
+            
+        Raises:
+            RuntimeError: If the stream fails after chunks were yielded, since
+                the caller already holds partial audio and cannot fall back
+        """
+        voice_id = voice_settings.get('voice_id', 'EXAVITQu4vr4xnSDxMaL')  # Default voice
+        
+        url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream"
+        
+        headers = {
+            "Accept": "audio/mpeg",
+            "Content-Type": "application/json",
+            "xi-api-key": self.elevenlabs_api_key
+        }
+        
+        params = {
+            "optimize_streaming_latency": voice_settings.get('optimize_streaming_latency', 3),
+            "output_format": voice_settings.get('output_format', 'mp3_22050_32')
+        }
+        
+        data = {
+            "text": text,
+            "model_id": voice_settings.get('model_id', 'eleven_turbo_v2_5'),
+            "voice_settings": {
+                "stability": voice_settings.get('stability', 0.5),
+                "similarity_boost": voice_settings.get('similarity_boost', 0.5)
+            }
+        }
+        
+        streamed_any = False
+        try:
+            with _get_http_session().post(url, json=data, headers=headers, params=params,
+                                          stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    logger.logger.error(f"ElevenLabs streaming error: {response.status_code}")
+                    degradation_manager.register_component_degradation(
+                        component="elevenlabs_api",
+                        reason=f"HTTP {response.status_code}",
+                        impact="Will use local TTS",
+                        severity=SeverityLevel.MEDIUM
+                    )
+                    return
+                
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        streamed_any = True
+                        yield chunk
+                        
+        except Exception as e:
+            logger.logger.error(f"ElevenLabs TTS streaming failed: {e}")
+            degradation_manager.register_component_degradation(
+                component="elevenlabs_api",
+                reason="Streaming request failed",
+                impact="Will use local TTS",
+                severity=SeverityLevel.MEDIUM
+            )
+            if streamed_any:
+                raise RuntimeError(f"ElevenLabs stream interrupted: {e}") from e
+    
     def _pyttsx3_tts(self, text: str, voice_settings: Dict[str, Any]) -> Optional[AudioFile]:
         """
         Convert text to speech using pyttsx3.
@@ -319,21 +961,12 @@ class TTSProcessor:
         """
         try:
             # Create temporary file for output
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_file.close()
-            
-            # Configure engine with voice settings
-            if 'rate' in voice_settings:
-                self.pyttsx3_engine.setProperty('rate', voice_settings['rate'])
-            if 'volume' in voice_settings:
-                self.pyttsx3_engine.setProperty('volume', voice_settings['volume'])
+            temp_path = _temp_file_pool.acquire('.wav')
             
-            # Save to file
-            self.pyttsx3_engine.save_to_file(text, temp_file.name)
-            self.pyttsx3_engine.runAndWait()
+            self._render_pyttsx3([(text, temp_path)], voice_settings)
             
             return AudioFile(
-                file_path=temp_file.name,
+                file_path=temp_path,
                 format="wav",
                 metadata={"provider": "pyttsx3"}
             )
@@ -342,19 +975,83 @@ class TTSProcessor:
             self.logger.error(f"pyttsx3 TTS failed: {e}")
             return None
     
-    def get_available_voices(self) -> List[Voice]:
+    def _render_pyttsx3(self, jobs: List[tuple], voice_settings: Dict[str, Any]) -> None:
+        """
+        Render (text, output path) jobs in one run on the engine thread.
+        
+        Args:
+            jobs: Pairs of text and WAV path to write it to
+            voice_settings: Voice configuration applied to every job
+        """
+        def render():
+            # The engine is shared, so settings left by an earlier call are
+            # reset to the defaults unless this call overrides them
+            self.pyttsx3_engine.setProperty('rate', voice_settings.get('rate', PYTTSX3_DEFAULT_RATE))
+            self.pyttsx3_engine.setProperty('volume', voice_settings.get('volume', PYTTSX3_DEFAULT_VOLUME))
+            
+            # Queue every utterance, then render them together
+            for text, output_path in jobs:
+                self.pyttsx3_engine.save_to_file(text, output_path)
+            self.pyttsx3_engine.runAndWait()
+        
+        _run_on_engine_thread(render)
+    
+    def _pyttsx3_tts_batch(self, texts: List[str], voice_settings: Dict[str, Any]) -> List[Optional[AudioFile]]:
+        """
+        Convert several texts to speech using one pyttsx3 engine run.
+        
+        Args:
+            texts: Texts to convert
+            voice_settings: Voice configuration applied to every text
+            
+        Returns:
+            AudioFile (or None on failure) for each text, in input order
+        """
+        temp_paths = []
+        try:
+            for _ in texts:
+                temp_paths.append(_temp_file_pool.acquire('.wav'))
+            
+            self._render_pyttsx3(list(zip(texts, temp_paths)), voice_settings)
+            
+            return [
+                AudioFile(
+                    file_path=temp_path,
+                    format="wav",
+                    metadata={"provider": "pyttsx3"}
+                )
+                for temp_path in temp_paths
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"pyttsx3 batch TTS failed: {e}")
+            for temp_path in temp_paths:
+                _temp_file_pool.release(temp_path)
+            return [None] * len(texts)
+    
+    def get_available_voices(self, refresh: bool = False) -> List[Voice]:
         """
         Get list of available voices from all providers.
         
+        Results are cached for VOICES_CACHE_TTL seconds.
+        
+        Args:
+            refresh: Ignore the cached listing and query the providers again
+        
         Returns:
             List of Voice objects
         """
+        if self._voices_cache is not None and not refresh:
+            expiry, cached_voices = self._voices_cache
+            if time.monotonic() < expiry:
+                return list(cached_voices)
+        
         voices = []
         
         # Add pyttsx3 voices if available
         if self.pyttsx3_engine:
             try:
-                pyttsx3_voices = self.pyttsx3_engine.getProperty('voices')
+                pyttsx3_voices = _run_on_engine_thread(self.pyttsx3_engine.getProperty, 'voices')
                 for voice in pyttsx3_voices:
                     voices.append(Voice(
                         id=voice.id,
@@ -374,6 +1071,7 @@ class TTSProcessor:
                 Voice(id='MF3mGyEYCl7XYWbV9V6O', name='Elli', language='en', gender='female', provider='elevenlabs'),
             ])
         
+        self._voices_cache = (time.monotonic() + self.VOICES_CACHE_TTL, tuple(voices))
         return voices
 
 
@@ -383,9 +1081,25 @@ class AudioRemixer:
     Supports pydub and numpy fallback implementations.
     """
     
-    def __init__(self):
-        """Initialize audio remixer with available libraries."""
+    # Per-thread float32 mixing buffers, keyed by channel count and grown to
+    # the longest mix seen, so repeat mixes don't allocate a fresh buffer
+    _mix_buffers = threading.local()
+    
+    # Longer mixes get a one-off buffer, so a single long track doesn't pin
+    # its size in every worker thread (30 s at 48 kHz, ~11 MB in stereo)
+    MAX_POOLED_MIX_FRAMES = 48000 * 30
+    
+    def __init__(self, effects_cache_dir: Optional[str] = None):
+        """
+        Initialize audio remixer with available libraries.
+        
+        Args:
+            effects_cache_dir: Optional directory for the rendered effects cache
+        """
         self.logger = logging.getLogger(__name__)
+        
+        # Identical effect chains over identical audio are rendered once
+        self.effects_cache = TTSAudioCache(effects_cache_dir or str(_user_cache_dir("effects")))
     
     def create_remix(self, speech_audio: AudioFile, background_music: Optional[AudioFile] = None,
                     volume_ratio: float = 0.7) -> Optional[AudioFile]:
@@ -408,7 +1122,16 @@ class AudioRemixer:
         if not background_music or not os.path.exists(background_music.file_path):
             return speech_audio
         
-        # Try pydub first
+        # 16-bit PCM WAV at a shared sample rate is mixed directly with numpy
+        if NUMPY_AVAILABLE:
+            speech_params = self._wav_params(speech_audio.file_path)
+            music_params = self._wav_params(background_music.file_path)
+            if (speech_params and music_params
+                    and speech_params.sampwidth == music_params.sampwidth == 2
+                    and speech_params.framerate == music_params.framerate):
+                return self._numpy_remix(speech_audio, background_music, volume_ratio)
+        
+        # pydub decodes and resamples other formats
         if PYDUB_AVAILABLE:
             return self._pydub_remix(speech_audio, background_music, volume_ratio)
         
@@ -457,13 +1180,12 @@ class AudioRemixer:
             mixed = speech.overlay(music)
             
             # Save to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_file.close()
+            temp_path = _temp_file_pool.acquire('.wav')
             
-            mixed.export(temp_file.name, format="wav")
+            mixed.export(temp_path, format="wav")
             
             return AudioFile(
-                file_path=temp_file.name,
+                file_path=temp_path,
                 duration=len(mixed) / 1000.0,
                 format="wav",
                 metadata={
@@ -478,10 +1200,151 @@ class AudioRemixer:
             self.logger.error(f"Pydub remix failed: {e}")
             return None
     
+    @staticmethod
+    def _wav_params(file_path: str):
+        """Read the header of a PCM WAV file, or None if it is not one."""
+        try:
+            with wave.open(file_path, 'rb') as wav:
+                return wav.getparams()
+        except (wave.Error, EOFError, OSError):
+            return None
+    
+    @staticmethod
+    def _read_wav_int16(file_path: str):
+        """
+        Decode a 16-bit PCM WAV file.
+        
+        Args:
+            file_path: Path to the WAV file
+            
+        Returns:
+            Tuple of (int16 samples shaped (frames, channels), sample rate)
+        """
+        with wave.open(file_path, 'rb') as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("Only 16-bit PCM WAV is supported")
+            channels = wav.getnchannels()
+            frames = wav.readframes(wav.getnframes())
+            framerate = wav.getframerate()
+        samples = np.frombuffer(frames, dtype='<i2').reshape(-1, channels)
+        return samples, framerate
+    
+    @staticmethod
+    def _write_wav_int16(samples, framerate: int) -> str:
+        """
+        Encode int16 samples as a 16-bit PCM WAV temp file.
+        
+        Args:
+            samples: int16 samples shaped (frames, channels)
+            framerate: Sample rate in Hz
+            
+        Returns:
+            Path of the written temp file
+        """
+        temp_path = _temp_file_pool.acquire('.wav')
+        with wave.open(temp_path, 'wb') as wav:
+            wav.setnchannels(samples.shape[1])
+            wav.setsampwidth(2)
+            wav.setframerate(framerate)
+            wav.writeframes(samples.astype('<i2', copy=False).tobytes())
+        return temp_path
+    
+    @classmethod
+    def _mix_buffer(cls, frames: int, channels: int):
+        """
+        Get a float32 scratch buffer of shape (frames, channels) for this thread.
+        
+        Args:
+            frames: Number of frames needed
+            channels: Number of channels
+            
+        Returns:
+            View of a pooled buffer (or a fresh one above MAX_POOLED_MIX_FRAMES);
+            its contents are undefined
+        """
+        if frames > cls.MAX_POOLED_MIX_FRAMES:
+            return np.empty((frames, channels), dtype=np.float32)
+        
+        buffers = getattr(cls._mix_buffers, "by_channels", None)
+        if buffers is None:
+            buffers = cls._mix_buffers.by_channels = {}
+        buffer = buffers.get(channels)
+        if buffer is None or len(buffer) < frames:
+            buffer = buffers[channels] = np.empty((frames, channels), dtype=np.float32)
+        return buffer[:frames]
+    
+    @classmethod
+    def _numpy_mix(cls, speech, music, volume_ratio: float):
+        """
+        Mix two int16 sample arrays into one, saturating instead of wrapping.
+        
+        The music is looped or trimmed to the speech length; mono music is
+        broadcast across speech channels and other layouts are downmixed.
+        
+        Args:
+            speech: Speech samples shaped (frames, channels)
+            music: Music samples shaped (frames, channels)
+            volume_ratio: Speech to music volume ratio (0.0 to 1.0)
+            
+        Returns:
+            int16 array shaped like speech
+        """
+        frames, channels = speech.shape
+        if music.shape[1] not in (1, channels):
+            music = music.mean(axis=1, keepdims=True)
+        
+        # Scale into the pooled buffer, then add the music period by period
+        # instead of materializing a looped copy of it
+        mixed = cls._mix_buffer(frames, channels)
+        np.multiply(speech, np.float32(volume_ratio), out=mixed)
+        scaled_music = music[:frames] * np.float32(1.0 - volume_ratio)
+        period = len(scaled_music)
+        if period:
+            for start in range(0, frames, period):
+                window = mixed[start:start + period]
+                window += scaled_music[:len(window)]
+        
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype(np.int16)
+    
+    @classmethod
+    def _fused_effects(cls, samples, effects: Dict[str, Any], framerate: int):
+        """
+        Apply volume and fades as one gain envelope in a single pass.
+        
+        Matches pydub's effects: volume in dB, and fades that ramp the
+        amplitude linearly over the given number of seconds.
+        
+        Args:
+            samples: int16 samples shaped (frames, channels)
+            effects: Dictionary of effects ('volume', 'fade_in', 'fade_out')
+            framerate: Sample rate in Hz
+            
+        Returns:
+            int16 array shaped like samples
+        """
+        frames, channels = samples.shape
+        gain = np.full(frames, 10 ** (effects.get('volume', 0) / 20), dtype=np.float32)
+        
+        fade_in = min(int(effects.get('fade_in', 0) * framerate), frames)
+        if fade_in > 0:
+            gain[:fade_in] *= np.linspace(0, 1, fade_in, dtype=np.float32)
+        fade_out = min(int(effects.get('fade_out', 0) * framerate), frames)
+        if fade_out > 0:
+            gain[frames - fade_out:] *= np.linspace(1, 0, fade_out, dtype=np.float32)
+        
+        processed = cls._mix_buffer(frames, channels)
+        np.multiply(samples, gain[:, np.newaxis], out=processed)
+        np.clip(processed, -32768, 32767, out=processed)
+        return processed.astype(np.int16)
+    
     def _numpy_remix(self, speech_audio: AudioFile, background_music: AudioFile,
                     volume_ratio: float) -> Optional[AudioFile]:
         """
-        Create remix using numpy fallback (basic implementation).
+        Create remix by mixing 16-bit PCM WAV samples with numpy.
+        
+        Inputs that cannot be decoded as 16-bit WAV at a shared sample rate
+        fall back to a copy of the speech.
         
         Args:
             speech_audio: Speech audio file
@@ -492,19 +1355,56 @@ class AudioRemixer:
             AudioFile with remixed audio or None if failed
         """
         try:
-            # This is a simplified implementation
-            # In a real scenario, you'd need to read WAV files properly
-            # For now, we'll just copy the speech file and add metadata
+            speech, framerate = self._read_wav_int16(speech_audio.file_path)
+            music, music_framerate = self._read_wav_int16(background_music.file_path)
+            if music_framerate != framerate:
+                raise ValueError("Sample rates differ")
+        except (wave.Error, EOFError, ValueError, OSError) as e:
+            self.logger.info(f"Numpy mixing unavailable for these inputs ({e}), copying speech")
+            return self._copy_speech_remix(speech_audio, background_music, volume_ratio)
+        
+        try:
+            mixed = self._numpy_mix(speech, music, volume_ratio)
+            temp_path = self._write_wav_int16(mixed, framerate)
+            
+            return AudioFile(
+                file_path=temp_path,
+                duration=mixed.shape[0] / framerate,
+                format="wav",
+                metadata={
+                    "provider": "numpy_remix",
+                    "speech_file": speech_audio.file_path,
+                    "music_file": background_music.file_path,
+                    "volume_ratio": volume_ratio
+                }
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Numpy remix failed: {e}")
+            return None
+    
+    def _copy_speech_remix(self, speech_audio: AudioFile, background_music: AudioFile,
+                           volume_ratio: float) -> Optional[AudioFile]:
+        """
+        Fall back to a copy of the speech when no mixing backend can handle the inputs.
+        
+        Args:
+            speech_audio: Speech audio file
+            background_music: Background music file
+            volume_ratio: Volume ratio for mixing
             
+        Returns:
+            AudioFile with the copied speech or None if failed
+        """
+        try:
             import shutil
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_file.close()
+            temp_path = _temp_file_pool.acquire('.wav')
             
             # Copy speech file as fallback
-            shutil.copy2(speech_audio.file_path, temp_file.name)
+            shutil.copy2(speech_audio.file_path, temp_path)
             
             return AudioFile(
-                file_path=temp_file.name,
+                file_path=temp_path,
                 duration=speech_audio.duration,
                 format="wav",
                 metadata={
@@ -534,11 +1434,35 @@ class AudioRemixer:
         if not audio or not os.path.exists(audio.file_path):
             return None
         
-        if not PYDUB_AVAILABLE:
+        # 16-bit PCM WAV is processed with numpy; pydub decodes anything else
+        wav_params = self._wav_params(audio.file_path) if NUMPY_AVAILABLE else None
+        use_numpy = bool(wav_params and wav_params.sampwidth == 2)
+        if not use_numpy and not PYDUB_AVAILABLE:
             self.logger.warning("Pydub not available - effects not applied")
             return audio
         
         try:
+            cache_key = self._effects_cache_key(audio.file_path, effects)
+            cached_audio = self.effects_cache.get(cache_key)
+            if cached_audio:
+                return cached_audio
+            
+            if use_numpy:
+                samples, framerate = self._read_wav_int16(audio.file_path)
+                processed = self._fused_effects(samples, effects, framerate)
+                result = AudioFile(
+                    file_path=self._write_wav_int16(processed, framerate),
+                    duration=processed.shape[0] / framerate,
+                    format="wav",
+                    metadata={
+                        **audio.metadata,
+                        "effects_applied": effects,
+                        "processed_by": "numpy_effects"
+                    }
+                )
+                self.effects_cache.put(cache_key, result)
+                return result
+            
             audio_segment = AudioSegment.from_file(audio.file_path)
             
             # Apply volume adjustment
@@ -556,13 +1480,12 @@ class AudioRemixer:
                 audio_segment = audio_segment.fade_out(fade_out_ms)
             
             # Save processed audio
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_file.close()
+            temp_path = _temp_file_pool.acquire('.wav')
             
-            audio_segment.export(temp_file.name, format="wav")
+            audio_segment.export(temp_path, format="wav")
             
-            return AudioFile(
-                file_path=temp_file.name,
+            result = AudioFile(
+                file_path=temp_path,
                 duration=len(audio_segment) / 1000.0,
                 format="wav",
                 metadata={
@@ -571,10 +1494,26 @@ class AudioRemixer:
                     "processed_by": "pydub_effects"
                 }
             )
+            self.effects_cache.put(cache_key, result)
+            return result
             
         except Exception as e:
             self.logger.error(f"Audio effects processing failed: {e}")
             return audio
+    
+    @staticmethod
+    def _effects_cache_key(file_path: str, effects: Dict[str, Any]) -> str:
+        """
+        Build the effects cache key from the audio content and the effect chain.
+        
+        Args:
+            file_path: Path to the input audio
+            effects: Dictionary of effects to apply
+            
+        Returns:
+            Hex digest identifying the rendering
+        """
+        return _file_digest(file_path, json.dumps(effects, sort_keys=True, default=str).encode("utf-8"))
 
 
 class AudioManager:
@@ -593,6 +1532,7 @@ class AudioManager:
         self.tts_processor = TTSProcessor(elevenlabs_api_key)
         self.audio_remixer = AudioRemixer()
         self.logger = logging.getLogger(__name__)
+        self._availability = None
     
     @monitor_performance("complete_audio_processing")
     def process_text_to_audio(self, text: str, voice_settings: Optional[Dict[str, Any]] = None,
@@ -643,6 +1583,36 @@ class AudioManager:
             progress.complete(f"Error: {str(e)}")
             raise
     
+    @monitor_performance("batch_audio_processing")
+    def process_texts_to_audio(self, texts: List[str],
+                               voice_settings: Optional[Dict[str, Any]] = None) -> List[Optional[AudioFile]]:
+        """
+        Convert several texts to speech in one batch.
+        
+        Args:
+            texts: Texts to convert to speech
+            voice_settings: Optional voice configuration applied to every text
+            
+        Returns:
+            Speech AudioFile (or None on failure) for each text, in input order
+        """
+        with LoadingIndicator(f"Converting {len(texts)} texts to speech...", show_spinner=False):
+            return self.tts_processor.texts_to_speech(texts, voice_settings)
+    
+    def stream_text_to_audio(self, text: str,
+                             voice_settings: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+        """
+        Stream speech audio for text without waiting for full synthesis.
+        
+        Args:
+            text: Text to convert to speech
+            voice_settings: Optional voice configuration
+            
+        Returns:
+            Iterator over chunks of encoded audio data
+        """
+        return self.tts_processor.text_to_speech_stream(text, voice_settings)
+    
     def get_audio_info(self, audio_file: AudioFile) -> Dict[str, Any]:
         """
         Get detailed information about an audio file.
@@ -687,87 +1657,157 @@ class AudioManager:
         Args:
             audio_files: List of AudioFile objects to clean up
         """
+        # Group temp files by directory so each directory is listed once
+        names_by_dir: Dict[str, set] = {}
         for audio_file in audio_files:
-            if audio_file and audio_file.file_path:
-                try:
-                    if os.path.exists(audio_file.file_path) and 'tmp' in audio_file.file_path:
-                        os.unlink(audio_file.file_path)
-                        self.logger.debug(f"Cleaned up temp file: {audio_file.file_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to cleanup temp file {audio_file.file_path}: {e}")
+            if audio_file and audio_file.file_path and 'tmp' in audio_file.file_path:
+                directory, name = os.path.split(audio_file.file_path)
+                names_by_dir.setdefault(directory or os.curdir, set()).add(name)
+        
+        for directory, names in names_by_dir.items():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name in names:
+                            _temp_file_pool.release(entry.path)
+                            self.logger.debug(f"Cleaned up temp file: {entry.path}")
+            except OSError as e:
+                self.logger.warning(f"Failed to cleanup temp files in {directory}: {e}")
     
     def is_audio_processing_available(self) -> Dict[str, bool]:
         """
         Check availability of audio processing capabilities.
         
         Returns:
-            Dictionary indicating which features are available
-        """
-        return {
-            'pyttsx3_tts': PYTTSX3_AVAILABLE and self.tts_processor.pyttsx3_engine is not None,
-            'elevenlabs_tts': bool(self.tts_processor.elevenlabs_api_key and REQUESTS_AVAILABLE),
-            'pydub_mixing': PYDUB_AVAILABLE,
-            'numpy_fallback': NUMPY_AVAILABLE,
-            'any_tts': (PYTTSX3_AVAILABLE and self.tts_processor.pyttsx3_engine is not None) or 
-                      (bool(self.tts_processor.elevenlabs_api_key and REQUESTS_AVAILABLE))
-        }
+            Dictionary indicating which features are available (a fresh copy)
+        """
+        # The engine and API key are fixed for this manager, so compute once
+        if self._availability is None:
+            pyttsx3_tts = PYTTSX3_AVAILABLE and self.tts_processor.pyttsx3_engine is not None
+            elevenlabs_tts = bool(self.tts_processor.elevenlabs_api_key and REQUESTS_AVAILABLE)
+            self._availability = {
+                'pyttsx3_tts': pyttsx3_tts,
+                'elevenlabs_tts': elevenlabs_tts,
+                **_AVAILABILITY,
+                'any_tts': pyttsx3_tts or elevenlabs_tts
+            }
+        return self._availability.copy()
 
 
 # Utility functions for audio processing
 
-def get_default_background_music_path() -> Optional[str]:
+# Directories searched for background music, and preferred file names in them
+# (highest priority first)
+BACKGROUND_MUSIC_DIRS = ('assets', 'audio', 'resources')
+BACKGROUND_MUSIC_NAMES = (
+    'background_music.mp3', 'background_music.wav',
+    'background.mp3', 'background.wav', 'music.mp3'
+)
+_BACKGROUND_MUSIC_PRIORITY = {name: i for i, name in enumerate(BACKGROUND_MUSIC_NAMES)}
+BACKGROUND_MUSIC_EXTENSIONS = ('.mp3', '.wav', '.ogg')
+
+
+def get_default_background_music_path(search_dirs: Optional[List[str]] = None) -> Optional[str]:
     """
     Get path to default background music file if available.
     
+    Each directory is listed once with os.scandir. Directories are tried in
+    order, and within one the earliest name in BACKGROUND_MUSIC_NAMES wins,
+    whatever order the entries are listed in. If no directory has a preferred
+    name, the alphabetically first audio file of the first directory with any
+    audio is used.
+    
+    Args:
+        search_dirs: Directories to search (default: BACKGROUND_MUSIC_DIRS)
+    
     Returns:
         Path to default background music or None
     """
-    # Look for common background music files in the project
-    possible_paths = [
-        'assets/background_music.mp3',
-        'assets/background_music.wav',
-        'audio/background.mp3',
-        'audio/background.wav',
-        'resources/music.mp3'
-    ]
+    fallback = None
+    
+    for directory in search_dirs or BACKGROUND_MUSIC_DIRS:
+        best_rank, best_path = len(BACKGROUND_MUSIC_NAMES), None
+        first_name, first_path = None, None
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name.lower()
+                    if not name.endswith(BACKGROUND_MUSIC_EXTENSIONS) or not entry.is_file():
+                        continue
+                    rank = _BACKGROUND_MUSIC_PRIORITY.get(name, best_rank)
+                    if rank < best_rank:
+                        best_rank, best_path = rank, entry.path
+                    if fallback is None and (first_name is None or name < first_name):
+                        first_name, first_path = name, entry.path
+        except OSError:
+            # Directory missing or unreadable
+            continue
+        
+        if best_path is not None:
+            return best_path
+        if fallback is None:
+            fallback = first_path
     
-    for path in possible_paths:
-        if os.path.exists(path):
-            return path
+    return fallback
+
+
+# Extension -> (offset, magic) pairs that must all match the file header
+_AUDIO_SIGNATURES = {
+    '.wav': ((0, b'RIFF'), (8, b'WAVE')),
+    '.mp3': ((0, b'ID3'),),
+    '.ogg': ((0, b'OggS'),),
+    '.flac': ((0, b'fLaC'),),
+    '.m4a': ((4, b'ftyp'),),
+}
+_AUDIO_HEADER_BYTES = 12
+
+
+def _has_audio_signature(head: bytes, file_ext: str) -> bool:
+    """
+    Check the leading bytes of a file against its format signature.
     
-    return None
+    Args:
+        head: First bytes of the file (at least 12 for WAV/M4A)
+        file_ext: Lowercased file extension including the dot
+        
+    Returns:
+        True if the header matches the extension's format, False otherwise
+    """
+    signature = _AUDIO_SIGNATURES.get(file_ext)
+    if signature is None:
+        return False
+    if all(head[offset:offset + len(magic)] == magic for offset, magic in signature):
+        return True
+    # MP3 without an ID3 tag starts with a bare MPEG frame sync word
+    return file_ext == '.mp3' and len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0
 
 
 def validate_audio_file(file_path: str) -> bool:
     """
     Validate if a file is a valid audio file.
     
+    Only the file header is read; the extension must match the format
+    signature found in the first 12 bytes.
+    
     Args:
         file_path: Path to audio file
         
     Returns:
         True if valid audio file, False otherwise
     """
-    if not os.path.exists(file_path):
-        return False
-    
     # Check file extension
-    valid_extensions = ['.wav', '.mp3', '.m4a', '.ogg', '.flac']
     file_ext = os.path.splitext(file_path)[1].lower()
-    
-    if file_ext not in valid_extensions:
+    if file_ext not in _AUDIO_SIGNATURES:
         return False
     
-    # Try to load with pydub if available
-    if PYDUB_AVAILABLE:
-        try:
-            AudioSegment.from_file(file_path)
-            return True
-        except Exception:
-            return False
+    # A missing file fails the open, so no separate existence check is needed
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(_AUDIO_HEADER_BYTES)
+    except OSError:
+        return False
     
-    # Basic validation - file exists and has valid extension
-    return True
+    return _has_audio_signature(head, file_ext)
 
 
 def create_silence_audio(duration_seconds: float) -> Optional[AudioFile]:
@@ -786,13 +1826,12 @@ def create_silence_audio(duration_seconds: float) -> Optional[AudioFile]:
     try:
         silence = AudioSegment.silent(duration=int(duration_seconds * 1000))
         
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-        temp_file.close()
+        temp_path = _temp_file_pool.acquire('.wav')
         
-        silence.export(temp_file.name, format="wav")
+        silence.export(temp_path, format="wav")
         
         return AudioFile(
-            file_path=temp_file.name,
+            file_path=temp_path,
             duration=duration_seconds,
             format="wav",
             metadata={"provider": "pydub_silence"}
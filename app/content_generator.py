@@ -5,6 +5,7 @@ Provides AI-powered content generation with fallback mechanisms for supportive s
 
 import os
 import time
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
@@ -775,6 +776,24 @@ class ContentGenerator:
             progress.complete(f"Error: {str(e)}")
             raise
     
+    async def agenerate_support_and_poem(self, input_data: ProcessedInput) -> GeneratedContent:
+        """
+        Async variant of generate_support_and_poem.
+        
+        Runs the blocking generation chain in a worker thread so several
+        inputs can be awaited together with asyncio.gather.
+        
+        Args:
+            input_data: Processed input from user
+            
+        Returns:
+            GeneratedContent with supportive statement and poem
+            
+        Raises:
+            RuntimeError: If all generators fail
+        """
+        return await asyncio.to_thread(self.generate_support_and_poem, input_data)
+    
     def is_gemini_available(self) -> bool:
         """
         Check if Gemini generator is available.
@@ -8,10 +8,39 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import List, Dict, Optional, Any
+import os
+import random
+import sys
 import uuid
 import re
 
 
+# Dataclass options shared by the app's models: slots=True needs Python 3.10+;
+# older interpreters keep dict-backed instances
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Private PRNG for interaction IDs, seeded from os.urandom; random.seed()
+# calls elsewhere must not make IDs repeat, and forked children reseed so
+# they do not replay the parent's sequence
+_id_random = random.Random()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_random.seed)
+
+
+def generate_interaction_id() -> str:
+    """
+    Generate a random version-4 UUID string for an interaction.
+    
+    Interaction IDs only need to be unique, not unpredictable, so the bits
+    come from an in-process PRNG instead of an os.urandom read per ID.
+    
+    Returns:
+        str: UUID4-formatted identifier
+    """
+    return str(uuid.UUID(int=_id_random.getrandbits(128), version=4))
+
+
 class InputType(Enum):
     """Enumeration of supported input types."""
     TEXT = "text"
@@ -19,7 +48,7 @@ class InputType(Enum):
     DRAWING = "drawing"
 
 
-@dataclass
+@dataclass(**SLOTS)
 class User:
     """User profile data model."""
     nickname: str
@@ -40,7 +69,7 @@ class User:
             raise ValueError("Password must be at least 4 characters long")
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ProcessedInput:
     """Processed input data from various input sources."""
     content: str
@@ -57,9 +86,32 @@ class ProcessedInput:
             raise ValueError("Input type must be a valid InputType enum")
         if self.transcription is not None and not isinstance(self.transcription, str):
             raise ValueError("Transcription must be a string if provided")
+    
+    @classmethod
+    def _fast(cls, content: str, input_type: InputType, metadata: Optional[Dict[str, Any]] = None,
+              raw_data: Optional[bytes] = None) -> "ProcessedInput":
+        """
+        Build an instance from trusted values, skipping __init__ and validation.
+        
+        Args:
+            content: Non-empty input content
+            input_type: Type of the input
+            metadata: Optional metadata dictionary
+            raw_data: Optional raw input bytes
+            
+        Returns:
+            ProcessedInput with no transcription
+        """
+        obj = object.__new__(cls)
+        obj.content = content
+        obj.input_type = input_type
+        obj.metadata = metadata if metadata is not None else {}
+        obj.raw_data = raw_data
+        obj.transcription = None
+        return obj
 
 
-@dataclass
+@dataclass(**SLOTS)
 class GeneratedContent:
     """AI-generated content including supportive statements and poems."""
     supportive_statement: str
@@ -72,6 +124,26 @@ class GeneratedContent:
             raise ValueError("Supportive statement must be a non-empty string")
         if not self.poem or not isinstance(self.poem, str):
             raise ValueError("Poem must be a non-empty string")
+    
+    @classmethod
+    def _fast(cls, supportive_statement: str, poem: str,
+              generation_metadata: Optional[Dict[str, Any]] = None) -> "GeneratedContent":
+        """
+        Build an instance from trusted values, skipping __init__ and validation.
+        
+        Args:
+            supportive_statement: Non-empty supportive statement
+            poem: Non-empty poem
+            generation_metadata: Optional generation metadata
+            
+        Returns:
+            GeneratedContent instance
+        """
+        obj = object.__new__(cls)
+        obj.supportive_statement = supportive_statement
+        obj.poem = poem
+        obj.generation_metadata = generation_metadata if generation_metadata is not None else {}
+        return obj
 
 
 @dataclass
@@ -88,10 +160,10 @@ class AudioFile:
             raise ValueError("File path must be a non-empty string")
 
 
-@dataclass
+@dataclass(**SLOTS)
 class Interaction:
     """Complete interaction data including input, generated content, and outputs."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=generate_interaction_id)
     timestamp: datetime = field(default_factory=datetime.now)
     input_data: Optional[ProcessedInput] = None
     generated_content: Optional[GeneratedContent] = None
@@ -102,6 +174,37 @@ class Interaction:
         """Validate interaction data."""
         if not self.id or not isinstance(self.id, str):
             raise ValueError("ID must be a non-empty string")
+    
+    @classmethod
+    def _fast(cls, content: str, input_type: InputType, support: str, poem: str,
+              raw: Optional[bytes] = None, meta: Optional[Dict[str, Any]] = None,
+              generation_meta: Optional[Dict[str, Any]] = None) -> "Interaction":
+        """
+        Build a new text/drawing interaction from trusted values in one step.
+        
+        Skips dataclass keyword binding and validation for callers that
+        already hold well-formed data, such as demos and bulk imports.
+        
+        Args:
+            content: Non-empty input content
+            input_type: Type of the input
+            support: Non-empty supportive statement
+            poem: Non-empty poem
+            raw: Optional raw input bytes
+            meta: Optional input metadata
+            generation_meta: Optional generation metadata
+            
+        Returns:
+            Interaction with a fresh ID and timestamp and no outputs yet
+        """
+        obj = object.__new__(cls)
+        obj.id = generate_interaction_id()
+        obj.timestamp = datetime.now()
+        obj.input_data = ProcessedInput._fast(content, input_type, meta, raw)
+        obj.generated_content = GeneratedContent._fast(support, poem, generation_meta)
+        obj.audio_files = []
+        obj.file_paths = {}
+        return obj
 
 
 # Validation Functions
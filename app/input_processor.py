@@ -138,13 +138,13 @@ class InputProcessor:
             transcription=transcription  # Store full transcription separately
         )
     
-    def process_drawing_input(self, canvas_data: Union[Dict[str, Any], str], 
+    def process_drawing_input(self, canvas_data: Union[Dict[str, Any], str, bytes], 
                             metadata: Optional[Dict[str, Any]] = None) -> ProcessedInput:
         """
         Process drawing canvas input and generate PNG.
         
         Args:
-            canvas_data: Canvas data (dict with drawing info or base64 string)
+            canvas_data: Canvas data (dict with drawing info, base64 string or raw image bytes)
             metadata: Optional metadata dictionary
             
         Returns:
@@ -355,12 +355,12 @@ class DrawingProcessor:
         """Initialize the drawing processor."""
         pass
     
-    def process_canvas_data(self, canvas_data: Union[Dict[str, Any], str]) -> tuple[Optional[bytes], str]:
+    def process_canvas_data(self, canvas_data: Union[Dict[str, Any], str, bytes]) -> tuple[Optional[bytes], str]:
         """
         Process canvas data and generate PNG with description.
         
         Args:
-            canvas_data: Canvas data (dict or base64 string)
+            canvas_data: Canvas data (dict, base64 string or raw image bytes)
             
         Returns:
             tuple: (PNG bytes, description string)
@@ -371,11 +371,17 @@ class DrawingProcessor:
         if isinstance(canvas_data, str):
             # Handle base64 encoded image data
             return self._process_base64_image(canvas_data)
+        elif isinstance(canvas_data, (bytes, bytearray, memoryview)):
+            # Handle raw image bytes without a base64 round-trip
+            try:
+                return self._process_image_bytes(bytes(canvas_data))
+            except Exception as e:
+                raise ValueError(f"Failed to process image bytes: {str(e)}")
         elif isinstance(canvas_data, dict):
             # Handle structured canvas data
             return self._process_canvas_dict(canvas_data)
         else:
-            raise ValueError("Canvas data must be string (base64) or dictionary")
+            raise ValueError("Canvas data must be string (base64), bytes or dictionary")
     
     def _process_base64_image(self, base64_data: str) -> tuple[Optional[bytes], str]:
         """
@@ -390,26 +396,41 @@ class DrawingProcessor:
         try:
             # Remove data URL prefix if present
             if base64_data.startswith('data:image'):
-                base64_data = base64_data.split(',', 1)[1]
+                _, _, base64_data = base64_data.partition(',')
             
-            # Decode base64 data
-            image_bytes = base64.b64decode(base64_data)
+            # Decode base64 data straight from the str without an extra encode
+            image_bytes = base64.b64decode(base64_data, validate=False)
             
-            # Open and validate image
-            image = Image.open(io.BytesIO(image_bytes))
+            return self._process_image_bytes(image_bytes)
             
-            # Convert to PNG if not already
+        except Exception as e:
+            raise ValueError(f"Failed to process base64 image: {str(e)}")
+    
+    def _process_image_bytes(self, image_bytes: bytes) -> tuple[Optional[bytes], str]:
+        """
+        Process raw encoded image bytes.
+        
+        Args:
+            image_bytes: Encoded image data (PNG, JPEG, ...)
+            
+        Returns:
+            tuple: (PNG bytes, description string)
+        """
+        # Open and validate image
+        image = Image.open(io.BytesIO(image_bytes))
+        
+        # PNG input is kept as-is; anything else is re-encoded
+        if image.format == 'PNG':
+            png_data = image_bytes
+        else:
             png_buffer = io.BytesIO()
             image.save(png_buffer, format='PNG')
             png_data = png_buffer.getvalue()
-            
-            # Generate description
-            description = self._generate_image_description(image)
-            
-            return png_data, description
-            
-        except Exception as e:
-            raise ValueError(f"Failed to process base64 image: {str(e)}")
+        
+        # Generate description
+        description = self._generate_image_description(image)
+        
+        return png_data, description
     
     def _process_canvas_dict(self, canvas_data: Dict[str, Any]) -> tuple[Optional[bytes], str]:
         """
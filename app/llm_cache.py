@@ -0,0 +1,329 @@
+"""
+Response cache for LLM calls in EchoVerse companion application.
+Stores generated text keyed by a hash of the model, prompt and generation
+parameters, in memory or as JSON files on disk, plus a similarity cache
+that matches paraphrased requests by embedding.
+"""
+
+import hashlib
+import json
+import math
+import operator
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+
+def cache_key(model: str, prompt: str, **params: Any) -> str:
+    """
+    Build a stable cache key for an LLM request.
+    
+    Args:
+        model: Model name the prompt is sent to
+        prompt: Prompt text
+        **params: Generation parameters that affect the output (e.g. temperature)
+    
+    Returns:
+        str: Hex SHA-256 digest identifying the request
+    """
+    payload = json.dumps({"model": model, "prompt": prompt, "params": params}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage interface used by the LLM response cache."""
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached value for key, or None if missing or expired."""
+        ...
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process cache backend."""
+    
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._entries: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None if not found/expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires is not None and time.time() > expires:
+                del self._entries[key]
+                return None
+            return value
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl: Time-to-live in seconds (None keeps the entry indefinitely)
+        """
+        expires = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+
+
+class FileCacheBackend:
+    """Cache backend storing one JSON file per key in a directory."""
+    
+    def __init__(self, directory: str):
+        """
+        Initialize the file cache.
+        
+        Args:
+            directory: Directory holding the cache files (created if missing)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, key: str) -> Path:
+        """Get the file path for a cache key."""
+        return self.directory / f"{key}.json"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached value.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None if not found, expired or unreadable
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        expires = entry.get("expires")
+        if expires is not None and time.time() > expires:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return entry.get("value")
+    
+    def set(self, key: str, value: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value to cache
+            ttl: Time-to-live in seconds (None keeps the entry indefinitely)
+        """
+        entry = {
+            "expires": time.time() + ttl if ttl is not None else None,
+            "value": value
+        }
+        
+        # Write then rename so concurrent readers never see a partial file
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """Scale a vector to unit length so dot products are cosine similarities."""
+    norm = math.sqrt(sum(map(operator.mul, vector, vector)))
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+class SemanticCache:
+    """
+    Cache matching requests by embedding cosine similarity instead of exact text.
+    Entries are stored under a scope (e.g. the model and system instruction)
+    and only match lookups made in the same scope.
+    """
+    
+    # Lower bound on the number of recent embeddings kept for reuse
+    MIN_EMBEDDING_CACHE = 128
+    
+    def __init__(self, embed: Callable[[str], Sequence[float]], threshold: float = 0.92,
+                 path: Optional[str] = None):
+        """
+        Initialize the semantic cache.
+        
+        Args:
+            embed: Function returning an embedding vector for a text
+            threshold: Minimum cosine similarity for a cached entry to match
+            path: Optional JSON Lines file the entries are loaded from and appended to
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.path = Path(path) if path else None
+        self._vectors: List[List[float]] = []
+        self._values: List[Dict[str, Any]] = []
+        self._scopes: List[str] = []
+        # Recent embeddings computed by get(), reused by the set() that follows a miss;
+        # least recently used first, holding at most as many as there are entries
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Whether the file ends mid-line (legacy list or a write cut short)
+        self._unterminated = False
+        
+        if self.path and self.path.exists():
+            try:
+                with open(self.path, "rb") as f:
+                    f.seek(0, os.SEEK_END)
+                    if f.tell():
+                        f.seek(-1, os.SEEK_END)
+                        self._unterminated = f.read(1) != b"\n"
+            except OSError:
+                pass
+            for entry in self._read_entries(self.path):
+                try:
+                    vector, value, scope = entry["vector"], entry["value"], entry.get("scope", "")
+                except (KeyError, TypeError, AttributeError):
+                    continue
+                self._vectors.append(vector)
+                self._values.append(value)
+                self._scopes.append(scope)
+    
+    @staticmethod
+    def _read_entries(path: Path) -> List[Any]:
+        """
+        Read the stored entries of a cache file.
+        
+        Args:
+            path: JSON Lines file, or a JSON list written by older versions
+        
+        Returns:
+            Decoded entries; unreadable lines (e.g. a write cut short) are skipped
+        """
+        entries: List[Any] = []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    # Older versions saved all entries as a single JSON list
+                    if isinstance(entry, list):
+                        entries.extend(entry)
+                    else:
+                        entries.append(entry)
+        except OSError:
+            pass
+        return entries
+    
+    def _embedding(self, text: str) -> List[float]:
+        """Get the unit-length embedding of a text, reusing recent results."""
+        with self._lock:
+            vector = self._embeddings.get(text)
+            if vector is not None:
+                self._embeddings.move_to_end(text)
+                return vector
+        
+        # Embed outside the lock so slow embedding calls don't serialize lookups
+        vector = _normalize(self.embed(text))
+        with self._lock:
+            self._embeddings[text] = vector
+            self._embeddings.move_to_end(text)
+            limit = max(self.MIN_EMBEDDING_CACHE, len(self._vectors))
+            while len(self._embeddings) > limit:
+                self._embeddings.popitem(last=False)
+        return vector
+    
+    def leaders(self, texts: Sequence[str]) -> List[int]:
+        """
+        Group texts that would share a cache entry.
+        
+        Each text is assigned the first earlier text it matches, so a batch
+        can send one request per group and answer the rest from it.
+        
+        Args:
+            texts: Request texts, in order
+        
+        Returns:
+            Index of each text's group leader (its own index if it leads)
+        """
+        vectors = [self._embedding(text) for text in texts]
+        heads: List[int] = []
+        leaders: List[int] = []
+        for i, vector in enumerate(vectors):
+            leader = next((j for j in heads
+                           if sum(map(operator.mul, vectors[j], vector)) >= self.threshold), None)
+            if leader is None:
+                heads.append(i)
+                leader = i
+            leaders.append(leader)
+        return leaders
+    
+    def get(self, text: str, scope: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Get the value cached for the most similar stored text.
+        
+        Args:
+            text: Request text to match
+            scope: Scope the entry was stored under
+        
+        Returns:
+            Cached value if the best match reaches the threshold, None otherwise
+        """
+        query = self._embedding(text)
+        with self._lock:
+            best_score, best_value = -1.0, None
+            for vector, value, entry_scope in zip(self._vectors, self._values, self._scopes):
+                if entry_scope != scope:
+                    continue
+                score = sum(map(operator.mul, vector, query))
+                if score > best_score:
+                    best_score, best_value = score, value
+        return best_value if best_score >= self.threshold else None
+    
+    def set(self, text: str, value: Dict[str, Any], scope: str = "") -> None:
+        """
+        Store a value under the embedding of text.
+        
+        Args:
+            text: Request text the value answers
+            value: JSON-serializable value to cache
+            scope: Scope the entry is matched in
+        """
+        vector = self._embedding(text)
+        with self._lock:
+            self._vectors.append(vector)
+            self._values.append(value)
+            self._scopes.append(scope)
+            if self.path:
+                # Append one line per entry instead of rewriting the whole file
+                line = json.dumps({"vector": vector, "value": value, "scope": scope}) + "\n"
+                if self._unterminated:
+                    line = "\n" + line
+                    self._unterminated = False
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line)
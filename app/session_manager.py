@@ -14,10 +14,10 @@ import uuid
 import logging
 
 try:
-    from .data_models import User, Interaction, GeneratedContent
+    from .data_models import User, Interaction, GeneratedContent, generate_interaction_id
     from .storage_manager import StorageManager, StorageError
 except ImportError:
-    from data_models import User, Interaction, GeneratedContent
+    from data_models import User, Interaction, GeneratedContent, generate_interaction_id
     from storage_manager import StorageManager, StorageError
 
 
@@ -849,7 +849,7 @@ class SessionManager:
                         interaction = self._reconstruct_interaction_from_backup(interaction_data)
                         if interaction:
                             # Save with new ID to avoid conflicts
-                            interaction.id = str(uuid.uuid4())
+                            interaction.id = generate_interaction_id()
                             self.storage.save_interaction(target_user, interaction)
                             migrated_count += 1
                     except Exception as e:
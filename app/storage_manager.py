@@ -3,17 +3,29 @@ Local storage and file management system for EchoVerse companion application.
 Handles user data persistence, interaction storage, and file operations.
 """
 
+import hashlib
 import json
 import os
+import re
 import shutil
+import tarfile
+import threading
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from itertools import compress, islice
+from typing import List, Dict, Optional, Any, Union, Iterator
 import uuid
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from .data_models import (
-        User, Interaction, ProcessedInput, GeneratedContent, AudioFile,
+        User, Interaction, ProcessedInput, GeneratedContent, AudioFile, InputType,
         validate_user_data_integrity, validate_interaction_data_integrity,
         validate_file_path
     )
@@ -23,7 +35,7 @@ try:
     )
 except ImportError:
     from data_models import (
-        User, Interaction, ProcessedInput, GeneratedContent, AudioFile,
+        User, Interaction, ProcessedInput, GeneratedContent, AudioFile, InputType,
         validate_user_data_integrity, validate_interaction_data_integrity,
         validate_file_path
     )
@@ -33,11 +45,43 @@ except ImportError:
     )
 
 
+# Enum value lookup through InputType(...) goes via EnumMeta.__call__;
+# history decoding resolves stored type strings with a plain dict instead
+_INPUT_TYPE_BY_VALUE = {input_type.value: input_type for input_type in InputType}
+
+
 class StorageError(Exception):
     """Custom exception for storage-related errors."""
     pass
 
 
+# Platforms where per-user files can be opened relative to a directory fd
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd
+
+
+def _dir_fd_opener(dir_fd: int):
+    """Build an open() opener resolving names relative to dir_fd."""
+    return lambda name, flags: os.open(name, flags, 0o666, dir_fd=dir_fd)
+
+
+# json.dumps builds a new encoder whenever options are passed; build it once
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _json_loads(data: Any) -> Any:
+    """Parse JSON from bytes or str, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(data).encode('utf-8')
+
+
 class StorageManager:
     """
     Manages all local file operations and data persistence for the application.
@@ -62,6 +106,22 @@ class StorageManager:
         self.pending_operations = []
         self.batch_size = 10
         
+        # Serializes read-modify-write of user.prompts and the profile file
+        self._profile_lock = threading.RLock()
+        
+        # get_storage_stats results per nickname, dropped whenever this manager
+        # writes or removes files under that user's directory
+        self._stats_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Bumped on every profile save, so caches derived from a user's
+        # history can tell when its contents changed
+        self._profile_revisions: Dict[str, int] = {}
+        
+        # Open user directory fds, so profile reads and writes skip the
+        # path walk from base_path; fds of removed directories are retired
+        self._user_dir_fds: Dict[str, int] = {}
+        self._retired_dir_fds: List[int] = []
+        
         # Ensure base directories exist
         self._ensure_directories()
     
@@ -85,6 +145,85 @@ class StorageManager:
         """Get the path to a specific interaction directory."""
         return self._get_user_directory(nickname) / interaction_id
     
+    def _user_dir_fd(self, nickname: str) -> Optional[int]:
+        """
+        Get an open fd for a user's directory, opening it on first use.
+        
+        Args:
+            nickname: The user's nickname
+            
+        Returns:
+            Directory fd, or None if the directory is missing or dir_fd
+            operations are unsupported on this platform
+        """
+        if not _DIR_FD_SUPPORTED:
+            return None
+        
+        with self._profile_lock:
+            fd = self._user_dir_fds.get(nickname)
+            if fd is not None:
+                # A directory removed behind our back has no links left
+                if os.fstat(fd).st_nlink:
+                    return fd
+                # Other threads may still be reading through it; close on close()
+                self._retired_dir_fds.append(self._user_dir_fds.pop(nickname))
+            
+            flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+            try:
+                fd = os.open(self._get_user_directory(nickname), flags)
+            except OSError:
+                return None
+            self._user_dir_fds[nickname] = fd
+            return fd
+    
+    def close(self) -> None:
+        """Close any user directory fds held by this manager."""
+        with self._profile_lock:
+            fds = list(self._user_dir_fds.values()) + self._retired_dir_fds
+            self._user_dir_fds.clear()
+            self._retired_dir_fds = []
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def __del__(self):
+        """Release directory fds when the manager is garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _read_json_file(path: Path, dir_fd: Optional[int] = None) -> Any:
+        """
+        Read and parse a JSON file with a single pre-sized read.
+        
+        Args:
+            path: Path to the JSON file
+            dir_fd: Open fd of the file's directory, if available
+            
+        Returns:
+            Parsed JSON data
+        """
+        if dir_fd is not None:
+            f = open(path.name, 'rb', buffering=0, opener=_dir_fd_opener(dir_fd))
+        else:
+            f = open(path, 'rb', buffering=0)
+        with f:
+            buffer = bytearray(os.fstat(f.fileno()).st_size)
+            view = memoryview(buffer)
+            filled = 0
+            while filled < len(buffer):
+                count = f.readinto(view[filled:])
+                if not count:
+                    break
+                filled += count
+        
+        # Both JSON backends accept UTF-8 bytes directly, so no str copy is made
+        return _json_loads(buffer if filled == len(buffer) else buffer[:filled])
+    
     def user_exists(self, nickname: str) -> bool:
         """
         Check if a user profile exists.
@@ -95,9 +234,8 @@ class StorageManager:
         Returns:
             bool: True if user exists, False otherwise
         """
-        user_dir = self._get_user_directory(nickname)
-        user_file = self._get_user_profile_path(nickname)
-        return user_dir.exists() and user_file.exists()
+        # The profile lives inside the user directory, so one stat covers both
+        return os.path.isfile(self._get_user_profile_path(nickname))
     
     def create_user_directory(self, user: User) -> bool:
         """
@@ -154,14 +292,34 @@ class StorageManager:
             
             # Save to JSON file
             profile_path = self._get_user_profile_path(user.nickname)
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(user_data, f, indent=2, ensure_ascii=False)
+            with self._profile_lock:
+                dir_fd = self._user_dir_fd(user.nickname)
+                if dir_fd is not None:
+                    f = open(profile_path.name, 'wb', opener=_dir_fd_opener(dir_fd))
+                else:
+                    f = open(profile_path, 'wb')
+                with f:
+                    f.write(_json_dumps(user_data))
+                self._profile_revisions[user.nickname] = self._profile_revisions.get(user.nickname, 0) + 1
+            self._stats_cache.pop(user.nickname, None)
             
             return True
             
         except Exception as e:
             raise StorageError(f"Failed to save user profile: {e}")
     
+    def get_profile_revision(self, nickname: str) -> int:
+        """
+        Get the number of times this manager has saved a user's profile.
+        
+        Args:
+            nickname: User's nickname
+            
+        Returns:
+            int: Revision counter, 0 if the profile was never saved here
+        """
+        return self._profile_revisions.get(nickname, 0)
+    
     def load_user_profile(self, nickname: str) -> Optional[User]:
         """
         Load user profile from JSON file.
@@ -175,12 +333,11 @@ class StorageManager:
         try:
             profile_path = self._get_user_profile_path(nickname)
             
-            if not profile_path.exists():
+            try:
+                user_data = self._read_json_file(profile_path, self._user_dir_fd(nickname))
+            except FileNotFoundError:
                 return None
             
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                user_data = json.load(f)
-            
             # Convert ISO string back to datetime
             created = datetime.fromisoformat(user_data['created'])
             
@@ -209,65 +366,231 @@ class StorageManager:
         Returns:
             str: The interaction ID
         """
+        return self.save_interactions_bulk(user, [interaction])[0]
+    
+    @monitor_performance("save_interactions_bulk")
+    def save_interactions_bulk(self, user: User, interactions: List[Interaction]) -> List[str]:
+        """
+        Save several interactions in the user's JSON file with a single write.
+        
+        Args:
+            user: User object
+            interactions: Interaction objects to save
+            
+        Returns:
+            List[str]: The interaction IDs in input order
+        """
+        staged_blobs = []
         try:
-            # Validate interaction data
-            errors = validate_interaction_data_integrity(interaction)
-            if errors:
-                raise StorageError(f"Interaction data validation failed: {', '.join(errors)}")
+            # Validate everything up front so a bad item doesn't leave a partial save
+            for interaction in interactions:
+                errors = validate_interaction_data_integrity(interaction)
+                if errors:
+                    raise StorageError(f"Interaction data validation failed: {', '.join(errors)}")
             
             # Ensure user directory exists
             user_dir = self._get_user_directory(user.nickname)
             user_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create complete interaction data with all information
-            interaction_data = {
-                "id": interaction.id,
-                "timestamp": interaction.timestamp.isoformat(),
-                "input": {
-                    "content": interaction.input_data.content if interaction.input_data else "",
-                    "type": interaction.input_data.input_type.value if interaction.input_data else "text",
-                    "metadata": interaction.input_data.metadata if interaction.input_data else {}
-                },
-                "output": {
-                    "supportive_statement": interaction.generated_content.supportive_statement if interaction.generated_content else "",
-                    "poem": interaction.generated_content.poem if interaction.generated_content else "",
-                    "generation_metadata": interaction.generated_content.metadata if interaction.generated_content else {}
-                },
-                "audio_files": [
-                    {
-                        "type": audio.metadata.get("type", "unknown"),
-                        "duration": audio.duration,
-                        "file_path": audio.file_path,
-                        "metadata": audio.metadata
-                    } for audio in interaction.audio_files
-                ],
-                "created_at": datetime.now().isoformat(),
-                "file_paths": getattr(interaction, 'file_paths', {})
-            }
+            interactions_data = [self._serialize_interaction(interaction) for interaction in interactions]
+            saved_ids = {data["id"] for data in interactions_data}
+            
+            # Raw input bytes live beside the profile, referenced from file_paths;
+            # they stay under temporary names until the profile is saved
+            for interaction, data in zip(interactions, interactions_data):
+                if interaction.input_data and interaction.input_data.raw_data:
+                    temp_path, blob_path, entries = self._write_raw_blob(user.nickname, interaction)
+                    staged_blobs.append((temp_path, blob_path))
+                    data["file_paths"] = {**data["file_paths"], **entries}
+            
+            # Concurrent saves must not drop each other's prompts
+            with self._profile_lock:
+                # Add to user's prompts list (avoid duplicates)
+                if not hasattr(user, 'prompts') or user.prompts is None:
+                    user.prompts = []
+                
+                # Remove any existing interactions with the same IDs
+                user.prompts = [p for p in user.prompts if p.get("id") not in saved_ids]
+                
+                # Add the complete interaction data
+                user.prompts.extend(interactions_data)
+                
+                # Sort by timestamp (newest first)
+                user.prompts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+                
+                # Save updated user profile with all interactions
+                self.save_user_profile(user)
             
-            # Add to user's prompts list (avoid duplicates)
-            if not hasattr(user, 'prompts') or user.prompts is None:
-                user.prompts = []
+            # The profile now references the blobs, so move them into place
+            while staged_blobs:
+                temp_path, blob_path = staged_blobs.pop()
+                os.replace(temp_path, blob_path)
+                self._stats_cache.pop(user.nickname, None)
             
-            # Remove any existing interaction with same ID
-            user.prompts = [p for p in user.prompts if p.get("id") != interaction.id]
+            return [interaction.id for interaction in interactions]
             
-            # Add the complete interaction data
-            user.prompts.append(interaction_data)
+        except Exception as e:
+            raise StorageError(f"Failed to save interactions: {e}")
+        finally:
+            # Blobs of a failed save are discarded rather than left orphaned
+            for temp_path, _ in staged_blobs:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+    
+    def _write_raw_blob(self, nickname: str, interaction: Interaction) -> tuple:
+        """
+        Stage an interaction's raw input bytes for {id}.bin in its directory.
+        
+        The bytes are written to a temporary file that the caller renames to
+        the blob path once the profile referencing it is saved. The profile
+        JSON only carries the relative path and SHA-256 of the blob (the
+        returned file_paths entries), so large drawings never pass through JSON.
+        
+        Args:
+            nickname: User's nickname
+            interaction: Interaction whose input_data.raw_data is non-empty
             
-            # Sort by timestamp (newest first)
-            user.prompts.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
+        Returns:
+            Tuple of (temporary path, blob path, file_paths entries)
+        """
+        raw_data = interaction.input_data.raw_data
+        interaction_dir = self._get_interaction_directory(nickname, interaction.id)
+        interaction_dir.mkdir(parents=True, exist_ok=True)
+        blob_path = interaction_dir / f"{interaction.id}.bin"
+        temp_path = interaction_dir / f".{interaction.id}.{uuid.uuid4().hex}.bin.tmp"
+        
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            view = memoryview(raw_data)
+            while view:
+                view = view[os.write(fd, view):]
+        except BaseException:
+            os.close(fd)
+            os.unlink(temp_path)
+            raise
+        os.close(fd)
+        
+        entries = {
+            "raw_file": blob_path.relative_to(self.base_path).as_posix(),
+            "raw_sha256": hashlib.sha256(raw_data).hexdigest()
+        }
+        return temp_path, blob_path, entries
+    
+    def load_raw_data(self, interaction: Interaction) -> Optional[bytes]:
+        """
+        Load the raw input bytes stored out-of-band for an interaction.
+        
+        History loads leave input_data.raw_data empty; call this only when the
+        original bytes are actually needed.
+        
+        Args:
+            interaction: Interaction loaded from storage
             
-            # Save updated user profile with all interactions
-            self.save_user_profile(user)
+        Returns:
+            The raw bytes, or None if the interaction has no stored blob
+        """
+        raw_file = interaction.file_paths.get("raw_file")
+        if not raw_file:
+            return None
+        
+        try:
+            with open(self.base_path / raw_file, 'rb') as f:
+                raw_data = f.read()
+        except OSError as e:
+            raise StorageError(f"Failed to load raw data: {e}")
+        
+        expected = interaction.file_paths.get("raw_sha256")
+        if expected and hashlib.sha256(raw_data).hexdigest() != expected:
+            raise StorageError(f"Raw data checksum mismatch for interaction {interaction.id}")
+        
+        if interaction.input_data is not None:
+            interaction.input_data.raw_data = raw_data
+        return raw_data
+    
+    def _serialize_interaction(self, interaction: Interaction) -> Dict[str, Any]:
+        """
+        Build the JSON representation of an interaction stored in the user profile.
+        
+        Args:
+            interaction: Interaction object
             
-            return interaction.id
+        Returns:
+            Dictionary containing the complete interaction data
+        """
+        return {
+            "id": interaction.id,
+            "timestamp": interaction.timestamp.isoformat(),
+            "input": {
+                "content": interaction.input_data.content if interaction.input_data else "",
+                "type": interaction.input_data.input_type.value if interaction.input_data else "text",
+                "metadata": interaction.input_data.metadata if interaction.input_data else {}
+            },
+            "output": {
+                "supportive_statement": interaction.generated_content.supportive_statement if interaction.generated_content else "",
+                "poem": interaction.generated_content.poem if interaction.generated_content else "",
+                "generation_metadata": interaction.generated_content.generation_metadata if interaction.generated_content else {}
+            },
+            "audio_files": [
+                {
+                    "type": audio.metadata.get("type", "unknown"),
+                    "duration": audio.duration,
+                    "file_path": audio.file_path,
+                    "metadata": audio.metadata
+                } for audio in interaction.audio_files
+            ],
+            "created_at": datetime.now().isoformat(),
+            "file_paths": getattr(interaction, 'file_paths', {})
+        }
+    
+    def _deserialize_interaction(self, data: Dict[str, Any]) -> Interaction:
+        """
+        Rebuild an Interaction from its embedded user-profile representation.
+        
+        Args:
+            data: Dictionary produced by _serialize_interaction
             
-        except Exception as e:
-            raise StorageError(f"Failed to save interaction: {e}")
+        Returns:
+            Interaction object
+        """
+        interaction = Interaction(
+            id=data["id"],
+            timestamp=datetime.fromisoformat(data["timestamp"])
+        )
+        
+        input_data = data.get("input") or {}
+        if input_data.get("content"):
+            type_value = input_data.get("type", "text")
+            interaction.input_data = ProcessedInput(
+                content=input_data["content"],
+                # Unknown values still raise ValueError through InputType()
+                input_type=_INPUT_TYPE_BY_VALUE.get(type_value) or InputType(type_value),
+                metadata=input_data.get("metadata", {})
+            )
+        
+        output_data = data.get("output") or {}
+        if output_data.get("supportive_statement") and output_data.get("poem"):
+            interaction.generated_content = GeneratedContent(
+                supportive_statement=output_data["supportive_statement"],
+                poem=output_data["poem"],
+                generation_metadata=output_data.get("generation_metadata", {})
+            )
+        
+        for audio in data.get("audio_files", []):
+            if audio.get("file_path"):
+                interaction.audio_files.append(AudioFile(
+                    file_path=audio["file_path"],
+                    duration=audio.get("duration"),
+                    format=Path(audio["file_path"]).suffix.lstrip(".") or "wav",
+                    metadata=audio.get("metadata", {})
+                ))
+        
+        interaction.file_paths = data.get("file_paths", {})
+        return interaction
     
     @monitor_performance("load_interaction")
-    @cache_result("interaction_{args[0]}_{args[1]}", ttl=300)
+    @cache_result("interaction_{args}", ttl=300)
     def load_interaction(self, nickname: str, interaction_id: str) -> Optional[Interaction]:
         """
         Load a complete interaction from storage.
@@ -287,8 +610,7 @@ class StorageManager:
                 return None
             
             # Load metadata
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = self._read_json_file(meta_path)
             
             # Reconstruct interaction object
             interaction = Interaction(
@@ -370,42 +692,71 @@ class StorageManager:
         except Exception as e:
             raise StorageError(f"Failed to load interaction: {e}")
     
+    def _resolve_user(self, user: Union[User, str]) -> User:
+        """
+        Return the User for a User object or nickname.
+        
+        Args:
+            user: User object (used as-is) or nickname to load
+            
+        Returns:
+            User object
+            
+        Raises:
+            StorageError: If no profile exists for the nickname
+        """
+        if isinstance(user, User):
+            return user
+        
+        loaded_user = self.load_user_profile(user)
+        if loaded_user is None:
+            raise StorageError(f"User '{user}' not found")
+        return loaded_user
+    
+    def iter_user_history(self, user: Union[User, str]) -> Iterator[Interaction]:
+        """
+        Lazily yield a user's interactions, newest first.
+        
+        Each interaction is only built when the caller asks for it, so
+        callers that stop early never decode the rest of the history.
+        
+        Args:
+            user: User object or nickname
+            
+        Yields:
+            Interaction objects
+        """
+        user = self._resolve_user(user)
+        prompts = sorted(user.prompts, key=lambda x: x.get("timestamp", ""), reverse=True)
+        
+        for prompt in prompts:
+            interaction_id = prompt.get("id")
+            if not interaction_id:
+                continue
+            
+            if "input" in prompt or "output" in prompt:
+                yield self._deserialize_interaction(prompt)
+                continue
+            
+            # Legacy entry stored in its own interaction directory
+            interaction = self.load_interaction(user.nickname, interaction_id)
+            if interaction:
+                yield interaction
+    
     @monitor_performance("load_user_history")
-    def load_user_history(self, user: User) -> List[Interaction]:
+    def load_user_history(self, user: Union[User, str]) -> List[Interaction]:
         """
         Load complete interaction history for a user.
         
         Args:
-            user: User object
+            user: User object or nickname; pass the in-memory User when
+                available to avoid re-reading the profile
             
         Returns:
             List of Interaction objects
         """
         try:
-            interactions = []
-            
-            # Create progress tracker for loading history
-            total_prompts = len(user.prompts)
-            if total_prompts > 5:  # Only show progress for larger histories
-                progress = ProgressTracker(total_prompts, "Loading interaction history")
-                
-                for i, prompt_meta in enumerate(user.prompts):
-                    progress.update(i + 1, f"Loading interaction {i + 1}/{total_prompts}")
-                    interaction_id = prompt_meta.get("id")
-                    if interaction_id:
-                        interaction = self.load_interaction(user.nickname, interaction_id)
-                        if interaction:
-                            interactions.append(interaction)
-                
-                progress.complete("History loaded")
-            else:
-                # Load without progress tracking for small histories
-                for prompt_meta in user.prompts:
-                    interaction_id = prompt_meta.get("id")
-                    if interaction_id:
-                        interaction = self.load_interaction(user.nickname, interaction_id)
-                        if interaction:
-                            interactions.append(interaction)
+            interactions = list(self.iter_user_history(user))
             
             # Sort by timestamp (newest first)
             interactions.sort(key=lambda x: x.timestamp, reverse=True)
@@ -415,6 +766,65 @@ class StorageManager:
         except Exception as e:
             raise StorageError(f"Failed to load user history: {e}")
     
+    @monitor_performance("load_user_history_columnar")
+    def load_user_history_columnar(self, user: Union[User, str]) -> Dict[str, List[Any]]:
+        """
+        Load a user's interaction history as parallel column lists.
+        
+        Reads the interactions embedded in the user profile in one pass,
+        without building Interaction objects. Entries that only reference a
+        per-interaction directory are loaded through load_interaction.
+        
+        Args:
+            user: User object or nickname
+            
+        Returns:
+            Dictionary with equal-length lists under the keys id, ts,
+            input_type, content, supportive and poem (newest first)
+        """
+        try:
+            user = self._resolve_user(user)
+            columns = {key: [] for key in ("id", "ts", "input_type", "content", "supportive", "poem")}
+            ids = columns["id"]
+            timestamps = columns["ts"]
+            input_types = columns["input_type"]
+            contents = columns["content"]
+            supportive = columns["supportive"]
+            poems = columns["poem"]
+            
+            prompts = sorted(user.prompts, key=lambda x: x.get("timestamp", ""), reverse=True)
+            for prompt in prompts:
+                interaction_id = prompt.get("id")
+                if not interaction_id:
+                    continue
+                
+                if "input" in prompt or "output" in prompt:
+                    input_data = prompt.get("input") or {}
+                    output_data = prompt.get("output") or {}
+                    ids.append(interaction_id)
+                    timestamps.append(datetime.fromisoformat(prompt["timestamp"]))
+                    input_types.append(input_data.get("type", "unknown"))
+                    contents.append(input_data.get("content", ""))
+                    supportive.append(output_data.get("supportive_statement", ""))
+                    poems.append(output_data.get("poem", ""))
+                    continue
+                
+                # Legacy entry stored in its own interaction directory
+                interaction = self.load_interaction(user.nickname, interaction_id)
+                if not interaction:
+                    continue
+                ids.append(interaction.id)
+                timestamps.append(interaction.timestamp)
+                input_types.append(interaction.input_data.input_type.value if interaction.input_data else "unknown")
+                contents.append(interaction.input_data.content if interaction.input_data else "")
+                supportive.append(interaction.generated_content.supportive_statement if interaction.generated_content else "")
+                poems.append(interaction.generated_content.poem if interaction.generated_content else "")
+            
+            return columns
+            
+        except Exception as e:
+            raise StorageError(f"Failed to load user history: {e}")
+    
     def delete_interaction(self, nickname: str, interaction_id: str) -> bool:
         """
         Delete an interaction and all associated files.
@@ -430,13 +840,15 @@ class StorageManager:
             interaction_dir = self._get_interaction_directory(nickname, interaction_id)
             
             if interaction_dir.exists():
-                shutil.rmtree(interaction_dir)
+                FileManager.remove_tree(interaction_dir)
+                self._stats_cache.pop(nickname, None)
             
             # Remove from user's prompt history
-            user = self.load_user_profile(nickname)
-            if user:
-                user.prompts = [p for p in user.prompts if p.get("id") != interaction_id]
-                self.save_user_profile(user)
+            with self._profile_lock:
+                user = self.load_user_profile(nickname)
+                if user:
+                    user.prompts = [p for p in user.prompts if p.get("id") != interaction_id]
+                    self.save_user_profile(user)
             
             return True
             
@@ -447,6 +859,9 @@ class StorageManager:
         """
         Get storage statistics for a user.
         
+        The directory walk only runs after this manager has changed the user's
+        files; repeated calls in between return the cached counters.
+        
         Args:
             nickname: User's nickname
             
@@ -457,8 +872,13 @@ class StorageManager:
             user_dir = self._get_user_directory(nickname)
             
             if not user_dir.exists():
+                self._stats_cache.pop(nickname, None)
                 return {"total_size": 0, "interaction_count": 0, "file_count": 0}
             
+            cached = self._stats_cache.get(nickname)
+            if cached is not None:
+                return dict(cached)
+            
             total_size = 0
             file_count = 0
             interaction_count = 0
@@ -470,16 +890,104 @@ class StorageManager:
                 elif item.is_dir() and item.parent == user_dir:
                     interaction_count += 1
             
-            return {
+            stats = {
                 "total_size": total_size,
                 "interaction_count": interaction_count,
                 "file_count": file_count,
                 "total_size_mb": round(total_size / (1024 * 1024), 2)
             }
+            self._stats_cache[nickname] = stats
+            return dict(stats)
             
         except Exception as e:
             raise StorageError(f"Failed to get storage stats: {e}")
     
+    def export_user(self, nickname: str, out_fd: int) -> int:
+        """
+        Stream a user's stored files into an open file descriptor as a tar archive.
+        
+        Every regular file under the user's directory is exported, including
+        the per-interaction subdirectories and raw .bin blobs, each behind a
+        tar header carrying its relative path and size. File contents are
+        copied kernel-side with os.sendfile, falling back to a buffered copy
+        where sendfile is unavailable or unsupported for the given
+        descriptors. The result can be read back with tarfile.
+        
+        Args:
+            nickname: User's nickname
+            out_fd: Writable file descriptor to export into
+            
+        Returns:
+            int: Number of bytes written
+        """
+        try:
+            user_dir = self._get_user_directory(nickname)
+            if not user_dir.exists():
+                raise StorageError(f"User '{nickname}' not found")
+            
+            written = 0
+            for root, dirs, files in os.walk(user_dir):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    if os.path.islink(path):
+                        continue
+                    with open(path, 'rb') as src:
+                        st = os.fstat(src.fileno())
+                        info = tarfile.TarInfo(Path(path).relative_to(user_dir).as_posix())
+                        info.size = st.st_size
+                        info.mtime = int(st.st_mtime)
+                        info.mode = 0o600
+                        written += self._write_all(out_fd, info.tobuf(format=tarfile.PAX_FORMAT))
+                        
+                        copied = self._copy_to_fd(src, out_fd, st.st_size)
+                        # A file that shrank mid-copy is zero-filled so later headers stay aligned
+                        padding = (st.st_size - copied) + (-st.st_size % tarfile.BLOCKSIZE)
+                        written += copied + self._write_all(out_fd, b"\0" * padding)
+            
+            # End-of-archive marker
+            written += self._write_all(out_fd, b"\0" * (2 * tarfile.BLOCKSIZE))
+            return written
+            
+        except StorageError:
+            raise
+        except Exception as e:
+            raise StorageError(f"Failed to export user: {e}")
+    
+    @staticmethod
+    def _write_all(out_fd: int, data: bytes) -> int:
+        """Write all of data to out_fd and return its length."""
+        view = memoryview(data)
+        while view:
+            view = view[os.write(out_fd, view):]
+        return len(data)
+    
+    @staticmethod
+    def _copy_to_fd(src, out_fd: int, size: int) -> int:
+        """Copy size bytes from an open binary file to out_fd, zero-copy when possible."""
+        offset = 0
+        if hasattr(os, "sendfile"):
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+                return offset
+            except OSError:
+                # Descriptor pair not supported; finish from where sendfile stopped
+                src.seek(offset)
+        
+        out = os.fdopen(out_fd, 'wb', closefd=False)
+        while offset < size:
+            chunk = src.read(min(size - offset, 1 << 20))
+            if not chunk:
+                break
+            out.write(chunk)
+            offset += len(chunk)
+        out.flush()
+        return offset
+    
     def _read_file_optimized(self, file_path: Path, encoding: str = 'utf-8') -> Optional[str]:
         """
         Optimized file reading with caching.
@@ -674,6 +1182,26 @@ class FileManager:
             return True
         except (OSError, shutil.Error):
             return False
+    
+    @staticmethod
+    def remove_tree(path: Path) -> None:
+        """
+        Recursively delete a directory tree, bottom-up.
+        
+        Uses os.scandir so entry types come from the directory listing
+        rather than a separate lstat per entry. Symlinks are unlinked, never
+        followed.
+        
+        Args:
+            path: Directory to delete
+        """
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    FileManager.remove_tree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
 
 
 class HistoryManager:
@@ -681,6 +1209,9 @@ class HistoryManager:
     Specialized manager for user interaction history operations.
     """
     
+    # Maximum cached queries kept per user
+    SEARCH_CACHE_SIZE = 64
+    
     def __init__(self, storage_manager: StorageManager):
         """
         Initialize with a storage manager instance.
@@ -689,6 +1220,11 @@ class HistoryManager:
             storage_manager: StorageManager instance
         """
         self.storage = storage_manager
+        
+        # Per-user search state, rebuilt whenever the user's profile is saved:
+        # nickname -> (profile revision, {id: Interaction}, history ids,
+        #              {query: matching ids}, {id: lowercased text})
+        self._search_state: Dict[str, tuple] = {}
     
     def get_recent_interactions(self, user: User, limit: int = 10) -> List[Interaction]:
         """
@@ -702,8 +1238,8 @@ class HistoryManager:
             List of recent Interaction objects
         """
         try:
-            all_interactions = self.storage.load_user_history(user)
-            return all_interactions[:limit]
+            # Stop decoding once the newest `limit` interactions are found
+            return list(islice(self.storage.iter_user_history(user), limit))
         except Exception as e:
             raise StorageError(f"Failed to get recent interactions: {e}")
     
@@ -711,6 +1247,9 @@ class HistoryManager:
         """
         Search interactions by content.
         
+        Matches are cached per query; a query extending a cached one only
+        rescans that query's matches.
+        
         Args:
             user: User object
             query: Search query string
@@ -719,29 +1258,99 @@ class HistoryManager:
             List of matching Interaction objects
         """
         try:
-            all_interactions = self.storage.load_user_history(user)
-            matching_interactions = []
+            _, by_id, history_ids, query_cache, lowered = self._load_search_state(user)
             
             query_lower = query.lower()
             
-            for interaction in all_interactions:
-                # Search in input content
-                if (interaction.input_data and 
-                    query_lower in interaction.input_data.content.lower()):
-                    matching_interactions.append(interaction)
-                    continue
-                
-                # Search in generated content
-                if interaction.generated_content:
-                    if (query_lower in interaction.generated_content.supportive_statement.lower() or
-                        query_lower in interaction.generated_content.poem.lower()):
-                        matching_interactions.append(interaction)
+            # Results for a prefix of this query are a superset of its results
+            candidate_ids = history_ids
+            best_prefix = None
+            for cached_query in query_cache:
+                if query_lower.startswith(cached_query) and (
+                        best_prefix is None or len(cached_query) > len(best_prefix)):
+                    best_prefix = cached_query
+            if best_prefix is not None:
+                candidate_ids = query_cache[best_prefix]
+            
+            matching_ids = [
+                interaction_id for interaction_id in candidate_ids
+                if query_lower in self._search_text(by_id[interaction_id], lowered)
+            ]
             
-            return matching_interactions
+            if len(query_cache) >= self.SEARCH_CACHE_SIZE:
+                query_cache.pop(next(iter(query_cache)))
+            query_cache[query_lower] = matching_ids
+            
+            return [by_id[interaction_id] for interaction_id in matching_ids]
             
         except Exception as e:
             raise StorageError(f"Failed to search interactions: {e}")
     
+    def search_any(self, user: User, needles: List[str]) -> List[Interaction]:
+        """
+        Search interactions matching any of several terms in one pass.
+        
+        The terms are compiled into a single alternation pattern, so each
+        interaction's text is scanned once however many terms are given.
+        
+        Args:
+            user: User object
+            needles: Search terms (case-insensitive)
+            
+        Returns:
+            List of Interaction objects matching at least one term
+        """
+        try:
+            terms = {needle.lower() for needle in needles if needle}
+            if not terms:
+                return []
+            
+            # Longest first so a term never shadows a longer one sharing its prefix
+            pattern = re.compile("|".join(map(re.escape, sorted(terms, key=len, reverse=True))))
+            _, by_id, _, _, lowered = self._load_search_state(user)
+            
+            return [
+                interaction for interaction in by_id.values()
+                if pattern.search(self._search_text(interaction, lowered))
+            ]
+            
+        except Exception as e:
+            raise StorageError(f"Failed to search interactions: {e}")
+    
+    def _load_search_state(self, user: User) -> tuple:
+        """
+        Get the user's search state, decoding the history only when the
+        profile has been saved since the state was built.
+        
+        Args:
+            user: User object
+            
+        Returns:
+            Tuple of (profile revision, {id: Interaction}, history ids, query cache, lowered texts)
+        """
+        revision = self.storage.get_profile_revision(user.nickname)
+        state = self._search_state.get(user.nickname)
+        if state is None or state[0] != revision:
+            by_id = {interaction.id: interaction for interaction in self.storage.iter_user_history(user)}
+            state = (revision, by_id, tuple(by_id), {}, {})
+            self._search_state[user.nickname] = state
+        return state
+    
+    @staticmethod
+    def _search_text(interaction: Interaction, lowered: Dict[str, str]) -> str:
+        """Return the cached lowercase searchable text of an interaction."""
+        text = lowered.get(interaction.id)
+        if text is None:
+            # Search in input content and generated content
+            parts = []
+            if interaction.input_data:
+                parts.append(interaction.input_data.content)
+            if interaction.generated_content:
+                parts.append(interaction.generated_content.supportive_statement)
+                parts.append(interaction.generated_content.poem)
+            text = lowered[interaction.id] = "\x00".join(parts).lower()
+        return text
+    
     def get_interaction_summary(self, user: User) -> Dict[str, Any]:
         """
         Get summary statistics for user's interaction history.
@@ -753,9 +1362,14 @@ class HistoryManager:
             Dictionary containing summary statistics
         """
         try:
-            interactions = self.storage.load_user_history(user)
-            
-            if not interactions:
+            # Column lists skip Interaction construction entirely, and the
+            # aggregates below run inside C builtins rather than a Python loop
+            cols = self.storage.load_user_history_columnar(user)
+            timestamps = cols["ts"]
+            contents = cols["content"]
+            total = len(timestamps)
+            
+            if not total:
                 return {
                     "total_interactions": 0,
                     "input_types": {},
@@ -763,28 +1377,18 @@ class HistoryManager:
                     "avg_content_length": 0
                 }
             
-            # Count input types
-            input_types = {}
-            total_content_length = 0
-            
-            for interaction in interactions:
-                if interaction.input_data:
-                    input_type = interaction.input_data.input_type.value
-                    input_types[input_type] = input_types.get(input_type, 0) + 1
-                    total_content_length += len(interaction.input_data.content)
-            
-            # Date range
-            timestamps = [i.timestamp for i in interactions]
-            date_range = {
-                "earliest": min(timestamps).isoformat(),
-                "latest": max(timestamps).isoformat()
-            }
+            # Only interactions with input content carry an input type
+            input_types = Counter(compress(cols["input_type"], contents))
+            total_content_length = sum(map(len, contents))
             
             return {
-                "total_interactions": len(interactions),
-                "input_types": input_types,
-                "date_range": date_range,
-                "avg_content_length": total_content_length // len(interactions) if interactions else 0
+                "total_interactions": total,
+                "input_types": dict(input_types),
+                "date_range": {
+                    "earliest": min(timestamps).isoformat(),
+                    "latest": max(timestamps).isoformat()
+                },
+                "avg_content_length": total_content_length // total
             }
             
         except Exception as e:
@@ -11,7 +11,9 @@ import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 import traceback
+from collections import defaultdict
 from datetime import datetime
+from types import MappingProxyType
 
 # Add the app directory to the Python path for imports
 app_dir = Path(__file__).parent
@@ -62,6 +64,16 @@ except ImportError as e:
     st.stop()
 
 
+# Mind map section labels per input type
+TYPE_ICONS = MappingProxyType({
+    'text': '📝 Text Conversations',
+    'audio': '🎤 Audio Messages',
+    'drawing': '🎨 Creative Drawings',
+    'unknown': '💭 Other Interactions'
+})
+UNKNOWN_ICON = '📋 {title}'
+
+
 class StreamlitApp:
     """Main Streamlit application class."""
     
@@ -1021,19 +1033,26 @@ class StreamlitApp:
         filtered_items = []
         
         for item in history_items:
-            # Search in multiple fields
-            searchable_text = ' '.join([
-                item.get('preview', ''),
-                item.get('supportive_statement', ''),
-                item.get('poem', ''),
-                item.get('input_type', '')
-            ]).lower()
+            # Use the haystack precomputed at load time when available
+            searchable_text = item.get('_search_blob')
+            if searchable_text is None:
+                searchable_text = self._build_search_blob(item)
             
             if query_lower in searchable_text:
                 filtered_items.append(item)
         
         return filtered_items
     
+    @staticmethod
+    def _build_search_blob(item):
+        """Build the lowercased text searched for a history item."""
+        return ' '.join([
+            item.get('preview', ''),
+            item.get('supportive_statement', ''),
+            item.get('poem', ''),
+            item.get('input_type', '')
+        ]).lower()
+    
     def render_history_item_optimized(self, item, index):
         """Optimized rendering of history items with lazy loading."""
         is_selected = (st.session_state.selected_interaction == item.get('id'))
@@ -1160,64 +1179,56 @@ class StreamlitApp:
     def render_text_mind_map(self, history_items):
         """Render a text-based mind map of interactions."""
         try:
-            # Group interactions by input type
-            type_groups = {}
+            # Group interactions by input type and track the date range in one pass
+            type_groups = defaultdict(list)
+            oldest_date = recent_date = None
             for item in history_items:
-                input_type = item.get('input_type', 'unknown')
-                if input_type not in type_groups:
-                    type_groups[input_type] = []
-                type_groups[input_type].append(item)
+                type_groups[item.get('input_type', 'unknown')].append(item)
+                timestamp = item.get('timestamp', '')
+                if oldest_date is None or timestamp < oldest_date:
+                    oldest_date = timestamp
+                if recent_date is None or timestamp > recent_date:
+                    recent_date = timestamp
             
             # Create mind map structure
-            mindmap_text = "**Your Interaction Journey:**\n\n"
-            
-            type_icons = {
-                'text': '📝 Text Conversations',
-                'audio': '🎤 Audio Messages', 
-                'drawing': '🎨 Creative Drawings',
-                'unknown': '💭 Other Interactions'
-            }
+            parts = ["**Your Interaction Journey:**\n\n"]
             
             for input_type, items in type_groups.items():
-                mindmap_text += f"**{type_icons.get(input_type, f'📋 {input_type.title()}')}** ({len(items)} interactions)\n"
+                label = TYPE_ICONS.get(input_type) or UNKNOWN_ICON.format(title=input_type.title())
+                parts.append(f"**{label}** ({len(items)} interactions)\n")
                 
                 # Show recent items in this category
                 recent_items = items[:3]  # Show up to 3 recent items per type
                 for item in recent_items:
-                    preview = item.get('preview', 'Untitled')[:30] + "..." if len(item.get('preview', '')) > 30 else item.get('preview', 'Untitled')
+                    p = item.get('preview') or 'Untitled'
+                    preview = (p[:30] + '...') if len(p) > 30 else p
                     timestamp = item.get('timestamp', 'Unknown')
-                    mindmap_text += f"  └─ *{preview}* ({timestamp})\n"
+                    parts.append(f"  └─ *{preview}* ({timestamp})\n")
                 
                 if len(items) > 3:
-                    mindmap_text += f"  └─ ... and {len(items) - 3} more\n"
+                    parts.append(f"  └─ ... and {len(items) - 3} more\n")
                 
-                mindmap_text += "\n"
+                parts.append("\n")
             
             # Display the mind map
-            st.markdown(mindmap_text)
+            st.markdown(''.join(parts))
             
             # Add summary statistics
             total_interactions = len(history_items)
             if total_interactions > 0:
-                # Calculate some basic stats
-                recent_date = max(item.get('timestamp', '') for item in history_items)
-                oldest_date = min(item.get('timestamp', '') for item in history_items)
-                
-                st.markdown("**📊 Summary:**")
-                st.markdown(f"- Total interactions: {total_interactions}")
-                st.markdown(f"- Most recent: {recent_date}")
-                st.markdown(f"- First interaction: {oldest_date}")
-                
-                # Show distribution by type
-                type_counts = {}
-                for item in history_items:
-                    input_type = item.get('input_type', 'unknown')
-                    type_counts[input_type] = type_counts.get(input_type, 0) + 1
-                
-                st.markdown("- Input type distribution:")
-                for input_type, count in type_counts.items():
+                summary = [
+                    "**📊 Summary:**",
+                    f"- Total interactions: {total_interactions}",
+                    f"- Most recent: {recent_date}",
+                    f"- First interaction: {oldest_date}",
+                    # Show distribution by type
+                    "- Input type distribution:"
+                ]
+                for input_type, items in type_groups.items():
+                    count = len(items)
                     percentage = (count / total_interactions) * 100
-                    st.markdown(f"  - {input_type.title()}: {count} ({percentage:.1f}%)")
+                    summary.append(f"  - {input_type.title()}: {count} ({percentage:.1f}%)")
+                st.markdown('\n'.join(summary))
                     
         except Exception as e:
             st.error(f"Error creating mind map: {str(e)}")
@@ -2327,6 +2338,7 @@ class StreamlitApp:
                                 'poem': item.get('poem', ''),
                                 'interaction_obj': item.get('interaction_obj')
                             }
+                            ui_item['_search_blob'] = self._build_search_blob(ui_item)
                             history_items.append(ui_item)
                     
                     return history_items
@@ -2368,6 +2380,7 @@ class StreamlitApp:
                     'poem': interaction.generated_content.poem if interaction.generated_content else '',
                     'interaction_obj': interaction  # Store full object for detailed view
                 }
+                history_item['_search_blob'] = self._build_search_blob(history_item)
                 history_items.append(history_item)
             
             return history_items